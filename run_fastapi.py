@@ -1,5 +1,10 @@
 import typer
 
+from src.infrastructure.fastapi_app.server_config import (
+    APP_IMPORT_PATH,
+    ServerConfig,
+    build_server_config,
+)
 from src.infrastructure.rich.fastapi_presenter import show_server_error, show_server_info
 
 app = typer.Typer(
@@ -10,17 +15,12 @@ app = typer.Typer(
 )
 
 
-def _serve(host: str, port: int, reload_enabled: bool) -> int:
+def _serve(config: ServerConfig) -> int:
     try:
         import uvicorn
 
-        show_server_info(host=host, port=port, reload_enabled=reload_enabled)
-        uvicorn.run(
-            "src.infrastructure.fastapi_app.app:app",
-            host=host,
-            port=port,
-            reload=reload_enabled,
-        )
+        show_server_info(config)
+        uvicorn.run(APP_IMPORT_PATH, **config.uvicorn_kwargs())
         return 0
     except Exception as exc:  # pragma: no cover
         show_server_error(str(exc))
@@ -30,7 +30,7 @@ def _serve(host: str, port: int, reload_enabled: bool) -> int:
 @app.callback(invoke_without_command=True)
 def root(ctx: typer.Context) -> None:
     if ctx.invoked_subcommand is None:
-        raise typer.Exit(code=_serve(host="127.0.0.1", port=8001, reload_enabled=False))
+        raise typer.Exit(code=_serve(build_server_config(host="127.0.0.1", port=8001)))
 
 
 @app.command("serve")
@@ -40,9 +40,43 @@ def serve(
     reload_enabled: bool = typer.Option(
         False, "--reload", help="Recarga automatica de desarrollo."
     ),
+    production: bool = typer.Option(
+        False,
+        "--production",
+        help="Varios workers, uvloop/httptools si estan instalados y keep-alive largo.",
+    ),
+    workers: int | None = typer.Option(
+        None, "--workers", min=1, help="Procesos worker (produccion: uno por core)."
+    ),
+    keep_alive: int | None = typer.Option(
+        None, "--keep-alive", min=1, help="Segundos de keep-alive HTTP."
+    ),
+    backlog: int | None = typer.Option(
+        None, "--backlog", min=1, help="Conexiones pendientes en el socket."
+    ),
+    limit_concurrency: int | None = typer.Option(
+        None,
+        "--limit-concurrency",
+        min=1,
+        help="Conexiones simultaneas por worker antes de responder 503.",
+    ),
 ) -> None:
     """Inicia el servidor FastAPI local."""
-    raise typer.Exit(code=_serve(host=host, port=port, reload_enabled=reload_enabled))
+    try:
+        config = build_server_config(
+            host=host,
+            port=port,
+            reload_enabled=reload_enabled,
+            production=production,
+            workers=workers,
+            timeout_keep_alive=keep_alive,
+            backlog=backlog,
+            limit_concurrency=limit_concurrency,
+        )
+    except ValueError as exc:
+        show_server_error(str(exc))
+        raise typer.Exit(code=1) from exc
+    raise typer.Exit(code=_serve(config))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.bench_support import build_contacts_page, build_message_page  # noqa: E402
+from src.infrastructure.fastapi_app.compression import (  # noqa: E402
+    ResponseCompressor,
+)
+from src.infrastructure.fastapi_app.responses import dumps_json  # noqa: E402
+
+LEVELS = {"gzip": (1, 5, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 9, 19)}
+
+
+def compress_once(encoding: str, level: int, body: bytes) -> tuple[int, float]:
+    compressor = ResponseCompressor(gzip_level=level, brotli_quality=level, zstd_level=level)
+    encoder = compressor.encoder(encoding)
+    started = time.perf_counter()
+    payload = encoder.compress(body) + encoder.finish()
+    return len(payload), time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bytes vs CPU por nivel de compresion.")
+    parser.add_argument("--contacts", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = {
+        f"contacts ({args.contacts})": dumps_json(build_contacts_page(args.contacts)),
+        f"messages ({args.messages})": dumps_json(build_message_page(messages=args.messages)),
+    }
+    available = ResponseCompressor().encodings
+    print(f"encodings disponibles: {', '.join(available)}")
+    for label, body in bodies.items():
+        print(f"{label}: {len(body) / 1024:.0f} KiB sin comprimir")
+        for encoding in available:
+            for level in LEVELS[encoding]:
+                results = [compress_once(encoding, level, body) for _ in range(args.runs)]
+                size = results[0][0]
+                seconds = min(elapsed for _, elapsed in results)
+                print(
+                    f"  {encoding:<4} nivel {level:>2}: {size / 1024:7.0f} KiB "
+                    f"ratio {len(body) / size:5.1f}x  {seconds * 1000:7.2f} ms"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.bench_support import build_contacts_page  # noqa: E402
+from src.infrastructure.fastapi_app import app as app_module  # noqa: E402
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (  # noqa: E402
+    PAGE_SIZE,
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.settings.env_settings import ChatwootSettings  # noqa: E402
+
+
+class _FakeResponse:
+    def __init__(self, payload: object) -> None:
+        self.status_code = 200
+        self._payload = payload
+        self.text = ""
+        self.headers = {"content-type": "application/json"}
+
+    def json(self) -> object:
+        return self._payload
+
+
+class _SlowContactsTransport:
+    """Chatwoot stand-in: every contacts page takes `latency` seconds."""
+
+    def __init__(self, contacts: int, latency: float) -> None:
+        self._contacts = contacts
+        self._latency = latency
+
+    async def get(self, url, *, headers, params, timeout, verify) -> _FakeResponse:
+        _ = (url, headers, timeout, verify)
+        await asyncio.sleep(self._latency)
+        page = int(params["page"])
+        start = (page - 1) * PAGE_SIZE
+        size = max(0, min(PAGE_SIZE, self._contacts - start))
+        # A fresh page object per call, as if it had just been decoded.
+        page_payload = build_contacts_page(size)["payload"]
+        for offset, contact in enumerate(page_payload):
+            contact["id"] = start + offset
+        return _FakeResponse({"payload": page_payload, "meta": {"count": self._contacts}})
+
+
+def _settings() -> ChatwootSettings:
+    return ChatwootSettings(
+        base_url="https://chatwoot.example.com",
+        account_id=7,
+        api_access_token="token",
+        proxy_api_key="bench",
+        timeout_seconds=9.0,
+        tls_verify=True,
+    )
+
+
+async def measure(path: str, headers: dict[str, str]) -> tuple[float, float, int, float]:
+    """Time to first body byte, total time, bytes sent and peak traced MiB.
+
+    The ASGI app is driven directly: httpx's ASGITransport buffers the whole
+    body, which would hide when the first chunk was actually sent.
+    """
+    url_path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url_path,
+        "raw_path": url_path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    first_byte: float | None = None
+    sent = 0
+    requested = False
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict[str, object]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, object]) -> None:
+        nonlocal first_byte, sent
+        if message["type"] == "http.response.body" and message.get("body"):
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+            sent += len(message["body"])
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    await app_module.app(scope, receive, send)
+    disconnected.set()
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_byte or total, total, sent, peak / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="contacts?page=all: JSON completo vs NDJSON.")
+    parser.add_argument("--contacts", type=int, default=6000)
+    parser.add_argument("--latency", type=float, default=0.02, help="Segundos por pagina.")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    app_module._settings = _settings()
+    app_module._proxy_client = ChatwootFastApiProxyClient(
+        settings=app_module._settings,
+        transport=_SlowContactsTransport(args.contacts, args.latency),
+        max_page_concurrency=args.concurrency,
+    )
+    base = "/api/v1/accounts/7/contacts?page=all"
+    cases = {
+        "json": (base, {"X-Proxy-Api-Key": "bench"}),
+        "ndjson": (base, {"X-Proxy-Api-Key": "bench", "Accept": "application/x-ndjson"}),
+    }
+    print(f"contactos: {args.contacts} | paginas: {-(-args.contacts // PAGE_SIZE)}")
+    for name, (url, headers) in cases.items():
+        ttfb, total, size, peak = asyncio.run(measure(url, headers))
+        print(
+            f"{name:<7} ttfb={ttfb * 1000:8.1f} ms total={total * 1000:8.1f} ms "
+            f"bytes={size / 1024:8.0f} KiB peak={peak:6.1f} MiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
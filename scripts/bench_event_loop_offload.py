@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.bench_support import build_message_page  # noqa: E402
+from src.infrastructure.fastapi_app.event_loop_monitor import percentile  # noqa: E402
+from src.infrastructure.requests.cpu_offload import CpuOffloader  # noqa: E402
+from src.infrastructure.requests.sanitization_plans import MESSAGE_PLAN  # noqa: E402
+
+
+async def small_request_latencies(stop: asyncio.Event, interval: float) -> list[float]:
+    """Latency of a trivial request: how long a 1 ms sleep really takes."""
+    loop = asyncio.get_running_loop()
+    latencies: list[float] = []
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(interval)
+        latencies.append(loop.time() - started - interval)
+    return latencies
+
+
+async def run_scenario(body: bytes, threshold: int, big_pages: int) -> list[float]:
+    offloader = CpuOffloader(threshold_bytes=threshold)
+
+    def decode() -> object:
+        payload = json.loads(body)
+        return [MESSAGE_PLAN.apply_in_place(item) for item in payload["payload"]]
+
+    stop = asyncio.Event()
+    probe = asyncio.create_task(small_request_latencies(stop, interval=0.001))
+    for _ in range(big_pages):
+        await offloader.run(len(body), decode, label="messages")
+        await asyncio.sleep(0)
+    stop.set()
+    return await probe
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Latencia de requests chicos mientras se decodifican paginas grandes."
+    )
+    parser.add_argument("--messages", type=int, default=2000, help="Mensajes por pagina grande.")
+    parser.add_argument("--pages", type=int, default=10, help="Paginas grandes a decodificar.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    # Inline runs are expected to trip the slow-decode warning on every page.
+    logging.getLogger("src.infrastructure.requests.cpu_offload").setLevel(logging.ERROR)
+    body = json.dumps(build_message_page(args.messages)).encode("utf-8")
+    print(f"pagina grande: {len(body) / 1024:.0f} KiB")
+    for name, threshold in (("inline", 0), ("offload", 1)):
+        started = time.perf_counter()
+        latencies = asyncio.run(run_scenario(body, threshold, args.pages))
+        elapsed = time.perf_counter() - started
+        p50 = (percentile(latencies, 0.50) or 0.0) * 1000
+        p99 = (percentile(latencies, 0.99) or 0.0) * 1000
+        worst = max(latencies, default=0.0) * 1000
+        print(
+            f"{name:<8} small p50={p50:7.2f} ms p99={p99:7.2f} ms max={worst:7.2f} ms "
+            f"total={elapsed:.2f} s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.bench_support import (  # noqa: E402
+    best_of,
+    build_contacts_page,
+    build_message_page,
+)
+from src.infrastructure.fastapi_app.responses import (  # noqa: E402
+    FastJSONResponse,
+    orjson,
+)
+
+
+def legacy_render(payload: Any) -> bytes:
+    """What FastAPI does for a route returning a dict: encode, then render."""
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def fast_render(payload: Any) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de respuestas JSON grandes.")
+    parser.add_argument("--contacts", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"orjson: {'si' if orjson is not None else 'no (fallback json)'}")
+    cases = {
+        f"contacts page=all ({args.contacts})": build_contacts_page(args.contacts),
+        f"messages ({args.messages})": build_message_page(messages=args.messages),
+    }
+    for label, payload in cases.items():
+        legacy = best_of(lambda: legacy_render(payload), args.runs) / args.runs
+        fast = best_of(lambda: fast_render(payload), args.runs) / args.runs
+        size_kib = len(fast_render(payload)) / 1024
+        print(
+            f"{label}: {size_kib:.0f} KiB | jsonable_encoder+JSONResponse "
+            f"{legacy * 1000:.2f} ms | FastJSONResponse {fast * 1000:.2f} ms "
+            f"| x{legacy / fast:.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
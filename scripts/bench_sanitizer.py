@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.infrastructure.requests.sanitization_plans import MESSAGE_PLAN  # noqa: E402
+from src.infrastructure.requests.sensitive_data_sanitizer import (  # noqa: E402
+    CONVERSATION_POLICY,
+    sanitize_conversation_payload,
+    sanitize_conversation_payload_in_place,
+    sanitize_conversation_payload_shared,
+)
+from scripts.bench_support import (  # noqa: E402
+    best_of,
+    build_deep_payload,
+    build_message_page,
+    build_wide_payload,
+    legacy_sanitize_conversation_payload,
+    recursive_sanitize,
+)
+
+
+def load_page(path: str | None, messages: int) -> dict[str, Any]:
+    if path is None:
+        return build_message_page(messages)
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def report(name: str, seconds: float, runs: int, messages: int) -> None:
+    per_page_ms = seconds / runs * 1000
+    throughput = runs * messages / seconds
+    print(f"{name:<28} {per_page_ms:8.3f} ms/page {throughput:12.0f} messages/s")
+
+
+def peak_allocation_kib(sanitizer: Any, page: dict[str, Any]) -> float:
+    # In-place mode rewrites its input, so every measurement gets a fresh copy.
+    target = copy.deepcopy(page)
+    tracemalloc.start()
+    sanitizer(target)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Microbenchmark de sanitizacion sobre paginas de mensajes."
+    )
+    parser.add_argument(
+        "--page",
+        default=None,
+        help="JSON real de /conversations/{id}/messages (por defecto: pagina sintetica).",
+    )
+    parser.add_argument("--messages", type=int, default=20, help="Mensajes por pagina sintetica.")
+    parser.add_argument("--runs", type=int, default=500, help="Repeticiones por variante.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    page = load_page(args.page, args.messages)
+    messages = len(page.get("payload", [])) or 1
+
+    if legacy_sanitize_conversation_payload(page) != sanitize_conversation_payload(page):
+        print("ERROR: la politica compilada difiere de la implementacion legacy.")
+        return 1
+
+    legacy = best_of(lambda: legacy_sanitize_conversation_payload(page), args.runs)
+    compiled = best_of(lambda: sanitize_conversation_payload(page), args.runs)
+    shared = best_of(lambda: sanitize_conversation_payload_shared(page), args.runs)
+    report("legacy (recursive, re.*)", legacy, args.runs, messages)
+    report("compiled policy", compiled, args.runs, messages)
+    report("compiled copy-on-write", shared, args.runs, messages)
+    print(f"speedup: {legacy / compiled:.2f}x (copy-on-write {legacy / shared:.2f}x)")
+
+    policy = CONVERSATION_POLICY
+    # In-place variants rewrite their input: time them over fresh copies.
+    owned_pages = [copy.deepcopy(page) for _ in range(args.runs * 5)]
+    generic_pages = iter(owned_pages)
+    generic_in_place = best_of(
+        lambda: [policy.sanitize_in_place(item) for item in next(generic_pages)["payload"]],
+        args.runs,
+    )
+    owned_pages = [copy.deepcopy(page) for _ in range(args.runs * 5)]
+    plan_pages = iter(owned_pages)
+    plan_in_place = best_of(
+        lambda: [MESSAGE_PLAN.apply_in_place(item) for item in next(plan_pages)["payload"]],
+        args.runs,
+    )
+    del owned_pages
+    report("generic in place", generic_in_place, args.runs, messages)
+    report("message plan in place", plan_in_place, args.runs, messages)
+    fastapi_path = best_of(
+        lambda: json.dumps(
+            jsonable_encoder(sanitize_conversation_payload(page)),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8"),
+        args.runs,
+    )
+    report("sanitize + jsonable_encoder", fastapi_path, args.runs, messages)
+    wide = build_wide_payload()
+    recursive_wide = best_of(lambda: recursive_sanitize(policy, wide), args.runs // 5 or 1)
+    iterative_wide = best_of(lambda: policy.sanitize(wide), args.runs // 5 or 1)
+    recursive_page = best_of(lambda: recursive_sanitize(policy, page), args.runs)
+    print(
+        f"iterative vs recursive: page {recursive_page / compiled:.2f}x, "
+        f"wide payload {recursive_wide / iterative_wide:.2f}x"
+    )
+    deep = build_deep_payload(depth=sys.getrecursionlimit() + 100)
+    try:
+        recursive_sanitize(policy, deep)
+        print("deep payload: recursive ok")
+    except RecursionError:
+        print("deep payload: recursive raised RecursionError")
+    policy.sanitize(deep)
+    print(f"deep payload: iterative ok (guard_trips={policy.guard_trips})")
+
+    print("peak memory per page:")
+    for name, sanitizer in (
+        ("legacy", legacy_sanitize_conversation_payload),
+        ("full copy", sanitize_conversation_payload),
+        ("copy-on-write", sanitize_conversation_payload_shared),
+        ("in place", sanitize_conversation_payload_in_place),
+    ):
+        print(f"  {name:<14} {peak_allocation_kib(sanitizer, page):8.1f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
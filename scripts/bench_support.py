@@ -0,0 +1,193 @@
+"""Payload builders, reference sanitizers and timing helpers for the benchmarks.
+
+The tests reuse the builders and reference walks, so both measure the same
+payloads.
+"""
+
+from __future__ import annotations
+
+import re
+import timeit
+from typing import Any
+
+from src.infrastructure.requests.sensitive_data_sanitizer import (
+    CONVERSATION_SENSITIVE_KEYS,
+    SENSITIVE_KEY_PARTS,
+    SENSITIVE_KEYS,
+    SanitizationPolicy,
+)
+
+
+def build_message_page(messages: int = 20) -> dict[str, Any]:
+    """Synthetic page shaped like Chatwoot's /conversations/{id}/messages."""
+    payload = []
+    for index in range(messages):
+        payload.append(
+            {
+                "id": 90000 + index,
+                "content": (
+                    f"Hola, soy cliente {index}. Mi numero es +54911{66660000 + index} "
+                    "y quiero saber el estado del pedido."
+                ),
+                "inbox_id": 2,
+                "conversation_id": 321,
+                "message_type": index % 2,
+                "content_type": "text",
+                "status": "sent",
+                "content_attributes": {"in_reply_to": None},
+                "created_at": 1710000000 + index,
+                "private": False,
+                "source_id": f"wamid.HBgNNTQ5MTE2NjY2Nzc3NxUCABIYIDNBM0{index:04d}",
+                "sender_type": "Contact" if index % 2 == 0 else "User",
+                "sender_id": 1000 + index,
+                "external_source_ids": {},
+                "additional_attributes": {"campaign": "organic"},
+                "processed_message_content": "Hola",
+                "sentiment": {},
+                "conversation": {
+                    "assignee_id": 3,
+                    "unread_count": 0,
+                    "last_activity_at": 1710000000,
+                    "contact_inbox": {"source_id": "5491166667777"},
+                },
+                "attachments": [
+                    {
+                        "id": 5000 + index,
+                        "file_type": "image",
+                        "data_url": "https://chatwoot.example.com/rails/active_storage/abc.jpg",
+                        "thumb_url": "https://chatwoot.example.com/rails/active_storage/abc_thumb.jpg",
+                    }
+                ],
+                "sender": {
+                    "id": 1000 + index,
+                    "name": f"Cliente {index}",
+                    "email": f"cliente{index}@example.com",
+                    "phone_number": f"+54911{66660000 + index}",
+                    "identifier": None,
+                    "thumbnail": "",
+                    "custom_attributes": {
+                        "es_cliente": True,
+                        "xubio_customer_id": f"{123456789 + index}",
+                    },
+                    "additional_attributes": {"city": "Buenos Aires"},
+                    "type": "contact",
+                },
+            }
+        )
+    return {"meta": {"labels": [], "additional_attributes": {}, "contact": {}}, "payload": payload}
+
+
+def build_contacts_page(contacts: int = 5000) -> dict[str, Any]:
+    """Synthetic contacts page=all response (every upstream page merged)."""
+    payload = []
+    for index in range(contacts):
+        payload.append(
+            {
+                "id": 1000 + index,
+                "name": f"Cliente {index}",
+                "available_name": f"Cliente {index}",
+                "email": f"cl**********{index}@example.com",
+                "phone_number": f"+54911******{index % 10000:04d}",
+                "identifier": None,
+                "thumbnail": "",
+                "availability_status": "offline",
+                "blocked": False,
+                "last_activity_at": 1710000000 + index,
+                "created_at": 1700000000 + index,
+                "additional_attributes": {"city": "Buenos Aires", "country_code": "AR"},
+                "custom_attributes": {"origen": "whatsapp", "segmento": index % 5},
+            }
+        )
+    return {"payload": payload, "meta": {"count": contacts, "pages": contacts // 15 + 1}}
+
+
+def legacy_sanitize_conversation_payload(value: Any, key: str | None = None) -> Any:
+    """Pre-policy implementation kept only as a baseline."""
+    if isinstance(value, dict):
+        return {k: legacy_sanitize_conversation_payload(v, key=k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [legacy_sanitize_conversation_payload(item, key=key) for item in value]
+    if isinstance(value, str):
+        normalized_key = key.lower() if isinstance(key, str) else ""
+        is_sensitive_key = normalized_key in CONVERSATION_SENSITIVE_KEYS
+        is_sensitive_secret = normalized_key in SENSITIVE_KEYS or any(
+            part in normalized_key for part in SENSITIVE_KEY_PARTS
+        )
+        if is_sensitive_key or is_sensitive_secret:
+            if not value:
+                return value
+            if len(value) <= 4:
+                return "*" * len(value)
+            return f"{value[:2]}...{value[-2:]}"
+
+        def _truncate(text: str) -> str:
+            return text if len(text) <= 10 else f"{text[:4]}...{text[-4:]}"
+
+        masked = re.sub(r"\d{8,}", lambda m: _truncate(m.group(0)), value)
+        return re.sub(
+            r"(websiteToken:\s*['\"])([^'\"]+)(['\"])",
+            lambda m: f"{m.group(1)}{_truncate(m.group(2))}{m.group(3)}",
+            masked,
+        )
+    return value
+
+
+def recursive_sanitize(policy: SanitizationPolicy, value: Any, key: Any = None) -> Any:
+    """Recursive full-copy walk, the reference for the iterative policy."""
+    if isinstance(value, dict):
+        return {k: recursive_sanitize(policy, v, key=k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [recursive_sanitize(policy, item, key=key) for item in value]
+    if isinstance(value, str):
+        return policy.sanitize_text(value, key)
+    return value
+
+
+def recursive_sanitize_shared(policy: SanitizationPolicy, value: Any, key: Any = None) -> Any:
+    """Recursive copy-on-write walk, the reference for `sanitize_shared`."""
+    if isinstance(value, dict):
+        changed: dict[Any, Any] | None = None
+        for item_key, item in value.items():
+            sanitized = recursive_sanitize_shared(policy, item, key=item_key)
+            if sanitized is not item:
+                if changed is None:
+                    changed = {}
+                changed[item_key] = sanitized
+        if changed is None:
+            return value
+        result = dict(value)
+        result.update(changed)
+        return result
+    if isinstance(value, list):
+        copied: list[Any] | None = None
+        for index, item in enumerate(value):
+            sanitized = recursive_sanitize_shared(policy, item, key=key)
+            if sanitized is not item:
+                if copied is None:
+                    copied = list(value)
+                copied[index] = sanitized
+        return value if copied is None else copied
+    if isinstance(value, str):
+        return policy.sanitize_text(value, key)
+    return value
+
+
+def build_wide_payload(width: int = 2000) -> dict[str, Any]:
+    """Flat custom_attributes with many scalar leaves."""
+    return {
+        "custom_attributes": {f"campo_{index}": f"valor {index}" for index in range(width)},
+        "labels": [f"etiqueta-{index}" for index in range(width)],
+    }
+
+
+def build_deep_payload(depth: int) -> dict[str, Any]:
+    """Pathological additional_attributes nesting."""
+    payload: dict[str, Any] = {"phone_number": "+5491166667777"}
+    for _ in range(depth):
+        payload = {"additional_attributes": payload}
+    return payload
+
+
+def best_of(fn: Any, runs: int, repeat: int = 5) -> float:
+    """Fastest of `repeat` timings of `runs` calls, in seconds."""
+    return min(timeit.repeat(fn, number=runs, repeat=repeat))
@@ -0,0 +1,258 @@
+"""
+Path: src/infrastructure/fastapi_app/admission.py
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import math
+from typing import Any
+from urllib.parse import parse_qs
+
+from src.infrastructure.fastapi_app.responses import dumps_json
+
+logger = logging.getLogger(__name__)
+
+FANOUT = "fanout"
+LOOKUP = "lookup"
+ROUTE_CLASSES = (FANOUT, LOOKUP)
+
+DEFAULT_MAX_IN_FLIGHT = 64
+DEFAULT_MAX_FANOUT = 4
+DEFAULT_MAX_LOOKUP = 0
+DEFAULT_QUEUE_TIMEOUT_SECONDS = 2.0
+DEFAULT_MAX_QUEUE = 32
+
+_PROXY_PATH_PREFIX = "/api/"
+_BATCH_PATH_SUFFIX = "/conversations/batch"
+# /api/v1/accounts/{account_id}/contacts/{id}
+_CONTACT_DETAIL_SEGMENTS = 6
+
+
+def classify_request(scope: dict[str, Any]) -> str | None:
+    """Route class of a proxy request; None for local endpoints.
+
+    `page=all`, the conversations batch and the contact detail (Chatwoot has
+    no lookup by id, so it walks the contact pages) fan out into several
+    Chatwoot calls and hold their slot for the whole walk; everything else
+    is one lookup.
+    """
+    path = scope.get("path", "")
+    if not path.startswith(_PROXY_PATH_PREFIX):
+        return None
+    if scope.get("method") == "POST" and path.rstrip("/").endswith(_BATCH_PATH_SUFFIX):
+        return FANOUT
+    if _is_contact_detail(path):
+        return FANOUT
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    if any(page.strip().lower() == "all" for page in query.get("page", [])):
+        return FANOUT
+    return LOOKUP
+
+
+def _is_contact_detail(path: str) -> bool:
+    segments = path.strip("/").split("/")
+    return len(segments) == _CONTACT_DETAIL_SEGMENTS and segments[-2] == "contacts"
+
+
+class _Gate:
+    """Counting slot limit with a FIFO of bounded waits; limit <= 0 is unlimited."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def available(self) -> bool:
+        return self.limit <= 0 or (self.in_flight < self.limit and not self._waiters)
+
+    async def acquire(self, timeout_seconds: float, max_queue: int) -> bool:
+        if self.available:
+            self.in_flight += 1
+            return True
+        if timeout_seconds <= 0 or len(self._waiters) >= max_queue:
+            return False
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout_seconds)
+        except asyncio.TimeoutError:
+            # release() may hand the slot over in the same tick the timeout
+            # fires; the slot is already counted, so the caller owns it.
+            return waiter.done() and not waiter.cancelled()
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the caller left.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot straight to the oldest waiter so a newcomer
+                # cannot overtake the queue.
+                self.in_flight += 1
+                waiter.set_result(None)
+                return
+
+
+@dataclass
+class RouteClassAdmissionStats:
+    admitted: int = 0
+    queued: int = 0
+    shed: int = 0
+    wait_seconds_total: float = 0.0
+
+
+class AdmissionController:
+    """Caps in-flight proxy requests overall and per route class.
+
+    A request over its limit waits in a FIFO for at most
+    `queue_timeout_seconds`; when the queue is full or the wait expires it is
+    shed with `503` and `Retry-After`. Keeping fan-out requests under their
+    own, smaller limit leaves the rest of the total for cheap lookups.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_fanout: int = DEFAULT_MAX_FANOUT,
+        max_lookup: int = DEFAULT_MAX_LOOKUP,
+        queue_timeout_seconds: float = DEFAULT_QUEUE_TIMEOUT_SECONDS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        self.queue_timeout_seconds = max(0.0, queue_timeout_seconds)
+        self.max_queue = max(0, max_queue)
+        self._total = _Gate(max_in_flight)
+        self._classes = {FANOUT: _Gate(max_fanout), LOOKUP: _Gate(max_lookup)}
+        self._stats = {route_class: RouteClassAdmissionStats() for route_class in ROUTE_CLASSES}
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.queue_timeout_seconds))
+
+    async def acquire(self, route_class: str) -> bool:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.queue_timeout_seconds
+        stats = self._stats[route_class]
+        gate = self._classes[route_class]
+        immediate = gate.available and self._total.available
+        admitted = await gate.acquire(self.queue_timeout_seconds, self.max_queue)
+        if admitted:
+            try:
+                admitted = await self._total.acquire(deadline - loop.time(), self.max_queue)
+            except asyncio.CancelledError:
+                gate.release()
+                raise
+            if not admitted:
+                gate.release()
+        if not admitted:
+            stats.shed += 1
+            return False
+        stats.admitted += 1
+        if not immediate:
+            stats.queued += 1
+            stats.wait_seconds_total += loop.time() - started
+        return True
+
+    def release(self, route_class: str) -> None:
+        self._total.release()
+        self._classes[route_class].release()
+
+    def stats(self) -> dict[str, RouteClassAdmissionStats]:
+        return dict(self._stats)
+
+    def in_flight(self, route_class: str | None = None) -> int:
+        gate = self._total if route_class is None else self._classes[route_class]
+        return gate.in_flight
+
+    def waiting(self, route_class: str) -> int:
+        return self._classes[route_class].queued
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "max_in_flight": self._total.limit,
+            "in_flight": self._total.in_flight,
+            "queue_timeout_seconds": self.queue_timeout_seconds,
+            "classes": {
+                route_class: {
+                    "limit": self._classes[route_class].limit,
+                    "in_flight": self._classes[route_class].in_flight,
+                    "waiting": self._classes[route_class].queued,
+                    "admitted": stats.admitted,
+                    "queued": stats.queued,
+                    "shed": stats.shed,
+                    "wait_ms_total": round(stats.wait_seconds_total * 1000, 3),
+                }
+                for route_class, stats in self._stats.items()
+            },
+        }
+
+
+class AdmissionMiddleware:
+    """Holds an admission slot from routing until the last body chunk is sent.
+
+    Requests `is_authorized` rejects skip admission: the route answers them
+    with `401` right away, so unauthenticated traffic can neither take nor
+    wait for the slots of real clients.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        admission_provider: Callable[[], AdmissionController],
+        is_authorized: Callable[[dict[str, Any]], bool] = lambda scope: True,
+    ) -> None:
+        self.app = app
+        self._admission_provider = admission_provider
+        self._is_authorized = is_authorized
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        route_class = classify_request(scope) if scope["type"] == "http" else None
+        if route_class is None or not self._is_authorized(scope):
+            await self.app(scope, receive, send)
+            return
+        admission = self._admission_provider()
+        if not await admission.acquire(route_class):
+            logger.warning(
+                "admission_shed route_class=%s path=%s in_flight=%s",
+                route_class,
+                scope.get("path"),
+                admission.in_flight(),
+            )
+            await _send_overloaded(send, admission.retry_after_seconds)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission.release(route_class)
+
+
+async def _send_overloaded(send: Any, retry_after_seconds: int) -> None:
+    body = dumps_json({"detail": "Proxy saturado, reintenta mas tarde."})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(retry_after_seconds).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -2,57 +2,165 @@
 Path: src/infrastructure/fastapi_app/app.py
 """
 
+import asyncio
 from contextlib import asynccontextmanager
-import hmac
 import logging
 from typing import Any
 
 import httpx
-from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi import Body, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.param_functions import Depends
 from fastapi.responses import HTMLResponse
+from starlette.datastructures import Headers
 
-from src.interface_adapter.controllers.fastapi_proxy_controllers import (
-    GetConversationByIdController,
-    GetConversationMessagesController,
-    GetContactByIdController,
-    GetContactsController,
-    GetConversationsController,
-    GetInboxByIdController,
-    GetInboxesController,
+from src.infrastructure.fastapi_app.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    classify_request,
 )
+from src.infrastructure.fastapi_app.cache_warmup import WarmupProgress, start_cache_warmup
+from src.infrastructure.fastapi_app.compression import (
+    CompressionMiddleware,
+    ResponseCompressor,
+)
+from src.infrastructure.fastapi_app.controller_registry import ProxyControllers
+from src.infrastructure.fastapi_app.event_loop_monitor import EventLoopLagMonitor
+from src.infrastructure.fastapi_app.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsMiddleware,
+    RequestMetrics,
+    render_metrics,
+)
+from src.infrastructure.fastapi_app.rate_limit import (
+    ApiKeyRateLimiter,
+    ClientQuota,
+    build_client_quotas,
+    identify_api_client,
+)
+from src.infrastructure.fastapi_app.readiness import OPERATIONAL, UpstreamProbe
+from src.infrastructure.fastapi_app.responses import (
+    NDJSON_MEDIA_TYPE,
+    FastJSONResponse,
+    NDJSONStreamingResponse,
+)
+from src.infrastructure.fastapi_app.route_index import (
+    RouteIndex,
+    build_route_index,
+    etag_matches,
+)
+from src.infrastructure.fastapi_app.server_timing import ServerTimingMiddleware
 from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
     ChatwootFastApiProxyClient,
 )
 from src.infrastructure.requests.http_transport import HttpxAsyncTransport
-from src.infrastructure.settings.env_settings import ChatwootSettings, load_chatwoot_settings
+from src.infrastructure.requests.response_cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+from src.infrastructure.settings.env_settings import (
+    ChatwootSettings,
+    ProxyTuningSettings,
+    load_chatwoot_settings,
+    load_proxy_tuning_settings,
+)
+from src.infrastructure.sqlite.shared_cache_backend import SqliteCacheBackend
+from src.interface_adapter.presenters.pre_serialized_json import PreSerializedJson
 from src.use_case.errors import ProxyGatewayError
 
 logger = logging.getLogger(__name__)
 
 _settings: ChatwootSettings | None = None
 _proxy_client: ChatwootFastApiProxyClient | None = None
+_controllers: ProxyControllers | None = None
+_route_index: RouteIndex | None = None
 _async_http_client: httpx.AsyncClient | None = None
+_response_cache: ResponseCache | None = None
+_warmup_progress = WarmupProgress()
+_warmup_task: asyncio.Task[None] | None = None
+_loop_monitor = EventLoopLagMonitor(interval_seconds=0)
+_compressor = ResponseCompressor()
+_request_metrics = RequestMetrics()
+_server_timing_sample_rate = 1.0
+_admission = AdmissionController()
+_rate_limiter = ApiKeyRateLimiter(enabled=False)
+_upstream_probe = UpstreamProbe(lambda: _probe_upstream(), interval_seconds=0)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
-    global _settings, _proxy_client, _async_http_client
+    global _settings, _proxy_client, _async_http_client, _response_cache
+    global _warmup_progress, _warmup_task, _loop_monitor, _compressor, _upstream_probe
+    global _controllers, _route_index, _server_timing_sample_rate, _admission, _rate_limiter
 
+    _route_index = build_route_index(_app.routes)
     try:
         _settings = load_chatwoot_settings()
+        tuning = load_proxy_tuning_settings()
         _async_http_client = httpx.AsyncClient(
             timeout=_settings.timeout_seconds,
             verify=_settings.tls_verify,
         )
+        _response_cache = ResponseCache(
+            fresh_ttl_seconds=tuning.cache_fresh_ttl_seconds,
+            stale_ttl_seconds=tuning.cache_stale_ttl_seconds,
+            backend=_build_cache_backend(tuning),
+        )
         _proxy_client = ChatwootFastApiProxyClient(
             _settings,
             transport=HttpxAsyncTransport(client=_async_http_client),
+            cache=_response_cache,
+            max_page_concurrency=tuning.pagination_max_concurrency,
+            max_batch_concurrency=tuning.batch_max_concurrency,
+            offload_threshold_bytes=tuning.offload_threshold_bytes,
+        )
+        _controllers = ProxyControllers.build(_proxy_client)
+        _loop_monitor = EventLoopLagMonitor(interval_seconds=tuning.loop_lag_interval_seconds)
+        _server_timing_sample_rate = tuning.server_timing_sample_rate
+        _admission = AdmissionController(
+            max_in_flight=tuning.admission_max_in_flight,
+            max_fanout=tuning.admission_max_fanout,
+            max_lookup=tuning.admission_max_lookup,
+            queue_timeout_seconds=tuning.admission_queue_timeout_seconds,
+            max_queue=tuning.admission_max_queue,
+        )
+        _rate_limiter = ApiKeyRateLimiter(
+            enabled=tuning.rate_limit_enabled,
+            default_quota=ClientQuota(
+                lookup_per_minute=tuning.rate_limit_lookup_per_minute,
+                fanout_per_minute=tuning.rate_limit_fanout_per_minute,
+            ),
+            quotas=build_client_quotas(tuning.rate_limit_quotas),
+        )
+        _compressor = ResponseCompressor(
+            enabled=tuning.compression_enabled,
+            min_size_bytes=tuning.compression_min_bytes,
+            gzip_level=tuning.compression_gzip_level,
+            brotli_quality=tuning.compression_brotli_quality,
+            zstd_level=tuning.compression_zstd_level,
+        )
+        _upstream_probe = UpstreamProbe(
+            _probe_upstream,
+            interval_seconds=tuning.ready_probe_interval_seconds,
+            window=tuning.ready_probe_window,
+            max_error_rate=tuning.ready_max_error_rate,
+            max_latency_p95_ms=tuning.ready_max_latency_p95_ms,
+        )
+        _loop_monitor.start()
+        _upstream_probe.start()
+        _warmup_progress = WarmupProgress()
+        _warmup_task = start_cache_warmup(
+            _proxy_client,
+            account_id=_settings.account_id,
+            tuning=tuning,
+            progress=_warmup_progress,
         )
     except Exception:
         logger.exception("fastapi_lifespan_init_failed")
         _settings = None
         _proxy_client = None
+        _controllers = None
+        _response_cache = None
         if _async_http_client is not None:
             await _async_http_client.aclose()
             _async_http_client = None
@@ -60,12 +168,49 @@ async def lifespan(_app: FastAPI):
     try:
         yield
     finally:
+        await _loop_monitor.aclose()
+        await _upstream_probe.aclose()
+        if _warmup_task is not None:
+            _warmup_task.cancel()
+            await asyncio.gather(_warmup_task, return_exceptions=True)
+            _warmup_task = None
+        if _response_cache is not None:
+            await _response_cache.aclose()
+            _response_cache = None
         if _async_http_client is not None:
             await _async_http_client.aclose()
             _async_http_client = None
 
 
-app = FastAPI(title="Chatwoot API Interface", version="2.1.0", lifespan=lifespan)
+async def _probe_upstream() -> None:
+    await _require_proxy_client().probe_upstream()
+
+
+def _build_cache_backend(tuning: ProxyTuningSettings) -> CacheBackend:
+    if tuning.cache_backend == "sqlite":
+        return SqliteCacheBackend(tuning.cache_sqlite_path)
+    return MemoryCacheBackend()
+
+
+app = FastAPI(
+    title="Chatwoot API Interface",
+    version="2.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+app.add_middleware(
+    ServerTimingMiddleware,
+    sample_rate_provider=lambda: _server_timing_sample_rate,
+)
+app.add_middleware(CompressionMiddleware, compressor_provider=lambda: _compressor)
+# Inside metrics so shed requests are still counted as 503s.
+app.add_middleware(
+    AdmissionMiddleware,
+    admission_provider=lambda: _admission,
+    is_authorized=lambda scope: _has_valid_proxy_api_key(scope),
+)
+# Added last so it is the outermost layer and times compression as well.
+app.add_middleware(MetricsMiddleware, metrics_provider=lambda: _request_metrics)
 
 
 def _require_proxy_client() -> ChatwootFastApiProxyClient:
@@ -80,11 +225,21 @@ def _require_proxy_client() -> ChatwootFastApiProxyClient:
     return _proxy_client
 
 
+def _get_controllers() -> ProxyControllers:
+    """Controllers built in `lifespan`, rebuilt only if the gateway is swapped."""
+    global _controllers
+    client = _require_proxy_client()
+    if _controllers is None or _controllers.client is not client:
+        _controllers = ProxyControllers.build(client)
+    return _controllers
+
+
 def _raise_http_error(error: ProxyGatewayError) -> None:
     raise HTTPException(status_code=error.status_code, detail=error.detail) from error
 
 
 def _verify_proxy_api_key(
+    request: Request,
     x_proxy_api_key: str | None = Header(default=None, alias="X-Proxy-Api-Key"),
 ) -> None:
     if _settings is None:
@@ -96,26 +251,39 @@ def _verify_proxy_api_key(
             ),
         )
 
-    if x_proxy_api_key is None or not hmac.compare_digest(
-        x_proxy_api_key, _settings.proxy_api_key
-    ):
+    client = identify_api_client(x_proxy_api_key, _settings)
+    if client is None:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
+    route_class = classify_request(request.scope)
+    decision = None if route_class is None else _rate_limiter.check(client, route_class)
+    if decision is not None and not decision.allowed:
+        logger.warning(
+            "rate_limited client=%s route_class=%s limit_per_minute=%s",
+            client,
+            route_class,
+            decision.limit,
+        )
+        raise HTTPException(
+            status_code=429,
+            detail="Limite de requests excedido para esta API key.",
+            headers=decision.headers(),
+        )
+
 
-def _human_href(path: str) -> str:
-    href = (
-        path.replace("{account_id}", "1")
-        .replace("{id}", "21")
-        .replace("{inbox_id}", "2")
-        .replace("{conversation_id}", "321")
-    )
-    if ("contacts" in href or "conversations" in href) and "{id}" not in path and "?" not in href:
-        href = f"{href}?page=1"
-    return href
+def _has_valid_proxy_api_key(scope: dict[str, Any]) -> bool:
+    if _settings is None:
+        return False
+    presented_key = Headers(scope=scope).get("x-proxy-api-key")
+    return identify_api_client(presented_key, _settings) is not None
+
+
+def _accepts_ndjson(accept: str | None) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept.lower()
 
 
 @app.get("/health")
-def health() -> dict[str, str]:
+def health() -> dict[str, Any]:
     if _settings is None:
         raise HTTPException(
             status_code=500,
@@ -128,54 +296,58 @@ def health() -> dict[str, str]:
         "status": "ok",
         "mode": "proxy",
         "chatwoot_base_url": _settings.base_url,
+        "warmup": _warmup_progress.as_dict(),
+        "event_loop": _event_loop_health(),
+        "compression": _compressor.as_dict(),
+        "admission": _admission.as_dict(),
     }
 
 
-@app.get("/")
-def root(format: str = Query(default="human")) -> Any:
-    endpoints: list[dict[str, object]] = []
-    for route in app.routes:
-        methods = sorted(
-            method
-            for method in (getattr(route, "methods", set()) or set())
-            if method not in {"HEAD", "OPTIONS"}
-        )
-        path = getattr(route, "path", None)
-        if not path:
-            continue
-        endpoints.append({"path": path, "methods": methods})
-
-    endpoints.sort(key=lambda item: str(item["path"]))
-    if format.lower() == "json":
-        return {"count": len(endpoints), "endpoints": endpoints}
-
-    lines = []
-    for item in endpoints:
-        methods = ", ".join(item["methods"]) if item["methods"] else "-"
-        path = str(item["path"])
-        href = _human_href(path)
-        lines.append(
-            f"<li><code>{methods}</code> "
-            f"<a href='{href}'><code>{path}</code></a></li>"
+def _event_loop_health() -> dict[str, Any]:
+    health = _loop_monitor.as_dict()
+    if _proxy_client is not None:
+        offload = _proxy_client.cpu_offload_stats()
+        health.update(
+            {
+                "inline_decodes": offload.inline_calls,
+                "inline_decode_max_ms": round(offload.inline_seconds_max * 1000, 3),
+                "offloaded_decodes": offload.offloaded_calls,
+                "offloaded_bytes": offload.offloaded_bytes,
+            }
         )
+    return health
+
+
+@app.get("/ready")
+def ready() -> Response:
+    report = _upstream_probe.evaluate(bootstrap_ok=_proxy_client is not None)
+    status_code = 200 if report["state"] == OPERATIONAL else 503
+    return FastJSONResponse(report, status_code=status_code)
 
-    html = (
-        "<!doctype html><html><head><meta charset='utf-8'>"
-        "<title>Endpoints</title>"
-        "<style>"
-        "body{font-family:Arial,sans-serif;max-width:900px;margin:32px auto;padding:0 16px;}"
-        "code{background:#f3f4f6;padding:2px 6px;border-radius:4px;}"
-        "li{margin:10px 0;}h1{margin-bottom:8px;}p{color:#444;}a{text-decoration:none;}"
-        "</style></head><body>"
-        "<h1>Endpoints disponibles</h1>"
-        "<p>Vista humana. Para formato JSON usa <code>/?format=json</code>.</p>"
-        "<p>Los links usan <code>account_id=1</code> por defecto.</p>"
-        f"<p>Total: <strong>{len(endpoints)}</strong></p>"
-        "<ul>"
-        + "".join(lines)
-        + "</ul></body></html>"
+
+@app.get("/metrics", dependencies=[Depends(_verify_proxy_api_key)])
+def metrics() -> Response:
+    body = render_metrics(
+        _request_metrics, _proxy_client, _loop_monitor, _compressor, _admission, _rate_limiter
     )
-    return HTMLResponse(content=html)
+    return Response(content=body, media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.get("/")
+def root(
+    format: str = Query(default="human"),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    global _route_index
+    if _route_index is None:
+        _route_index = build_route_index(app.routes)
+    as_json = format.lower() == "json"
+    etag = _route_index.json_etag if as_json else _route_index.html_etag
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if as_json:
+        return FastJSONResponse(PreSerializedJson(_route_index.json_body), headers={"ETag": etag})
+    return HTMLResponse(content=_route_index.html_body, headers={"ETag": etag})
 
 
 @app.get("/favicon.ico", include_in_schema=False)
@@ -187,11 +359,13 @@ def favicon() -> Response:
     "/api/v1/accounts/{account_id}/inboxes",
     dependencies=[Depends(_verify_proxy_api_key)],
 )
-async def get_inboxes(account_id: int) -> Any:
-    client = _require_proxy_client()
-    controller = GetInboxesController(client=client)
+async def get_inboxes(
+    account_id: int,
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.inboxes
     try:
-        return await controller.run(account_id=account_id)
+        return FastJSONResponse(await controller.run(account_id=account_id))
     except ProxyGatewayError as error:
         _raise_http_error(error)
 
@@ -200,11 +374,16 @@ async def get_inboxes(account_id: int) -> Any:
     "/api/v1/accounts/{account_id}/inboxes/{inbox_id}",
     dependencies=[Depends(_verify_proxy_api_key)],
 )
-async def get_inbox_by_id(account_id: int, inbox_id: int) -> dict[str, Any]:
-    client = _require_proxy_client()
-    controller = GetInboxByIdController(client=client)
+async def get_inbox_by_id(
+    account_id: int,
+    inbox_id: int,
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.inbox_by_id
     try:
-        return await controller.run(account_id=account_id, inbox_id=inbox_id)
+        return FastJSONResponse(
+            await controller.run(account_id=account_id, inbox_id=inbox_id)
+        )
     except ProxyGatewayError as error:
         _raise_http_error(error)
 
@@ -216,11 +395,26 @@ async def get_inbox_by_id(account_id: int, inbox_id: int) -> dict[str, Any]:
 async def get_contacts(
     account_id: int,
     page: str | None = Query(default=None),
-) -> dict[str, Any]:
-    client = _require_proxy_client()
-    controller = GetContactsController(client=client)
+    fields: str | None = Query(default=None),
+    stream: bool = Query(default=False),
+    accept: str | None = Header(default=None),
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    if page is not None and page.lower() == "all" and (stream or _accepts_ndjson(accept)):
+        try:
+            pages = await controllers.contacts_stream.run(
+                account_id=account_id,
+                fields=fields,
+            )
+        except ProxyGatewayError as error:
+            _raise_http_error(error)
+        return NDJSONStreamingResponse(pages)
+
+    controller = controllers.contacts
     try:
-        return await controller.run(account_id=account_id, page=page)
+        return FastJSONResponse(
+            await controller.run(account_id=account_id, page=page, fields=fields)
+        )
     except ProxyGatewayError as error:
         _raise_http_error(error)
 
@@ -229,11 +423,30 @@ async def get_contacts(
     "/api/v1/accounts/{account_id}/contacts/{id}",
     dependencies=[Depends(_verify_proxy_api_key)],
 )
-async def get_contact_by_id(account_id: int, id: int) -> dict[str, Any]:
-    client = _require_proxy_client()
-    controller = GetContactByIdController(client=client)
+async def get_contact_by_id(
+    account_id: int,
+    id: int,
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.contact_by_id
+    try:
+        return FastJSONResponse(await controller.run(account_id=account_id, contact_id=id))
+    except ProxyGatewayError as error:
+        _raise_http_error(error)
+
+
+@app.get(
+    "/api/v1/accounts/{account_id}/contacts/{id}/conversations",
+    dependencies=[Depends(_verify_proxy_api_key)],
+)
+async def get_contact_conversations(
+    account_id: int,
+    id: int,
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.contact_conversations
     try:
-        return await controller.run(account_id=account_id, contact_id=id)
+        return FastJSONResponse(await controller.run(account_id=account_id, contact_id=id))
     except ProxyGatewayError as error:
         _raise_http_error(error)
 
@@ -247,15 +460,44 @@ async def get_conversations(
     page: str | None = Query(default=None),
     status: str | None = Query(default=None),
     inbox_id: int | None = Query(default=None),
-) -> dict[str, Any]:
-    client = _require_proxy_client()
-    controller = GetConversationsController(client=client)
+    fields: str | None = Query(default=None),
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.conversations
+    try:
+        return FastJSONResponse(
+            await controller.run(
+                account_id=account_id,
+                page=page,
+                status=status,
+                inbox_id=inbox_id,
+                fields=fields,
+            )
+        )
+    except ProxyGatewayError as error:
+        _raise_http_error(error)
+
+
+@app.post(
+    "/api/v1/accounts/{account_id}/conversations/batch",
+    dependencies=[Depends(_verify_proxy_api_key)],
+)
+async def get_conversations_batch(
+    account_id: int,
+    conversation_ids: list[int] = Body(...),
+    resources: list[str] | None = Body(default=None),
+    messages_page: str | None = Body(default=None),
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.conversations_batch
     try:
-        return await controller.run(
-            account_id=account_id,
-            page=page,
-            status=status,
-            inbox_id=inbox_id,
+        return FastJSONResponse(
+            await controller.run(
+                account_id=account_id,
+                conversation_ids=conversation_ids,
+                resources=resources,
+                messages_page=messages_page,
+            )
         )
     except ProxyGatewayError as error:
         _raise_http_error(error)
@@ -265,13 +507,18 @@ async def get_conversations(
     "/api/v1/accounts/{account_id}/conversations/{conversation_id}",
     dependencies=[Depends(_verify_proxy_api_key)],
 )
-async def get_conversation_by_id(account_id: int, conversation_id: int) -> dict[str, Any]:
-    client = _require_proxy_client()
-    controller = GetConversationByIdController(client=client)
+async def get_conversation_by_id(
+    account_id: int,
+    conversation_id: int,
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.conversation_by_id
     try:
-        return await controller.run(
-            account_id=account_id,
-            conversation_id=conversation_id,
+        return FastJSONResponse(
+            await controller.run(
+                account_id=account_id,
+                conversation_id=conversation_id,
+            )
         )
     except ProxyGatewayError as error:
         _raise_http_error(error)
@@ -285,14 +532,18 @@ async def get_conversation_messages(
     account_id: int,
     conversation_id: int,
     page: str | None = Query(default=None),
-) -> dict[str, Any]:
-    client = _require_proxy_client()
-    controller = GetConversationMessagesController(client=client)
+    fields: str | None = Query(default=None),
+    controllers: ProxyControllers = Depends(_get_controllers),
+) -> Response:
+    controller = controllers.conversation_messages
     try:
-        return await controller.run(
-            account_id=account_id,
-            conversation_id=conversation_id,
-            page=page,
+        return FastJSONResponse(
+            await controller.run(
+                account_id=account_id,
+                conversation_id=conversation_id,
+                page=page,
+                fields=fields,
+            )
         )
     except ProxyGatewayError as error:
         _raise_http_error(error)
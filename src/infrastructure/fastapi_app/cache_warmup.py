@@ -0,0 +1,149 @@
+"""
+Path: src/infrastructure/fastapi_app/cache_warmup.py
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from src.infrastructure.settings.env_settings import ProxyTuningSettings
+from src.use_case.errors import ProxyGatewayError
+from src.use_case.gateways.chatwoot_proxy_gateway import ChatwootProxyGateway
+
+logger = logging.getLogger(__name__)
+
+WARMUP_CONCURRENCY = 4
+
+
+@dataclass
+class WarmupProgress:
+    state: str = "disabled"
+    total_steps: int = 0
+    completed_steps: int = 0
+    failed_steps: int = 0
+    duration_seconds: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "total_steps": self.total_steps,
+            "completed_steps": self.completed_steps,
+            "failed_steps": self.failed_steps,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+def start_cache_warmup(
+    client: ChatwootProxyGateway,
+    account_id: int,
+    tuning: ProxyTuningSettings,
+    progress: WarmupProgress,
+) -> asyncio.Task[None] | None:
+    """Schedule the warm-up; None when it is disabled or would prime nothing.
+
+    Without the response cache the preloaded pages are thrown away, so the
+    warm-up would only spend upstream calls: it is skipped with a warning.
+    """
+    if not tuning.warmup_enabled:
+        return None
+    if not tuning.cache_enabled:
+        progress.state = "skipped"
+        logger.warning(
+            "cache_warmup_skipped reason=cache_disabled account_id=%s "
+            "hint=set PROXY_CACHE_ENABLED=true",
+            account_id,
+        )
+        return None
+    progress.state = "pending"
+    return asyncio.create_task(
+        run_cache_warmup(
+            client,
+            account_id=account_id,
+            contacts_pages=tuning.warmup_contacts_pages,
+            conversations_pages=tuning.warmup_conversations_pages,
+            progress=progress,
+        )
+    )
+
+
+async def run_cache_warmup(
+    client: ChatwootProxyGateway,
+    account_id: int,
+    contacts_pages: int,
+    conversations_pages: int,
+    progress: WarmupProgress,
+) -> None:
+    """Prime the upstream connection pool and the proxy caches in the background."""
+    steps: list[tuple[str, Callable[[], Awaitable[Any]]]] = []
+    for page in range(1, contacts_pages + 1):
+        steps.append(
+            (
+                f"contacts:{page}",
+                lambda page=page: client.get_contacts(account_id=account_id, page=str(page)),
+            )
+        )
+    for page in range(1, conversations_pages + 1):
+        steps.append(
+            (
+                f"conversations:open:{page}",
+                lambda page=page: client.get_conversations(
+                    account_id=account_id,
+                    page=str(page),
+                    status="open",
+                    inbox_id=None,
+                ),
+            )
+        )
+
+    progress.state = "running"
+    progress.total_steps = len(steps) + 1
+    started_at = time.perf_counter()
+    logger.info("cache_warmup_started account_id=%s steps=%s", account_id, progress.total_steps)
+
+    # Inboxes go first and alone: the TLS handshake is paid once before fanning out.
+    await _run_step(progress, "inboxes", lambda: client.get_inboxes(account_id))
+
+    semaphore = asyncio.Semaphore(WARMUP_CONCURRENCY)
+
+    async def bounded(name: str, step: Callable[[], Awaitable[Any]]) -> None:
+        async with semaphore:
+            await _run_step(progress, name, step)
+
+    await asyncio.gather(*(bounded(name, step) for name, step in steps))
+
+    progress.duration_seconds = round(time.perf_counter() - started_at, 3)
+    progress.state = "done" if progress.failed_steps == 0 else "partial"
+    logger.info(
+        "cache_warmup_finished account_id=%s state=%s completed=%s failed=%s duration_seconds=%s",
+        account_id,
+        progress.state,
+        progress.completed_steps,
+        progress.failed_steps,
+        progress.duration_seconds,
+    )
+
+
+async def _run_step(
+    progress: WarmupProgress,
+    name: str,
+    step: Callable[[], Awaitable[Any]],
+) -> None:
+    try:
+        await step()
+    except ProxyGatewayError as error:
+        progress.failed_steps += 1
+        logger.warning(
+            "cache_warmup_step_failed step=%s status_code=%s detail=%s",
+            name,
+            error.status_code,
+            error.detail,
+        )
+        return
+    except Exception:
+        progress.failed_steps += 1
+        logger.exception("cache_warmup_step_crashed step=%s", name)
+        return
+    progress.completed_steps += 1
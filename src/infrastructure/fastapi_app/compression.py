@@ -0,0 +1,328 @@
+"""
+Path: src/infrastructure/fastapi_app/compression.py
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import Any
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+DEFAULT_MIN_SIZE_BYTES = 1024
+# Levels picked for CPU vs bytes on JSON: past these the ratio barely moves
+# while compression time keeps growing.
+DEFAULT_GZIP_LEVEL = 5
+DEFAULT_BROTLI_QUALITY = 4
+DEFAULT_ZSTD_LEVEL = 3
+
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "application/x-ndjson", "text/")
+UNMATCHED_ROUTE = "unmatched"
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+@dataclass
+class RouteCompressionStats:
+    responses: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "responses": self.responses,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_in - self.bytes_out,
+            "cpu_ms": round(self.cpu_seconds * 1000, 3),
+        }
+
+
+class ResponseCompressor:
+    """Negotiates Content-Encoding and keeps per-route compression stats.
+
+    br and zstd are offered only when `brotli` / `zstandard` are installed;
+    gzip is always available. On equal client preference the server order
+    (br, zstd, gzip) wins.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        min_size_bytes: int = DEFAULT_MIN_SIZE_BYTES,
+        gzip_level: int = DEFAULT_GZIP_LEVEL,
+        brotli_quality: int = DEFAULT_BROTLI_QUALITY,
+        zstd_level: int = DEFAULT_ZSTD_LEVEL,
+    ) -> None:
+        self.enabled = enabled
+        self.min_size_bytes = max(0, min_size_bytes)
+        self._factories: dict[str, Callable[[], Any]] = {}
+        if brotli is not None:
+            self._factories["br"] = lambda: _BrotliEncoder(brotli_quality)
+        if zstandard is not None:
+            self._factories["zstd"] = lambda: _ZstdEncoder(zstd_level)
+        self._factories["gzip"] = lambda: _GzipEncoder(gzip_level)
+        self._stats: dict[tuple[str, str], RouteCompressionStats] = {}
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        return tuple(self._factories)
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        if not self.enabled or not accept_encoding:
+            return None
+        weights: dict[str, float] = {}
+        for part in accept_encoding.split(","):
+            name, *params = part.split(";")
+            name = name.strip().lower()
+            if not name:
+                continue
+            weight = _quality(params)
+            if weight is None:
+                # A malformed member says nothing usable: neither accept nor refuse.
+                continue
+            weights[name] = weight
+        best: str | None = None
+        best_weight = 0.0
+        for encoding in self._factories:
+            weight = weights.get(encoding, weights.get("*", 0.0))
+            if weight > best_weight:
+                best, best_weight = encoding, weight
+        return best
+
+    def encoder(self, encoding: str) -> Any:
+        return self._factories[encoding]()
+
+    def record(
+        self,
+        route: str,
+        encoding: str,
+        bytes_in: int,
+        bytes_out: int,
+        cpu_seconds: float,
+    ) -> None:
+        stats = self._stats.setdefault((route, encoding), RouteCompressionStats())
+        stats.responses += 1
+        stats.bytes_in += bytes_in
+        stats.bytes_out += bytes_out
+        stats.cpu_seconds += cpu_seconds
+
+    def stats(self) -> dict[tuple[str, str], RouteCompressionStats]:
+        return dict(self._stats)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "encodings": list(self.encodings),
+            "min_size_bytes": self.min_size_bytes,
+            "routes": {
+                f"{route} {encoding}": stats.as_dict()
+                for (route, encoding), stats in sorted(self._stats.items())
+            },
+        }
+
+
+class CompressionMiddleware:
+    """ASGI middleware that compresses JSON, NDJSON and text responses.
+
+    Single-body responses below `min_size_bytes` go out untouched. Streaming
+    responses are compressed chunk by chunk and flushed after each one, so
+    every NDJSON page reaches the client as soon as it is produced.
+    """
+
+    def __init__(self, app: Any, compressor_provider: Callable[[], ResponseCompressor]) -> None:
+        self.app = app
+        self._compressor_provider = compressor_provider
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        compressor = self._compressor_provider()
+        encoding = compressor.negotiate(_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingSender(compressor, encoding, scope, send)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSender:
+    def __init__(
+        self,
+        compressor: ResponseCompressor,
+        encoding: str,
+        scope: dict[str, Any],
+        send: Any,
+    ) -> None:
+        self._compressor = compressor
+        self._encoding = encoding
+        self._scope = scope
+        self._send = send
+        self._start: dict[str, Any] | None = None
+        self._encoder: Any = None
+        self._passthrough = False
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._cpu_seconds = 0.0
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            headers = message.get("headers", [])
+            media_type = (_header(headers, b"content-type") or "").lower()
+            self._passthrough = (
+                _header(headers, b"content-encoding") is not None
+                or not media_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+            )
+            if self._passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._encoder is None:
+            if not more_body and len(body) < self._compressor.min_size_bytes:
+                await self._send(self._start_message(compressed=False, length=len(body)))
+                await self._send(message)
+                return
+            self._encoder = self._compressor.encoder(self._encoding)
+            if more_body:
+                await self._send(self._start_message(compressed=True, length=None))
+            else:
+                payload = self._encode(body, final=True)
+                await self._send(self._start_message(compressed=True, length=len(payload)))
+                await self._send({"type": "http.response.body", "body": payload})
+                self._record()
+                return
+
+        payload = self._encode(body, final=not more_body)
+        await self._send({"type": "http.response.body", "body": payload, "more_body": more_body})
+        if not more_body:
+            self._record()
+
+    def _encode(self, body: bytes, final: bool) -> bytes:
+        started = time.thread_time()
+        payload = self._encoder.compress(body)
+        payload += self._encoder.finish() if final else self._encoder.flush()
+        self._cpu_seconds += time.thread_time() - started
+        self._bytes_in += len(body)
+        self._bytes_out += len(payload)
+        return payload
+
+    def _start_message(self, compressed: bool, length: int | None) -> dict[str, Any]:
+        start = self._start or {}
+        headers = [
+            (name, value)
+            for name, value in start.get("headers", [])
+            if not compressed or name.lower() not in (b"content-length", b"etag")
+        ]
+        if compressed:
+            headers = _with_vary(headers, b"Accept-Encoding")
+            headers.append((b"content-encoding", self._encoding.encode("latin-1")))
+            if length is not None:
+                headers.append((b"content-length", str(length).encode("latin-1")))
+            etag = _header(start.get("headers", []), b"etag")
+            if etag is not None:
+                # Another encoding means other bytes: the strong validator no
+                # longer applies, but the weak one still does.
+                weak = etag if etag.startswith("W/") else f"W/{etag}"
+                headers.append((b"etag", weak.encode("latin-1")))
+        return {**start, "headers": headers}
+
+    def _record(self) -> None:
+        route = self._scope.get("route")
+        self._compressor.record(
+            getattr(route, "path", None) or UNMATCHED_ROUTE,
+            self._encoding,
+            self._bytes_in,
+            self._bytes_out,
+            self._cpu_seconds,
+        )
+
+
+def _quality(params: list[str]) -> float | None:
+    """The `q` parameter of an Accept-Encoding member; 1.0 when absent, None if malformed."""
+    for param in params:
+        key, _, value = param.partition("=")
+        if key.strip().lower() != "q":
+            continue
+        try:
+            weight = float(value.strip())
+        except ValueError:
+            return None
+        return weight if 0.0 <= weight <= 1.0 else None
+    return 1.0
+
+
+def _with_vary(headers: list[tuple[bytes, bytes]], field: bytes) -> list[tuple[bytes, bytes]]:
+    """Add `field` to the response's Vary header, merging with the one the app set."""
+    for index, (name, value) in enumerate(headers):
+        if name.lower() != b"vary":
+            continue
+        listed = {item.strip().lower() for item in value.split(b",")}
+        if b"*" not in listed and field.lower() not in listed:
+            headers[index] = (name, value + b", " + field)
+        return headers
+    headers.append((b"vary", field))
+    return headers
+
+
+def _header(headers: Any, name: bytes) -> str | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
@@ -0,0 +1,52 @@
+"""
+Path: src/infrastructure/fastapi_app/controller_registry.py
+"""
+
+from dataclasses import dataclass
+
+from src.interface_adapter.controllers.fastapi_proxy_controllers import (
+    GetContactByIdController,
+    GetContactConversationsController,
+    GetContactsController,
+    GetConversationByIdController,
+    GetConversationMessagesController,
+    GetConversationsBatchController,
+    GetConversationsController,
+    GetInboxByIdController,
+    GetInboxesController,
+    StreamContactsController,
+)
+from src.use_case.gateways.chatwoot_proxy_gateway import ChatwootProxyGateway
+
+
+@dataclass(frozen=True)
+class ProxyControllers:
+    """Every route controller, built once around the same gateway."""
+
+    client: ChatwootProxyGateway
+    inboxes: GetInboxesController
+    inbox_by_id: GetInboxByIdController
+    contacts: GetContactsController
+    contacts_stream: StreamContactsController
+    contact_by_id: GetContactByIdController
+    contact_conversations: GetContactConversationsController
+    conversations: GetConversationsController
+    conversations_batch: GetConversationsBatchController
+    conversation_by_id: GetConversationByIdController
+    conversation_messages: GetConversationMessagesController
+
+    @classmethod
+    def build(cls, client: ChatwootProxyGateway) -> "ProxyControllers":
+        return cls(
+            client=client,
+            inboxes=GetInboxesController(client=client),
+            inbox_by_id=GetInboxByIdController(client=client),
+            contacts=GetContactsController(client=client),
+            contacts_stream=StreamContactsController(client=client),
+            contact_by_id=GetContactByIdController(client=client),
+            contact_conversations=GetContactConversationsController(client=client),
+            conversations=GetConversationsController(client=client),
+            conversations_batch=GetConversationsBatchController(client=client),
+            conversation_by_id=GetConversationByIdController(client=client),
+            conversation_messages=GetConversationMessagesController(client=client),
+        )
@@ -0,0 +1,78 @@
+"""
+Path: src/infrastructure/fastapi_app/event_loop_monitor.py
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+import math
+from typing import Any
+
+DEFAULT_LAG_SAMPLE_INTERVAL_SECONDS = 0.1
+DEFAULT_LAG_MAX_SAMPLES = 1024
+
+
+def percentile(values: Iterable[float], fraction: float) -> float | None:
+    """Nearest-rank percentile; None for an empty sample."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class EventLoopLagMonitor:
+    """Samples how late the event loop wakes up a periodic sleeper.
+
+    Any lag means a callback held the loop (e.g. decoding a big page inline),
+    which is exactly the delay every other in-flight request paid as well.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = DEFAULT_LAG_SAMPLE_INTERVAL_SECONDS,
+        max_samples: int = DEFAULT_LAG_MAX_SAMPLES,
+    ) -> None:
+        self._interval_seconds = interval_seconds
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self._max_lag_seconds = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None and self._interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def record(self, lag_seconds: float) -> None:
+        lag_seconds = max(0.0, lag_seconds)
+        self._samples.append(lag_seconds)
+        self._max_lag_seconds = max(self._max_lag_seconds, lag_seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        samples = list(self._samples)
+        return {
+            "running": self._task is not None,
+            "samples": len(samples),
+            "lag_p50_ms": _to_ms(percentile(samples, 0.50)),
+            "lag_p99_ms": _to_ms(percentile(samples, 0.99)),
+            "lag_max_ms": _to_ms(self._max_lag_seconds if samples else None),
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_seconds
+            await asyncio.sleep(self._interval_seconds)
+            self.record(loop.time() - expected)
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    if seconds is None:
+        return None
+    return round(seconds * 1000, 3)
@@ -0,0 +1,317 @@
+"""
+Path: src/infrastructure/fastapi_app/metrics.py
+"""
+
+from collections.abc import Callable, Mapping
+import time
+from typing import Any
+
+from src.infrastructure.fastapi_app.admission import ROUTE_CLASSES, AdmissionController
+from src.infrastructure.fastapi_app.compression import UNMATCHED_ROUTE, ResponseCompressor
+from src.infrastructure.fastapi_app.event_loop_monitor import EventLoopLagMonitor
+from src.infrastructure.fastapi_app.rate_limit import ApiKeyRateLimiter
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.requests.upstream_metrics import LatencyHistogram
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRIC_PREFIX = "chatwoot_proxy"
+
+
+class RequestMetrics:
+    """In-process counters for the proxy's own HTTP traffic.
+
+    Labels use the route template (`/api/v1/accounts/{account_id}/...`), never
+    the concrete path, so the number of series stays bounded.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.requests: dict[tuple[str, str, int], int] = {}
+        self.latency: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        histogram = self.latency.get((method, route))
+        if histogram is None:
+            histogram = self.latency[(method, route)] = LatencyHistogram()
+        histogram.observe(seconds)
+
+
+class MetricsMiddleware:
+    """Times every HTTP request until its last body chunk has been sent."""
+
+    def __init__(self, app: Any, metrics_provider: Callable[[], RequestMetrics]) -> None:
+        self.app = app
+        self._metrics_provider = metrics_provider
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        metrics = self._metrics_provider()
+        status = 500
+
+        async def send_with_status(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_flight -= 1
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            metrics.record(scope["method"], route, status, time.perf_counter() - started)
+
+
+class PrometheusWriter:
+    """Minimal writer for the Prometheus text exposition format (0.0.4)."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def header(self, name: str, metric_type: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        self._lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+
+    def sample(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:
+        self._lines.append(f"{METRIC_PREFIX}_{name}{_labels(labels)} {_number(value)}")
+
+    def metric(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        value: float,
+        labels: Mapping[str, object] | None = None,
+    ) -> None:
+        self.header(name, metric_type, help_text)
+        self.sample(name, value, labels)
+
+    def histogram(
+        self,
+        name: str,
+        histogram: LatencyHistogram,
+        labels: Mapping[str, object],
+    ) -> None:
+        for bound, count in zip(
+            [*histogram.buckets, float("inf")],
+            histogram.cumulative_counts(),
+        ):
+            self.sample(f"{name}_bucket", count, {**labels, "le": bound})
+        self.sample(f"{name}_sum", histogram.total, labels)
+        self.sample(f"{name}_count", histogram.count, labels)
+
+    def render(self) -> bytes:
+        return ("\n".join(self._lines) + "\n").encode("utf-8")
+
+
+def render_metrics(
+    requests: RequestMetrics,
+    proxy_client: ChatwootFastApiProxyClient | None,
+    loop_monitor: EventLoopLagMonitor,
+    compressor: ResponseCompressor,
+    admission: AdmissionController | None = None,
+    rate_limiter: ApiKeyRateLimiter | None = None,
+) -> bytes:
+    writer = PrometheusWriter()
+    _write_requests(writer, requests)
+    if admission is not None:
+        _write_admission(writer, admission)
+    if rate_limiter is not None:
+        writer.header(
+            "rate_limited_total", "counter", "Requests rejected with 429 by client and class."
+        )
+        for (client, route_class), count in sorted(rate_limiter.rejected().items()):
+            writer.sample("rate_limited_total", count, {"client": client, "class": route_class})
+    if proxy_client is not None:
+        _write_upstream(writer, proxy_client)
+    _write_event_loop(writer, loop_monitor)
+    _write_compression(writer, compressor)
+    return writer.render()
+
+
+def _write_requests(writer: PrometheusWriter, requests: RequestMetrics) -> None:
+    writer.metric(
+        "http_requests_in_flight", "gauge", "Requests being served.", requests.in_flight
+    )
+    writer.header("http_requests_total", "counter", "Requests served by route and status.")
+    for (method, route, status), count in sorted(requests.requests.items()):
+        writer.sample(
+            "http_requests_total", count, {"method": method, "route": route, "status": status}
+        )
+    writer.header(
+        "http_request_duration_seconds", "histogram", "Time to serve a request by route."
+    )
+    for (method, route), histogram in sorted(requests.latency.items()):
+        writer.histogram(
+            "http_request_duration_seconds", histogram, {"method": method, "route": route}
+        )
+
+
+def _write_admission(writer: PrometheusWriter, admission: AdmissionController) -> None:
+    writer.header("admission_in_flight", "gauge", "Admitted requests by route class.")
+    for route_class in ROUTE_CLASSES:
+        writer.sample(
+            "admission_in_flight", admission.in_flight(route_class), {"class": route_class}
+        )
+    writer.header("admission_waiting", "gauge", "Requests queued for a slot by route class.")
+    for route_class in ROUTE_CLASSES:
+        writer.sample("admission_waiting", admission.waiting(route_class), {"class": route_class})
+    writer.header("admission_decisions_total", "counter", "Admission outcomes by route class.")
+    for route_class, stats in admission.stats().items():
+        for decision, count in (
+            ("admitted", stats.admitted),
+            ("queued", stats.queued),
+            ("shed", stats.shed),
+        ):
+            writer.sample(
+                "admission_decisions_total",
+                count,
+                {"class": route_class, "decision": decision},
+            )
+
+
+def _write_upstream(writer: PrometheusWriter, client: ChatwootFastApiProxyClient) -> None:
+    upstream = client.upstream_metrics()
+    writer.metric(
+        "upstream_requests_in_flight", "gauge", "Calls to Chatwoot in progress.", upstream.in_flight
+    )
+    writer.header(
+        "upstream_requests_total",
+        "counter",
+        "Calls to Chatwoot by resource and status code (or transport error).",
+    )
+    calls = sorted(upstream.calls.items(), key=lambda item: (item[0].resource, item[0].outcome))
+    for key, count in calls:
+        writer.sample(
+            "upstream_requests_total", count, {"resource": key.resource, "status": key.outcome}
+        )
+    writer.header(
+        "upstream_request_duration_seconds", "histogram", "Chatwoot call latency by resource."
+    )
+    for resource, histogram in sorted(upstream.latency.items()):
+        writer.histogram("upstream_request_duration_seconds", histogram, {"resource": resource})
+
+    cache = client.cache_stats()
+    if cache is not None:
+        writer.header("cache_lookups_total", "counter", "Response cache lookups by result.")
+        for result, count in (
+            ("hit", cache.hits),
+            ("stale", cache.stale_hits),
+            ("miss", cache.misses),
+        ):
+            writer.sample("cache_lookups_total", count, {"result": result})
+        writer.header("cache_refreshes_total", "counter", "Background cache refreshes.")
+        for outcome, count in (
+            ("started", cache.refreshes),
+            ("error", cache.refresh_errors),
+            ("skipped", cache.refreshes_skipped),
+        ):
+            writer.sample("cache_refreshes_total", count, {"outcome": outcome})
+        writer.metric("cache_entries", "gauge", "Entries in the response cache.", cache.entries)
+
+    single_flight = client.single_flight_stats()
+    writer.metric(
+        "single_flight_calls_total", "counter", "Loads requested.", single_flight.calls
+    )
+    writer.metric(
+        "single_flight_shared_total",
+        "counter",
+        "Loads served by joining one already in flight.",
+        single_flight.shared,
+    )
+    conditional = client.conditional_request_stats()
+    writer.metric(
+        "upstream_revalidations_total",
+        "counter",
+        "Upstream 304 Not Modified answers reused.",
+        conditional.revalidated,
+    )
+    offload = client.cpu_offload_stats()
+    writer.header("decodes_total", "counter", "Upstream payload decodes by where they ran.")
+    writer.sample("decodes_total", offload.inline_calls, {"mode": "inline"})
+    writer.sample("decodes_total", offload.offloaded_calls, {"mode": "thread"})
+    writer.metric(
+        "decode_inline_seconds_total",
+        "counter",
+        "Time spent decoding on the event loop.",
+        offload.inline_seconds_total,
+    )
+
+    pool = client.connection_pool_stats()
+    if pool is not None:
+        writer.header("upstream_pool_connections", "gauge", "Upstream connections by state.")
+        writer.sample("upstream_pool_connections", pool.active, {"state": "active"})
+        writer.sample("upstream_pool_connections", pool.idle, {"state": "idle"})
+        writer.metric(
+            "upstream_pool_pending_requests",
+            "gauge",
+            "Requests waiting for a pooled connection.",
+            pool.pending_requests,
+        )
+        if pool.max_connections is not None:
+            writer.metric(
+                "upstream_pool_max_connections",
+                "gauge",
+                "Connection pool size limit.",
+                pool.max_connections,
+            )
+
+
+def _write_event_loop(writer: PrometheusWriter, loop_monitor: EventLoopLagMonitor) -> None:
+    lag = loop_monitor.as_dict()
+    # Plain gauges: a `quantile` label is only valid on a summary, and the
+    # monitor keeps a window of samples rather than a cumulative sum/count.
+    for name, key, help_text in (
+        ("event_loop_lag_p50_seconds", "lag_p50_ms", "Median event loop lag, recent samples."),
+        ("event_loop_lag_p99_seconds", "lag_p99_ms", "p99 event loop lag, recent samples."),
+        ("event_loop_lag_max_seconds", "lag_max_ms", "Largest event loop lag since startup."),
+    ):
+        if lag[key] is not None:
+            writer.metric(name, "gauge", help_text, lag[key] / 1000)
+
+
+def _write_compression(writer: PrometheusWriter, compressor: ResponseCompressor) -> None:
+    stats = sorted(compressor.stats().items())
+    writer.header("compression_bytes_total", "counter", "Bytes before and after compression.")
+    for (route, encoding), route_stats in stats:
+        labels = {"route": route, "encoding": encoding}
+        writer.sample("compression_bytes_total", route_stats.bytes_in, {**labels, "stage": "in"})
+        writer.sample("compression_bytes_total", route_stats.bytes_out, {**labels, "stage": "out"})
+    writer.header("compression_cpu_seconds_total", "counter", "CPU time spent compressing.")
+    for (route, encoding), route_stats in stats:
+        writer.sample(
+            "compression_cpu_seconds_total",
+            route_stats.cpu_seconds,
+            {"route": route, "encoding": encoding},
+        )
+
+
+def _labels(labels: Mapping[str, object] | None) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        f'{name}="{_label_value(value)}"' for name, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+
+def _label_value(value: object) -> str:
+    if isinstance(value, float):
+        return _number(value)
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,139 @@
+"""
+Path: src/infrastructure/fastapi_app/rate_limit.py
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import hmac
+import math
+import time
+
+from src.infrastructure.fastapi_app.admission import FANOUT, ROUTE_CLASSES
+from src.infrastructure.settings.env_settings import DEFAULT_API_CLIENT, ChatwootSettings
+
+DEFAULT_LOOKUP_PER_MINUTE = 600
+DEFAULT_FANOUT_PER_MINUTE = 30
+
+
+def identify_api_client(presented_key: str | None, settings: ChatwootSettings) -> str | None:
+    """Client name owning `presented_key`, or None when no key matches.
+
+    Every configured key is compared in constant time, so the response time
+    does not reveal which client (or how many) exist.
+    """
+    if presented_key is None:
+        return None
+    keys = {DEFAULT_API_CLIENT: settings.proxy_api_key, **settings.proxy_api_keys}
+    client = None
+    for name, key in keys.items():
+        matches = hmac.compare_digest(presented_key.encode("utf-8"), key.encode("utf-8"))
+        if matches and client is None:
+            client = name
+    return client
+
+
+@dataclass(frozen=True)
+class ClientQuota:
+    lookup_per_minute: int = DEFAULT_LOOKUP_PER_MINUTE
+    fanout_per_minute: int = DEFAULT_FANOUT_PER_MINUTE
+
+    def per_minute(self, route_class: str) -> int:
+        return self.fanout_per_minute if route_class == FANOUT else self.lookup_per_minute
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: float
+
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_seconds)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.reset_seconds)))
+        return headers
+
+
+class TokenBucket:
+    """`capacity` tokens refilled continuously at `capacity` per minute."""
+
+    def __init__(self, capacity: int, now: float) -> None:
+        self.capacity = capacity
+        self._refill_per_second = capacity / 60
+        self._tokens = float(capacity)
+        self._updated = now
+
+    def take(self, now: float) -> RateLimitDecision:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._refill_per_second)
+        self._updated = now
+        allowed = self._tokens >= 1
+        if allowed:
+            self._tokens -= 1
+        # Reset is when the next request would be accepted again.
+        missing = 1 - self._tokens if self._tokens < 1 else 0.0
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=self.capacity,
+            remaining=int(self._tokens),
+            reset_seconds=missing / self._refill_per_second,
+        )
+
+
+class ApiKeyRateLimiter:
+    """One token bucket per (client, route class), kept in process memory.
+
+    Fan-out and lookup requests draw from separate budgets, so a client
+    walking `page=all` does not exhaust its own single lookups. A quota of
+    0 disables limiting for that client and class. With several workers
+    each one enforces its own budget.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        default_quota: ClientQuota = ClientQuota(),
+        quotas: Mapping[str, ClientQuota] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self._default_quota = default_quota
+        self._quotas = dict(quotas or {})
+        self._clock = clock
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._rejected: dict[tuple[str, str], int] = {}
+
+    def quota(self, client: str) -> ClientQuota:
+        return self._quotas.get(client, self._default_quota)
+
+    def check(self, client: str, route_class: str) -> RateLimitDecision | None:
+        """Take a token for the request; None when it is not limited."""
+        if not self.enabled or route_class not in ROUTE_CLASSES:
+            return None
+        per_minute = self.quota(client).per_minute(route_class)
+        if per_minute <= 0:
+            return None
+        now = self._clock()
+        key = (client, route_class)
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.capacity != per_minute:
+            bucket = self._buckets[key] = TokenBucket(per_minute, now)
+        decision = bucket.take(now)
+        if not decision.allowed:
+            self._rejected[key] = self._rejected.get(key, 0) + 1
+        return decision
+
+    def rejected(self) -> dict[tuple[str, str], int]:
+        return dict(self._rejected)
+
+
+def build_client_quotas(quotas: Mapping[str, tuple[int, int]]) -> dict[str, ClientQuota]:
+    return {
+        client: ClientQuota(lookup_per_minute=lookups, fanout_per_minute=fanout)
+        for client, (lookups, fanout) in quotas.items()
+    }
@@ -0,0 +1,145 @@
+"""
+Path: src/infrastructure/fastapi_app/readiness.py
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from src.infrastructure.fastapi_app.event_loop_monitor import percentile
+from src.use_case.errors import ProxyGatewayError
+
+logger = logging.getLogger(__name__)
+
+OPERATIONAL = "operational"
+DEGRADED = "degraded"
+
+DEFAULT_PROBE_INTERVAL_SECONDS = 15.0
+DEFAULT_PROBE_WINDOW = 20
+DEFAULT_MAX_ERROR_RATE = 0.5
+DEFAULT_MAX_LATENCY_P95_MS = 2000.0
+# A probe result older than this many intervals means the probe loop is stuck.
+STALE_AFTER_INTERVALS = 3
+
+
+@dataclass(frozen=True)
+class ProbeSample:
+    latency_seconds: float
+    ok: bool
+    error: str | None
+    finished_at: float
+
+
+class UpstreamProbe:
+    """Periodically times one real call to Chatwoot and keeps the last results.
+
+    `/ready` only reads the cached samples, so health checks never add load
+    upstream no matter how often they are polled.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        interval_seconds: float = DEFAULT_PROBE_INTERVAL_SECONDS,
+        window: int = DEFAULT_PROBE_WINDOW,
+        max_error_rate: float = DEFAULT_MAX_ERROR_RATE,
+        max_latency_p95_ms: float = DEFAULT_MAX_LATENCY_P95_MS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._probe = probe
+        self._interval_seconds = interval_seconds
+        self._samples: deque[ProbeSample] = deque(maxlen=max(1, window))
+        self._max_error_rate = max_error_rate
+        self._max_latency_p95_ms = max_latency_p95_ms
+        self._clock = clock
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None and self._interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run_once(self) -> ProbeSample:
+        started = time.perf_counter()
+        error = None
+        try:
+            await self._probe()
+        except ProxyGatewayError as exc:
+            error = str(exc.status_code)
+        except Exception as exc:  # the probe must never kill its loop
+            error = type(exc).__name__
+        sample = ProbeSample(
+            latency_seconds=time.perf_counter() - started,
+            ok=error is None,
+            error=error,
+            finished_at=self._clock(),
+        )
+        if error is not None:
+            logger.warning(
+                "upstream_probe_failed error=%s latency_ms=%.1f",
+                error,
+                sample.latency_seconds * 1000,
+            )
+        self._samples.append(sample)
+        return sample
+
+    def evaluate(self, bootstrap_ok: bool = True) -> dict[str, Any]:
+        """Readiness per ADR-002: `operational`, or `degraded` with its reasons."""
+        samples = list(self._samples)
+        latencies = [sample.latency_seconds for sample in samples]
+        errors = sum(1 for sample in samples if not sample.ok)
+        error_rate = errors / len(samples) if samples else None
+        p95_ms = _to_ms(percentile(latencies, 0.95))
+        last = samples[-1] if samples else None
+        age_seconds = None if last is None else self._clock() - last.finished_at
+
+        reasons = []
+        if not bootstrap_ok:
+            reasons.append("bootstrap_failed")
+        elif last is None:
+            reasons.append("probe_pending")
+        else:
+            if age_seconds > STALE_AFTER_INTERVALS * self._interval_seconds:
+                reasons.append("probe_stale")
+            if error_rate > self._max_error_rate:
+                reasons.append("upstream_errors")
+            if p95_ms is not None and p95_ms > self._max_latency_p95_ms:
+                reasons.append("upstream_slow")
+        return {
+            "state": DEGRADED if reasons else OPERATIONAL,
+            "reasons": reasons,
+            "upstream": {
+                "samples": len(samples),
+                "error_rate": None if error_rate is None else round(error_rate, 3),
+                "latency_p50_ms": _to_ms(percentile(latencies, 0.50)),
+                "latency_p95_ms": p95_ms,
+                "latency_p99_ms": _to_ms(percentile(latencies, 0.99)),
+                "last_latency_ms": None if last is None else _to_ms(last.latency_seconds),
+                "last_error": None if last is None else last.error,
+                "last_probe_age_seconds": (
+                    None if age_seconds is None else round(age_seconds, 3)
+                ),
+                "probe_interval_seconds": self._interval_seconds,
+            },
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self._interval_seconds)
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    if seconds is None:
+        return None
+    return round(seconds * 1000, 3)
@@ -0,0 +1,83 @@
+"""
+Path: src/infrastructure/fastapi_app/responses.py
+"""
+
+from collections.abc import AsyncIterator
+import json
+import logging
+from typing import Any
+
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.infrastructure.requests.request_timing import timed
+from src.interface_adapter.presenters.pre_serialized_json import PreSerializedJson
+from src.use_case.errors import ProxyGatewayError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def dumps_json(content: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed.
+
+    orjson rejects a few values the stdlib accepts (integers beyond 64 bits,
+    for instance); those payloads fall back to `json.dumps`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class of the proxy.
+
+    Routes return an instance directly so FastAPI skips `jsonable_encoder` and
+    response-model handling; `PreSerializedJson` bodies are sent as they are.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, PreSerializedJson):
+            return content.body
+        with timed("serialize"):
+            return dumps_json(content)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """Streams pages of items as NDJSON: one JSON document per line.
+
+    Each page becomes a single chunk as soon as it arrives, so memory stays
+    bounded by the pagination window. Once the status line has been sent an
+    upstream failure can no longer change it: the stream ends with an
+    `{"error": {...}}` line instead.
+    """
+
+    def __init__(self, pages: AsyncIterator[list[Any]], **kwargs: Any) -> None:
+        super().__init__(_ndjson_chunks(pages), media_type=NDJSON_MEDIA_TYPE, **kwargs)
+
+
+async def _ndjson_chunks(pages: AsyncIterator[list[Any]]) -> AsyncIterator[bytes]:
+    lines = 0
+    try:
+        async for items in pages:
+            if items:
+                lines += len(items)
+                yield b"".join([dumps_json(item) + b"\n" for item in items])
+    except ProxyGatewayError as error:
+        logger.warning(
+            "ndjson_stream_aborted status_code=%s lines_sent=%s detail=%s",
+            error.status_code,
+            lines,
+            error.detail,
+        )
+        yield dumps_json(
+            {"error": {"status_code": error.status_code, "detail": error.detail}}
+        ) + b"\n"
@@ -0,0 +1,97 @@
+"""
+Path: src/infrastructure/fastapi_app/route_index.py
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import hashlib
+from typing import Any
+
+from src.infrastructure.fastapi_app.responses import dumps_json
+
+
+@dataclass(frozen=True)
+class RouteIndex:
+    """The `/` listing rendered once: JSON and HTML bodies with their ETags."""
+
+    json_body: bytes
+    json_etag: str
+    html_body: bytes
+    html_etag: str
+
+
+def build_route_index(routes: Iterable[Any]) -> RouteIndex:
+    endpoints: list[dict[str, object]] = []
+    for route in routes:
+        methods = sorted(
+            method
+            for method in (getattr(route, "methods", set()) or set())
+            if method not in {"HEAD", "OPTIONS"}
+        )
+        path = getattr(route, "path", None)
+        if not path:
+            continue
+        endpoints.append({"path": path, "methods": methods})
+
+    endpoints.sort(key=lambda item: str(item["path"]))
+    json_body = dumps_json({"count": len(endpoints), "endpoints": endpoints})
+    html_body = _render_html(endpoints).encode("utf-8")
+    return RouteIndex(
+        json_body=json_body,
+        json_etag=_etag(json_body),
+        html_body=html_body,
+        html_etag=_etag(html_body),
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    # Compression turns the ETag weak; weak comparison applies to GET.
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _render_html(endpoints: list[dict[str, object]]) -> str:
+    lines = []
+    for item in endpoints:
+        methods = ", ".join(item["methods"]) if item["methods"] else "-"
+        path = str(item["path"])
+        href = _human_href(path)
+        lines.append(
+            f"<li><code>{methods}</code> "
+            f"<a href='{href}'><code>{path}</code></a></li>"
+        )
+
+    return (
+        "<!doctype html><html><head><meta charset='utf-8'>"
+        "<title>Endpoints</title>"
+        "<style>"
+        "body{font-family:Arial,sans-serif;max-width:900px;margin:32px auto;padding:0 16px;}"
+        "code{background:#f3f4f6;padding:2px 6px;border-radius:4px;}"
+        "li{margin:10px 0;}h1{margin-bottom:8px;}p{color:#444;}a{text-decoration:none;}"
+        "</style></head><body>"
+        "<h1>Endpoints disponibles</h1>"
+        "<p>Vista humana. Para formato JSON usa <code>/?format=json</code>.</p>"
+        "<p>Los links usan <code>account_id=1</code> por defecto.</p>"
+        f"<p>Total: <strong>{len(endpoints)}</strong></p>"
+        "<ul>"
+        + "".join(lines)
+        + "</ul></body></html>"
+    )
+
+
+def _human_href(path: str) -> str:
+    href = (
+        path.replace("{account_id}", "1")
+        .replace("{id}", "21")
+        .replace("{inbox_id}", "2")
+        .replace("{conversation_id}", "321")
+    )
+    if ("contacts" in href or "conversations" in href) and "{id}" not in path and "?" not in href:
+        href = f"{href}?page=1"
+    return href
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
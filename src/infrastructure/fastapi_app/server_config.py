@@ -0,0 +1,101 @@
+"""
+Path: src/infrastructure/fastapi_app/server_config.py
+"""
+
+from dataclasses import dataclass
+from importlib.util import find_spec
+import os
+
+APP_IMPORT_PATH = "src.infrastructure.fastapi_app.app:app"
+
+# Longer than the 60 s idle timeout of common load balancers, so the proxy
+# is never the side that drops a pooled connection mid-request.
+PRODUCTION_KEEP_ALIVE_SECONDS = 75
+DEVELOPMENT_KEEP_ALIVE_SECONDS = 5
+DEFAULT_BACKLOG = 2048
+# Per worker. Well above admission control's limits (in flight + queue), so
+# uvicorn only refuses connections the proxy could not have admitted anyway.
+PRODUCTION_LIMIT_CONCURRENCY = 512
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    host: str
+    port: int
+    production: bool = False
+    reload: bool = False
+    workers: int = 1
+    loop: str = "auto"
+    http: str = "auto"
+    timeout_keep_alive: int = DEVELOPMENT_KEEP_ALIVE_SECONDS
+    backlog: int = DEFAULT_BACKLOG
+    limit_concurrency: int | None = None
+    access_log: bool = True
+
+    def uvicorn_kwargs(self) -> dict[str, object]:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "reload": self.reload,
+            # uvicorn ignores `workers` with reload; only pass it when it matters.
+            "workers": None if self.reload else self.workers,
+            "loop": self.loop,
+            "http": self.http,
+            "timeout_keep_alive": self.timeout_keep_alive,
+            "backlog": self.backlog,
+            "limit_concurrency": self.limit_concurrency,
+            "access_log": self.access_log,
+        }
+
+
+def build_server_config(
+    host: str,
+    port: int,
+    reload_enabled: bool = False,
+    production: bool = False,
+    workers: int | None = None,
+    timeout_keep_alive: int | None = None,
+    backlog: int | None = None,
+    limit_concurrency: int | None = None,
+) -> ServerConfig:
+    """Development keeps uvicorn's defaults; production tunes for throughput."""
+    if production and reload_enabled:
+        raise ValueError("--reload no es compatible con --production")
+    if not production:
+        return ServerConfig(
+            host=host,
+            port=port,
+            reload=reload_enabled,
+            workers=workers or 1,
+            timeout_keep_alive=timeout_keep_alive or DEVELOPMENT_KEEP_ALIVE_SECONDS,
+            backlog=backlog or DEFAULT_BACKLOG,
+            limit_concurrency=limit_concurrency,
+        )
+    return ServerConfig(
+        host=host,
+        port=port,
+        production=True,
+        workers=workers or default_worker_count(),
+        loop=fastest_loop(),
+        http=fastest_http_parser(),
+        timeout_keep_alive=timeout_keep_alive or PRODUCTION_KEEP_ALIVE_SECONDS,
+        backlog=backlog or DEFAULT_BACKLOG,
+        limit_concurrency=limit_concurrency or PRODUCTION_LIMIT_CONCURRENCY,
+        # One log line per request costs more than serving a cached response.
+        access_log=False,
+    )
+
+
+def default_worker_count() -> int:
+    """One worker per core this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def fastest_loop() -> str:
+    return "uvloop" if find_spec("uvloop") is not None else "asyncio"
+
+
+def fastest_http_parser() -> str:
+    return "httptools" if find_spec("httptools") is not None else "h11"
@@ -0,0 +1,52 @@
+"""
+Path: src/infrastructure/fastapi_app/server_timing.py
+"""
+
+from collections.abc import Callable
+import random
+import time
+from typing import Any
+
+from src.infrastructure.requests.request_timing import (
+    end_request_timing,
+    start_request_timing,
+)
+
+
+class ServerTimingMiddleware:
+    """Adds a `Server-Timing` header to a sample of HTTP responses.
+
+    Phases (upstream, decode, sanitize, serialize) are collected by the code
+    doing the work through the request-scoped timing context; `app` is the
+    time from receiving the request to sending the response headers.
+    `sample_rate` 0 disables it, 1 times every request.
+    """
+
+    def __init__(self, app: Any, sample_rate_provider: Callable[[], float]) -> None:
+        self.app = app
+        self._sample_rate_provider = sample_rate_provider
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        sample_rate = self._sample_rate_provider()
+        if scope["type"] != "http" or sample_rate <= 0 or random.random() >= sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timing, token = start_request_timing()
+
+        async def send_with_timing(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                value = ", ".join(
+                    part for part in (timing.server_timing(), f"app;dur={elapsed_ms:.1f}") if part
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", value.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_timing(token)
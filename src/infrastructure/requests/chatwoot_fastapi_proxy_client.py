@@ -2,12 +2,33 @@
 Path: src/infrastructure/requests/chatwoot_fastapi_proxy_client.py
 """
 
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
 import logging
+import time
 from typing import Any
 
 from src.infrastructure.requests.chatwoot_inbox_mapper import map_to_inbox
+from src.infrastructure.requests.conditional_requests import (
+    NOT_MODIFIED,
+    ConditionalRequestStats,
+    ConditionalRequestStore,
+)
+from src.infrastructure.requests.contact_conversation_index import ContactConversationIndex
+from src.infrastructure.requests.cpu_offload import (
+    DEFAULT_OFFLOAD_THRESHOLD_BYTES,
+    CpuOffloader,
+    CpuOffloadStats,
+    response_size_bytes,
+)
+from src.infrastructure.requests.conversations_payload_mapper import (
+    extract_conversation_items,
+    extract_conversations_total_count,
+    extract_message_items,
+)
 from src.infrastructure.requests.http_transport import (
     AsyncHttpTransport,
+    ConnectionPoolStats,
     HttpResponse,
     HttpTimeoutError,
     HttpTlsError,
@@ -15,18 +36,44 @@ from src.infrastructure.requests.http_transport import (
     HttpxAsyncTransport,
 )
 from src.infrastructure.requests.inboxes_payload_mapper import normalize_inboxes_payload
+from src.infrastructure.requests.request_timing import timed
+from src.infrastructure.requests.response_cache import ResponseCache, ResponseCacheStats
+from src.infrastructure.requests.sanitization_plans import (
+    CONVERSATION_PLAN,
+    INBOX_PLAN,
+    MESSAGE_PLAN,
+)
 from src.infrastructure.requests.sensitive_data_sanitizer import (
-    sanitize_conversation_payload,
-    sanitize_payload,
+    sanitize_conversation_payload_in_place,
 )
+from src.infrastructure.requests.single_flight import SingleFlight, SingleFlightStats
+from src.infrastructure.requests.upstream_metrics import UpstreamMetrics
 from src.infrastructure.settings.env_settings import ChatwootSettings
 from src.use_case.chatwoot_contacts_query import (
-    fetch_all_contacts_paginated_async,
+    fetch_all_contacts_concurrently_async,
     find_contact_in_paginated_contacts_async,
+    iter_all_contacts_concurrently_async,
 )
+from src.use_case.concurrent_pagination import fetch_all_pages_concurrently_async
+from src.use_case.cursor_pagination import fetch_all_pages_by_cursor_async
 from src.use_case.errors import ProxyGatewayError
+from src.use_case.field_projection import (
+    FieldTree,
+    format_fields,
+    project_payload_items,
+    project_value,
+)
 
 PAGE_SIZE = 15
+CONVERSATIONS_PAGE_SIZE = 25
+DEFAULT_PAGE_CONCURRENCY = 4
+DEFAULT_BATCH_CONCURRENCY = 8
+MAX_BATCH_CONVERSATIONS = 100
+BATCH_RESOURCES = ("conversation", "messages")
+# Answers that mean "this route does not exist upstream". Chatwoot (Rails)
+# answers an unknown route with a 404 HTML page, while a missing record is a
+# 404 with a JSON error body such as {"error": "Resource could not be found"}.
+ENDPOINT_UNAVAILABLE_STATUS_CODES = {405, 501}
 logger = logging.getLogger(__name__)
 
 
@@ -34,14 +81,58 @@ class ChatwootProxyError(ProxyGatewayError):
     pass
 
 
+class ChatwootEndpointUnavailableError(ChatwootProxyError):
+    """Chatwoot does not serve the route at all (older versions, disabled APIs)."""
+
+
 class ChatwootFastApiProxyClient:
     def __init__(
         self,
         settings: ChatwootSettings,
         transport: AsyncHttpTransport | None = None,
+        single_flight: SingleFlight | None = None,
+        cache: ResponseCache | None = None,
+        conditional_store: ConditionalRequestStore | None = None,
+        conversation_index: ContactConversationIndex | None = None,
+        max_page_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        max_batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        offload_threshold_bytes: int = DEFAULT_OFFLOAD_THRESHOLD_BYTES,
     ) -> None:
         self._settings = settings
         self._transport = transport or HttpxAsyncTransport()
+        self._single_flight = single_flight or SingleFlight()
+        self._cache = cache
+        self._conditional_store = conditional_store or ConditionalRequestStore()
+        self._conversation_index = conversation_index or ContactConversationIndex()
+        self._max_page_concurrency = max_page_concurrency
+        self._max_batch_concurrency = max(1, max_batch_concurrency)
+        self._cpu_offloader = CpuOffloader(offload_threshold_bytes)
+        self._upstream_metrics = UpstreamMetrics()
+
+    def single_flight_stats(self) -> SingleFlightStats:
+        return self._single_flight.stats()
+
+    def cache_stats(self) -> ResponseCacheStats | None:
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
+    def conditional_request_stats(self) -> ConditionalRequestStats:
+        return self._conditional_store.stats()
+
+    def cpu_offload_stats(self) -> CpuOffloadStats:
+        return self._cpu_offloader.stats()
+
+    def upstream_metrics(self) -> UpstreamMetrics:
+        return self._upstream_metrics
+
+    def connection_pool_stats(self) -> ConnectionPoolStats | None:
+        pool_stats = getattr(self._transport, "pool_stats", None)
+        return pool_stats() if callable(pool_stats) else None
+
+    async def probe_upstream(self) -> None:
+        """One uncached call to Chatwoot; raises ChatwootProxyError if it fails."""
+        await self._forward_get(self._settings.account_id, "inboxes")
 
     def enforce_account_id(self, account_id: int) -> None:
         if account_id != self._settings.account_id:
@@ -54,21 +145,18 @@ class ChatwootFastApiProxyClient:
             )
 
     async def get_inboxes(self, account_id: int) -> Any:
-        response = await self._forward_get(account_id=account_id, resource="inboxes")
-        payload = self._parse_json(response)
-        inboxes = normalize_inboxes_payload(payload)
-        if inboxes is None:
-            logger.error(
-                "inboxes_invalid_payload payload_type=%s",
-                type(payload).__name__,
-            )
-            raise ChatwootProxyError(
-                status_code=502,
-                detail="Formato inesperado de Chatwoot para listado de inboxes",
-            )
-        sanitized_inboxes = [sanitize_payload(inbox) for inbox in inboxes]
-        mapped_inboxes = [map_to_inbox(inbox) for inbox in sanitized_inboxes]
-        return [inbox.raw for inbox in mapped_inboxes]
+        return await self._cached(
+            "inboxes",
+            (account_id,),
+            lambda: self._load_inboxes(account_id),
+        )
+
+    async def _load_inboxes(self, account_id: int) -> Any:
+        return await self._get_json(
+            account_id=account_id,
+            resource="inboxes",
+            transform=self._sanitize_inboxes,
+        )
 
     async def get_inbox_by_id(self, account_id: int, inbox_id: int) -> dict[str, Any]:
         logger.info(
@@ -107,7 +195,11 @@ class ChatwootFastApiProxyClient:
             page = "1"
 
         if page.lower() == "all":
-            return await self._get_contacts_all(account_id)
+            return await self._cached(
+                "contacts",
+                (account_id, "all"),
+                lambda: self._get_contacts_all(account_id),
+            )
 
         try:
             numeric_page = int(page)
@@ -119,12 +211,14 @@ class ChatwootFastApiProxyClient:
                 detail="Invalid page value. Use a number >= 1 or 'all'.",
             ) from exc
 
-        response = await self._forward_get(
+        return await self._get_contacts_page(account_id, numeric_page)
+
+    async def _load_contacts_page(self, account_id: int, numeric_page: int) -> dict[str, Any]:
+        payload = await self._get_json(
             account_id=account_id,
             resource="contacts",
             params={"page": numeric_page},
         )
-        payload = self._parse_json(response)
         if isinstance(payload, dict):
             return payload
         return {
@@ -161,6 +255,19 @@ class ChatwootFastApiProxyClient:
         if page is None:
             page = "1"
 
+        filters: dict[str, Any] = {}
+        if status is not None and status.strip():
+            filters["status"] = status.strip()
+        if inbox_id is not None:
+            filters["inbox_id"] = inbox_id
+
+        if page.lower() == "all":
+            return await self._cached(
+                "conversations",
+                (account_id, "all", tuple(sorted(filters.items()))),
+                lambda: self._get_conversations_all(account_id, filters),
+            )
+
         try:
             numeric_page = int(page)
             if numeric_page < 1:
@@ -168,21 +275,28 @@ class ChatwootFastApiProxyClient:
         except ValueError as exc:
             raise ChatwootProxyError(
                 status_code=422,
-                detail="Invalid page value. Use a number >= 1.",
+                detail="Invalid page value. Use a number >= 1 or 'all'.",
             ) from exc
 
-        params: dict[str, Any] = {"page": numeric_page}
-        if status is not None and status.strip():
-            params["status"] = status.strip()
-        if inbox_id is not None:
-            params["inbox_id"] = inbox_id
+        params: dict[str, Any] = {"page": numeric_page, **filters}
+        return await self._cached(
+            "conversations",
+            (account_id, tuple(sorted(params.items()))),
+            lambda: self._load_conversations(account_id, params),
+        )
 
-        response = await self._forward_get(
+    async def _load_conversations(
+        self,
+        account_id: int,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        numeric_page = params["page"]
+        payload = await self._get_json(
             account_id=account_id,
             resource="conversations",
             params=params,
         )
-        payload = self._parse_json(response)
+        self._conversation_index.record(extract_conversation_items(payload))
         if isinstance(payload, dict):
             return payload
         return {
@@ -199,27 +313,94 @@ class ChatwootFastApiProxyClient:
         account_id: int,
         conversation_id: int,
     ) -> dict[str, Any]:
-        response = await self._forward_get(
+        return await self._cached(
+            "conversation",
+            (account_id, conversation_id),
+            lambda: self._load_conversation(account_id, conversation_id),
+        )
+
+    async def _load_conversation(
+        self,
+        account_id: int,
+        conversation_id: int,
+    ) -> dict[str, Any]:
+        payload = await self._get_json(
             account_id=account_id,
             resource=f"conversations/{conversation_id}",
+            transform=self._sanitize_conversation_detail,
         )
-        payload = self._parse_json(response)
-        if not isinstance(payload, dict):
-            raise ChatwootProxyError(
-                status_code=502,
-                detail="Formato inesperado de Chatwoot para detalle de conversacion",
+        self._conversation_index.record([payload])
+        return {"payload": payload}
+
+    async def get_contact_conversations(
+        self,
+        account_id: int,
+        contact_id: int,
+    ) -> dict[str, Any]:
+        return await self._cached(
+            "contact_conversations",
+            (account_id, contact_id),
+            lambda: self._load_contact_conversations(account_id, contact_id),
+        )
+
+    async def _load_contact_conversations(
+        self,
+        account_id: int,
+        contact_id: int,
+    ) -> dict[str, Any]:
+        try:
+            conversations = await self._get_json(
+                account_id=account_id,
+                resource=f"contacts/{contact_id}/conversations",
+                transform=self._sanitize_contact_conversations,
             )
+            source = "chatwoot"
+            self._conversation_index.record(conversations)
+        except ChatwootEndpointUnavailableError as error:
+            # A missing contact is a plain ChatwootProxyError(404) and propagates.
+            logger.info(
+                "contact_conversations_index_fallback account_id=%s contact_id=%s "
+                "upstream_status=%s indexed_conversations=%s",
+                account_id,
+                contact_id,
+                error.status_code,
+                len(self._conversation_index),
+            )
+            # Summaries hold only ids, status and timestamps: nothing to sanitize.
+            conversations = self._conversation_index.conversations_for(contact_id)
+            source = "index"
 
-        return {"payload": sanitize_conversation_payload(payload)}
+        return {
+            "payload": conversations,
+            "meta": {
+                "count": len(conversations),
+                "contact_id": contact_id,
+                "account_id": account_id,
+                "source": source,
+            },
+        }
 
     async def get_conversation_messages(
         self,
         account_id: int,
         conversation_id: int,
         page: str | None,
+        projection: FieldTree | None = None,
     ) -> dict[str, Any]:
         if page is None:
             page = "1"
+        fields_key = None if projection is None else format_fields(projection)
+
+        if page.lower() == "all":
+            return await self._cached(
+                "messages",
+                (account_id, conversation_id, "all", fields_key),
+                lambda: self._get_conversation_messages_all(
+                    account_id,
+                    conversation_id,
+                    projection,
+                ),
+            )
 
         try:
             numeric_page = int(page)
@@ -228,39 +409,202 @@ class ChatwootFastApiProxyClient:
         except ValueError as exc:
             raise ChatwootProxyError(
                 status_code=422,
-                detail="Invalid page value. Use a number >= 1.",
+                detail="Invalid page value. Use a number >= 1 or 'all'.",
             ) from exc
 
-        response = await self._forward_get(
+        return await self._cached(
+            "messages",
+            (account_id, conversation_id, numeric_page, fields_key),
+            lambda: self._load_conversation_messages(
+                account_id,
+                conversation_id,
+                numeric_page,
+                projection,
+            ),
+        )
+
+    async def _load_conversation_messages(
+        self,
+        account_id: int,
+        conversation_id: int,
+        numeric_page: int,
+        projection: FieldTree | None = None,
+    ) -> dict[str, Any]:
+        return await self._get_json(
             account_id=account_id,
             resource=f"conversations/{conversation_id}/messages",
             params={"page": numeric_page},
+            transform=self._sanitize_messages_page,
+            projection=projection,
         )
-        payload = self._parse_json(response)
-        if not isinstance(payload, dict):
+
+    async def get_conversations_batch(
+        self,
+        account_id: int,
+        conversation_ids: list[int],
+        resources: list[str] | None,
+        messages_page: str | None,
+    ) -> dict[str, Any]:
+        unique_ids = list(dict.fromkeys(conversation_ids))
+        if not unique_ids:
             raise ChatwootProxyError(
-                status_code=502,
-                detail="Formato inesperado de Chatwoot para mensajes de conversacion",
+                status_code=422,
+                detail="conversation_ids no puede estar vacio.",
+            )
+        if len(unique_ids) > MAX_BATCH_CONVERSATIONS:
+            raise ChatwootProxyError(
+                status_code=422,
+                detail=f"Maximo {MAX_BATCH_CONVERSATIONS} conversaciones por batch.",
             )
 
-        data = payload.get("payload")
-        if isinstance(data, list):
-            payload["payload"] = [sanitize_conversation_payload(item) for item in data]
-        else:
-            payload["payload"] = sanitize_conversation_payload(data)
+        requested = list(dict.fromkeys(resources or ["conversation"]))
+        unknown = [resource for resource in requested if resource not in BATCH_RESOURCES]
+        if unknown:
+            raise ChatwootProxyError(
+                status_code=422,
+                detail=(
+                    f"Recursos no soportados en batch: {', '.join(unknown)}. "
+                    f"Usa: {', '.join(BATCH_RESOURCES)}."
+                ),
+            )
 
-        if "meta" in payload:
-            payload["meta"] = sanitize_conversation_payload(payload.get("meta"))
+        semaphore = asyncio.Semaphore(self._max_batch_concurrency)
+
+        async def fetch_item(conversation_id: int, resource: str) -> tuple[int, Any, str | None]:
+            async with semaphore:
+                try:
+                    if resource == "conversation":
+                        result = await self.get_conversation_by_id(
+                            account_id=account_id,
+                            conversation_id=conversation_id,
+                        )
+                    else:
+                        result = await self.get_conversation_messages(
+                            account_id=account_id,
+                            conversation_id=conversation_id,
+                            page=messages_page,
+                        )
+                except ChatwootProxyError as error:
+                    return error.status_code, None, error.detail
+                return 200, result, None
+
+        jobs = [
+            (conversation_id, resource)
+            for conversation_id in unique_ids
+            for resource in requested
+        ]
+        outcomes = await asyncio.gather(
+            *(fetch_item(conversation_id, resource) for conversation_id, resource in jobs)
+        )
 
-        return payload
+        results: dict[str, dict[str, Any]] = {}
+        statuses: dict[str, dict[str, int]] = {}
+        errors: dict[str, dict[str, str]] = {}
+        failed = 0
+        for (conversation_id, resource), (status_code, result, detail) in zip(jobs, outcomes):
+            item_key = str(conversation_id)
+            statuses.setdefault(item_key, {})[resource] = status_code
+            if detail is None:
+                results.setdefault(item_key, {})[resource] = result
+            else:
+                failed += 1
+                errors.setdefault(item_key, {})[resource] = detail
+
+        return {
+            "results": results,
+            "status": statuses,
+            "errors": errors,
+            "meta": {
+                "count": len(jobs),
+                "ok": len(jobs) - failed,
+                "failed": failed,
+                "conversation_ids": unique_ids,
+                "resources": requested,
+                "account_id": account_id,
+            },
+        }
+
+    async def _get_conversations_all(
+        self,
+        account_id: int,
+        filters: dict[str, Any],
+    ) -> dict[str, Any]:
+        try:
+            conversations = await fetch_all_pages_concurrently_async(
+                fetch_page=lambda page_number: self._load_conversations(
+                    account_id, {"page": page_number, **filters}
+                ),
+                extract_items=extract_conversation_items,
+                extract_total_count=extract_conversations_total_count,
+                page_size=CONVERSATIONS_PAGE_SIZE,
+                max_concurrency=self._max_page_concurrency,
+            )
+        except ValueError as exc:
+            raise ChatwootProxyError(status_code=502, detail=str(exc)) from exc
+
+        return {
+            "payload": conversations,
+            "meta": {
+                "count": len(conversations),
+                "current_page": "all",
+                "account_id": account_id,
+                **filters,
+            },
+        }
+
+    async def _get_conversation_messages_all(
+        self,
+        account_id: int,
+        conversation_id: int,
+        projection: FieldTree | None = None,
+    ) -> dict[str, Any]:
+        # The cursor is the oldest message id, so pages keep `id` until the end.
+        page_projection = None if projection is None else {**projection, "id": None}
+        # Chatwoot pages messages with a `before=<message_id>` cursor and
+        # ignores `page`, so the walk is sequential from the newest page.
+        messages = await fetch_all_pages_by_cursor_async(
+            fetch_page=lambda before: self._load_conversation_messages_before(
+                account_id, conversation_id, before, page_projection
+            ),
+            extract_items=extract_message_items,
+            extract_item_id=_message_id,
+        )
+        if projection is not None and "id" not in projection:
+            messages = project_value(messages, projection)
+
+        return {
+            "payload": messages,
+            "meta": {
+                "count": len(messages),
+                "current_page": "all",
+                "conversation_id": conversation_id,
+                "account_id": account_id,
+            },
+        }
+
+    async def _load_conversation_messages_before(
+        self,
+        account_id: int,
+        conversation_id: int,
+        before: int | None,
+        projection: FieldTree | None = None,
+    ) -> dict[str, Any]:
+        return await self._get_json(
+            account_id=account_id,
+            resource=f"conversations/{conversation_id}/messages",
+            params=None if before is None else {"before": before},
+            transform=self._sanitize_messages_page,
+            projection=projection,
+        )
 
     async def _get_contacts_all(self, account_id: int) -> dict[str, Any]:
         try:
-            contacts = await fetch_all_contacts_paginated_async(
+            contacts = await fetch_all_contacts_concurrently_async(
                 fetch_page=lambda page_number: self._get_contacts_page(
                     account_id=account_id, page_number=page_number
                 ),
                 page_size=PAGE_SIZE,
+                max_concurrency=self._max_page_concurrency,
             )
         except ValueError as exc:
             raise ChatwootProxyError(status_code=502, detail=str(exc)) from exc
@@ -274,43 +618,137 @@ class ChatwootFastApiProxyClient:
             },
         }
 
+    async def stream_contacts_all(self, account_id: int) -> AsyncGenerator[list[Any], None]:
+        """Contacts of every page, one list per upstream page.
+
+        Contacts are passed through as Chatwoot returns them, exactly as in
+        `get_contacts`; no sanitization plan applies to them.
+
+        Unlike `get_contacts(page="all")` nothing is accumulated or cached as
+        a whole: each page is yielded as soon as it (and the pages before it)
+        arrived. Errors fetching the first page are raised before any yield.
+        """
+        pages = iter_all_contacts_concurrently_async(
+            fetch_page=lambda page_number: self._get_contacts_page(
+                account_id=account_id, page_number=page_number
+            ),
+            page_size=PAGE_SIZE,
+            max_concurrency=self._max_page_concurrency,
+        )
+        try:
+            async for contacts in pages:
+                yield contacts
+        except ValueError as exc:
+            raise ChatwootProxyError(status_code=502, detail=str(exc)) from exc
+        finally:
+            await pages.aclose()
+
     async def _get_contacts_page(self, account_id: int, page_number: int) -> dict[str, Any]:
-        response = await self._forward_get(
-            account_id=account_id,
-            resource="contacts",
-            params={"page": page_number},
+        # One cache entry per page, shared by `page=N`, `page=all`, the stream,
+        # contact lookups and the startup warm-up.
+        return await self._cached(
+            "contacts",
+            (account_id, page_number),
+            lambda: self._load_contacts_page(account_id, page_number),
         )
-        payload = self._parse_json(response)
-        if not isinstance(payload, dict):
-            raise ChatwootProxyError(
-                status_code=502,
-                detail="Formato inesperado de Chatwoot para listado de contactos",
+
+    async def _cached(
+        self,
+        resource: str,
+        key: tuple[Any, ...],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        if self._cache is None:
+            return await loader()
+        return await self._cache.get_or_load(resource, key, loader)
+
+    async def _get_json(
+        self,
+        account_id: int,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        projection: FieldTree | None = None,
+    ) -> Any:
+        url = self._build_url(account_id, resource)
+        key = ConditionalRequestStore.build_key(url, params)
+        if projection is not None:
+            # Each selection is its own payload, for 304s and coalescing alike.
+            key = (key, format_fields(projection))
+
+        async def load() -> Any:
+            validated = self._conditional_store.lookup(key)
+            response = await self._forward_get(
+                account_id=account_id,
+                resource=resource,
+                params=params,
+                extra_headers=ConditionalRequestStore.conditional_headers(validated),
             )
-        return payload
+            if response.status_code == NOT_MODIFIED and validated is not None:
+                self._conditional_store.mark_revalidated(key)
+                return validated.payload
+
+            def decode() -> Any:
+                with timed("decode"):
+                    decoded = self._parse_json(response)
+                # The freshly decoded payload is owned by this load only, so
+                # transforms may sanitize it in place instead of copying it.
+                if projection is not None:
+                    # Before the transform, so unrequested fields are never sanitized.
+                    decoded = project_payload_items(decoded, projection)
+                if transform is not None:
+                    with timed("sanitize"):
+                        decoded = transform(decoded)
+                return decoded
+
+            # Large pages are decoded and sanitized off the event loop.
+            payload = await self._cpu_offloader.run(
+                response_size_bytes(response),
+                decode,
+                label=resource,
+            )
+            self._conditional_store.remember(key, response.headers, payload)
+            return payload
+
+        return await self._single_flight.run(key, load)
+
+    def _build_url(self, account_id: int, resource: str) -> str:
+        return f"{self._settings.base_url}/api/v1/accounts/{account_id}/{resource}"
 
     async def _forward_get(
         self,
         account_id: int,
         resource: str,
         params: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
     ) -> HttpResponse:
-        url = f"{self._settings.base_url}/api/v1/accounts/{account_id}/{resource}"
+        url = self._build_url(account_id, resource)
         headers = {"api_access_token": self._settings.api_access_token}
+        if extra_headers:
+            headers.update(extra_headers)
 
+        metrics = self._upstream_metrics
+        outcome = "network_error"
+        started = time.perf_counter()
+        metrics.in_flight += 1
         try:
-            response = await self._transport.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=self._settings.timeout_seconds,
-                verify=self._settings.tls_verify,
-            )
+            with timed("upstream"):
+                response = await self._transport.get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    timeout=self._settings.timeout_seconds,
+                    verify=self._settings.tls_verify,
+                )
+            outcome = str(response.status_code)
         except HttpTimeoutError as exc:
+            outcome = "timeout"
             raise ChatwootProxyError(
                 status_code=504,
                 detail=f"Timeout consultando Chatwoot: {exc}",
             ) from exc
         except HttpTlsError as exc:
+            outcome = "tls_error"
             raise ChatwootProxyError(
                 status_code=502,
                 detail=f"Error TLS/SSL con Chatwoot: {exc}",
@@ -320,6 +758,9 @@ class ChatwootFastApiProxyClient:
                 status_code=502,
                 detail=f"Error de red consultando Chatwoot: {exc}",
             ) from exc
+        finally:
+            metrics.in_flight -= 1
+            metrics.record(resource, outcome, time.perf_counter() - started)
 
         if response.status_code >= 400:
             logger.warning(
@@ -328,12 +769,74 @@ class ChatwootFastApiProxyClient:
                 resource,
                 account_id,
             )
-            raise ChatwootProxyError(
+            error_type = (
+                ChatwootEndpointUnavailableError
+                if _is_unavailable_endpoint(response)
+                else ChatwootProxyError
+            )
+            raise error_type(
                 status_code=response.status_code,
                 detail="Chatwoot respondio con error.",
             )
         return response
 
+    @staticmethod
+    def _sanitize_inboxes(payload: Any) -> list[Any]:
+        inboxes = normalize_inboxes_payload(payload)
+        if inboxes is None:
+            logger.error(
+                "inboxes_invalid_payload payload_type=%s",
+                type(payload).__name__,
+            )
+            raise ChatwootProxyError(
+                status_code=502,
+                detail="Formato inesperado de Chatwoot para listado de inboxes",
+            )
+        sanitized_inboxes = [INBOX_PLAN.apply_in_place(inbox) for inbox in inboxes]
+        mapped_inboxes = [map_to_inbox(inbox) for inbox in sanitized_inboxes]
+        return [inbox.raw for inbox in mapped_inboxes]
+
+    @staticmethod
+    def _sanitize_conversation_detail(payload: Any) -> dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise ChatwootProxyError(
+                status_code=502,
+                detail="Formato inesperado de Chatwoot para detalle de conversacion",
+            )
+        return CONVERSATION_PLAN.apply_in_place(payload)
+
+    @staticmethod
+    def _sanitize_contact_conversations(payload: Any) -> list[Any]:
+        if not isinstance(payload, (dict, list)):
+            raise ChatwootProxyError(
+                status_code=502,
+                detail="Formato inesperado de Chatwoot para conversaciones del contacto",
+            )
+        return [
+            CONVERSATION_PLAN.apply_in_place(item)
+            for item in extract_conversation_items(payload)
+        ]
+
+    @staticmethod
+    def _sanitize_messages_page(payload: Any) -> dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise ChatwootProxyError(
+                status_code=502,
+                detail="Formato inesperado de Chatwoot para mensajes de conversacion",
+            )
+
+        result = dict(payload)
+        data = payload.get("payload")
+        if isinstance(data, list):
+            result["payload"] = [MESSAGE_PLAN.apply_in_place(item) for item in data]
+        else:
+            result["payload"] = sanitize_conversation_payload_in_place(data)
+
+        if "meta" in payload:
+            result["meta"] = sanitize_conversation_payload_in_place(payload.get("meta"))
+
+        return result
+
     @staticmethod
     def _parse_json(response: HttpResponse) -> Any:
         try:
@@ -345,4 +848,26 @@ class ChatwootFastApiProxyClient:
                     "Chatwoot devolvio una respuesta no-JSON. "
                     f"status={response.status_code}"
                 ),
-            ) from exc
+            ) from exc
+
+
+def _message_id(message: Any) -> int | None:
+    if not isinstance(message, dict):
+        return None
+    try:
+        return int(message.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_unavailable_endpoint(response: HttpResponse) -> bool:
+    if response.status_code in ENDPOINT_UNAVAILABLE_STATUS_CODES:
+        return True
+    if response.status_code != 404:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return True
+    # Record lookups fail with a JSON object; anything else is the routing 404.
+    return not isinstance(body, dict)
@@ -4,7 +4,12 @@ from collections.abc import Callable
 
 from src.entities.chatwoot_connection_result import ChatwootConnectionResult
 from src.entities.chatwoot_contacts_result import ChatwootContactsResult, ContactRow
+from src.infrastructure.requests.conditional_requests import (
+    NOT_MODIFIED,
+    ConditionalRequestStore,
+)
 from src.infrastructure.requests.http_transport import (
+    DecodedJsonResponse,
     HttpConnectionError,
     HttpResponse,
     HttpTimeoutError,
@@ -25,9 +30,11 @@ class ChatwootRequestsGateway:
         self,
         settings: ChatwootSettings,
         transport: SyncHttpTransport | None = None,
+        conditional_store: ConditionalRequestStore | None = None,
     ) -> None:
         self._settings = settings
         self._transport = transport or HttpxSyncTransport()
+        self._conditional_store = conditional_store or ConditionalRequestStore()
 
     def validate_connection(self) -> ChatwootConnectionResult:
         endpoint = self._build_endpoint("inboxes")
@@ -241,6 +248,9 @@ class ChatwootRequestsGateway:
         network_diag = f"{dns_detail}; {tcp_detail}"
 
         headers = {"api_access_token": self._settings.api_access_token}
+        conditional_key = ConditionalRequestStore.build_key(endpoint, params)
+        validated = self._conditional_store.lookup(conditional_key)
+        headers.update(ConditionalRequestStore.conditional_headers(validated))
 
         try:
             response = self._transport.get(
@@ -250,6 +260,16 @@ class ChatwootRequestsGateway:
                 timeout=self._settings.timeout_seconds,
                 verify=self._settings.tls_verify,
             )
+            if response.status_code == NOT_MODIFIED and validated is not None:
+                self._conditional_store.mark_revalidated(conditional_key)
+                return validated.payload, network_diag, None
+            if 200 <= response.status_code <= 299:
+                # Keep the decoded payload, not the response: a 304 then costs
+                # no parsing, and callers get the same already decoded body.
+                decoded = DecodedJsonResponse.decode(response)
+                if decoded is not None:
+                    self._conditional_store.remember(conditional_key, response.headers, decoded)
+                    return decoded, network_diag, None
             return response, network_diag, None
         except HttpTlsError as exc:
             return (
@@ -382,4 +402,4 @@ class ChatwootRequestsGateway:
                 "Chatwoot respondio con estado no esperado. "
                 f"Body parcial: {response.text[:180]}. ({network_diag})"
             ),
-        )
+        )
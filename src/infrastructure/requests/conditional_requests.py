@@ -0,0 +1,107 @@
+"""
+Path: src/infrastructure/requests/conditional_requests.py
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class ValidatedEntry:
+    etag: str | None
+    last_modified: str | None
+    payload: Any
+
+
+@dataclass(frozen=True)
+class ConditionalRequestStats:
+    stored: int
+    revalidated: int
+    entries: int
+
+
+class ConditionalRequestStore:
+    """Remember upstream ETag/Last-Modified validators per request key.
+
+    The stored payload is whatever the caller derived from the full response
+    (parsed JSON, a sanitized payload, the response itself), so a `304 Not
+    Modified` can reuse it without transferring, decoding or sanitizing the
+    body again.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, ValidatedEntry] = OrderedDict()
+        self._stored = 0
+        self._revalidated = 0
+
+    @staticmethod
+    def build_key(url: str, params: Mapping[str, Any] | None) -> Hashable:
+        return (url, tuple(sorted((params or {}).items())))
+
+    def lookup(self, key: Hashable) -> ValidatedEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: ValidatedEntry | None) -> dict[str, str]:
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def remember(
+        self,
+        key: Hashable,
+        headers: Mapping[str, str],
+        payload: Any,
+    ) -> None:
+        etag = _header(headers, "etag")
+        last_modified = _header(headers, "last-modified")
+        if etag is None and last_modified is None:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = ValidatedEntry(
+            etag=etag,
+            last_modified=last_modified,
+            payload=payload,
+        )
+        self._entries.move_to_end(key)
+        self._stored += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def mark_revalidated(self, key: Hashable) -> None:
+        self._revalidated += 1
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def stats(self) -> ConditionalRequestStats:
+        return ConditionalRequestStats(
+            stored=self._stored,
+            revalidated=self._revalidated,
+            entries=len(self._entries),
+        )
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is None:
+        value = next(
+            (item for key, item in headers.items() if key.lower() == name),
+            None,
+        )
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
@@ -0,0 +1,139 @@
+"""
+Path: src/infrastructure/requests/contact_conversation_index.py
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import time
+from typing import Any
+
+DEFAULT_MAX_CONVERSATIONS = 50000
+DEFAULT_INDEX_TTL_SECONDS = 3600.0
+# Only non-sensitive scalars are kept: the index answers "which conversations
+# does this contact have", clients fetch details through the detail endpoint.
+SUMMARY_FIELDS = ("id", "inbox_id", "status", "created_at", "last_activity_at")
+
+
+class ContactConversationIndex:
+    """contact_id -> conversation ids, fed by conversation payloads seen by the proxy.
+
+    Each conversation keeps a small summary (`SUMMARY_FIELDS` plus
+    `contact_id`), never the full payload. Entries older than `ttl_seconds`
+    are dropped when read, and the least recently recorded are evicted past
+    `max_conversations`.
+    """
+
+    def __init__(
+        self,
+        max_conversations: int = DEFAULT_MAX_CONVERSATIONS,
+        ttl_seconds: float = DEFAULT_INDEX_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_conversations = max_conversations
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._conversations: OrderedDict[int, tuple[int, float, dict[str, Any]]] = OrderedDict()
+        self._by_contact: dict[int, dict[int, None]] = {}
+
+    def record(self, conversations: Iterable[Any]) -> int:
+        recorded = 0
+        now = self._clock()
+        for conversation in conversations:
+            if not isinstance(conversation, dict):
+                continue
+            conversation_id = _safe_int(conversation.get("id"))
+            contact_id = extract_contact_id(conversation)
+            if conversation_id is None or contact_id is None:
+                continue
+            self._store(conversation_id, contact_id, now, _summary(conversation, contact_id))
+            recorded += 1
+        return recorded
+
+    def conversation_ids_for(self, contact_id: int) -> list[int]:
+        self._expire(contact_id)
+        return sorted(self._by_contact.get(contact_id, {}), reverse=True)
+
+    def conversations_for(self, contact_id: int) -> list[dict[str, Any]]:
+        """Summaries of the contact's conversations, newest id first."""
+        return [
+            dict(self._conversations[conversation_id][2])
+            for conversation_id in self.conversation_ids_for(contact_id)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def _store(
+        self,
+        conversation_id: int,
+        contact_id: int,
+        recorded_at: float,
+        summary: dict[str, Any],
+    ) -> None:
+        previous = self._conversations.get(conversation_id)
+        if previous is not None and previous[0] != contact_id:
+            self._unlink(conversation_id, previous[0])
+
+        self._conversations[conversation_id] = (contact_id, recorded_at, summary)
+        self._conversations.move_to_end(conversation_id)
+        self._by_contact.setdefault(contact_id, {})[conversation_id] = None
+
+        while len(self._conversations) > self._max_conversations:
+            evicted_id, (evicted_contact_id, _, _) = self._conversations.popitem(last=False)
+            self._unlink(evicted_id, evicted_contact_id)
+
+    def _expire(self, contact_id: int) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        oldest_allowed = self._clock() - self._ttl_seconds
+        for conversation_id in list(self._by_contact.get(contact_id, {})):
+            entry = self._conversations.get(conversation_id)
+            if entry is None or entry[1] < oldest_allowed:
+                self._conversations.pop(conversation_id, None)
+                self._unlink(conversation_id, contact_id)
+
+    def _unlink(self, conversation_id: int, contact_id: int) -> None:
+        conversation_ids = self._by_contact.get(contact_id)
+        if conversation_ids is None:
+            return
+        conversation_ids.pop(conversation_id, None)
+        if not conversation_ids:
+            del self._by_contact[contact_id]
+
+
+def extract_contact_id(conversation: dict[str, Any]) -> int | None:
+    meta = conversation.get("meta")
+    if isinstance(meta, dict):
+        sender = meta.get("sender")
+        if isinstance(sender, dict):
+            sender_id = _safe_int(sender.get("id"))
+            if sender_id is not None:
+                return sender_id
+
+    contact_id = _safe_int(conversation.get("contact_id"))
+    if contact_id is not None:
+        return contact_id
+
+    contact_inbox = conversation.get("contact_inbox")
+    if isinstance(contact_inbox, dict):
+        return _safe_int(contact_inbox.get("contact_id"))
+    return None
+
+
+def _summary(conversation: dict[str, Any], contact_id: int) -> dict[str, Any]:
+    summary = {
+        field: conversation[field]
+        for field in SUMMARY_FIELDS
+        if field in conversation and not isinstance(conversation[field], (dict, list))
+    }
+    summary["contact_id"] = contact_id
+    return summary
+
+
+def _safe_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,43 @@
+"""
+Path: src/infrastructure/requests/conversations_payload_mapper.py
+"""
+
+from typing import Any
+
+
+def extract_conversation_items(payload: Any) -> list[Any]:
+    if isinstance(payload, list):
+        return payload
+    if not isinstance(payload, dict):
+        return []
+    data = payload.get("data")
+    if isinstance(data, dict) and isinstance(data.get("payload"), list):
+        return data["payload"]
+    items = payload.get("payload")
+    if isinstance(items, list):
+        return items
+    return []
+
+
+def extract_conversations_total_count(payload: Any) -> int | None:
+    if not isinstance(payload, dict):
+        return None
+    data = payload.get("data")
+    meta = data.get("meta") if isinstance(data, dict) else payload.get("meta")
+    if not isinstance(meta, dict):
+        return None
+    for key in ("all_count", "count"):
+        try:
+            return int(meta[key])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def extract_message_items(payload: Any) -> list[Any]:
+    if not isinstance(payload, dict):
+        return []
+    items = payload.get("payload")
+    if isinstance(items, list):
+        return items
+    return []
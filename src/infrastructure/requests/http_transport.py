@@ -3,6 +3,8 @@ Path: src/infrastructure/requests/http_transport.py
 """
 
 from collections.abc import Mapping
+from dataclasses import dataclass
+import json
 from typing import Any, Protocol
 
 import httpx
@@ -34,6 +36,40 @@ class HttpResponse(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class DecodedJsonResponse:
+    """Response whose JSON body was decoded once; `json()` returns that payload."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    payload: Any
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self.payload, ensure_ascii=False)
+
+    def json(self) -> Any:
+        return self.payload
+
+    @classmethod
+    def decode(cls, response: HttpResponse) -> "DecodedJsonResponse | None":
+        """None when the body is not JSON (the caller keeps the raw response)."""
+        try:
+            payload = response.json()
+        except ValueError:
+            return None
+        return cls(response.status_code, dict(response.headers), payload)
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    connections: int
+    idle: int
+    active: int
+    pending_requests: int
+    max_connections: int | None
+
+
 class SyncHttpTransport(Protocol):
     def get(
         self,
@@ -105,6 +141,33 @@ class HttpxAsyncTransport:
     def __init__(self, client: httpx.AsyncClient | None = None) -> None:
         self._client = client
 
+    def pool_stats(self) -> ConnectionPoolStats | None:
+        """Snapshot of the shared client's connection pool (None if unknown).
+
+        httpx does not expose its pool publicly, so this reads httpcore's
+        pool defensively and gives up rather than failing on other versions.
+        """
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if not isinstance(connections, list):
+            return None
+        try:
+            idle = sum(1 for connection in connections if connection.is_idle())
+        except AttributeError:
+            return None
+        requests_in_pool = getattr(pool, "_requests", [])
+        try:
+            pending = sum(1 for request in requests_in_pool if request.is_queued())
+        except AttributeError:
+            pending = 0
+        return ConnectionPoolStats(
+            connections=len(connections),
+            idle=idle,
+            active=len(connections) - idle,
+            pending_requests=pending,
+            max_connections=getattr(pool, "_max_connections", None),
+        )
+
     async def get(
         self,
         url: str,
@@ -169,4 +232,4 @@ class RequestsHttpTransport:
         except requests.exceptions.ConnectionError as exc:
             raise HttpConnectionError(str(exc)) from exc
         except requests.RequestException as exc:
-            raise HttpTransportError(str(exc)) from exc
+            raise HttpTransportError(str(exc)) from exc
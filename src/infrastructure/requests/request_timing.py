@@ -0,0 +1,77 @@
+"""
+Path: src/infrastructure/requests/request_timing.py
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import time
+
+_current_timing: ContextVar["RequestTiming | None"] = ContextVar(
+    "request_timing",
+    default=None,
+)
+
+
+class RequestTiming:
+    """Accumulated duration and count per phase of one proxied request.
+
+    Phases add up across calls: a `page=all` request fetching four pages
+    reports the summed upstream time of the four calls, which can exceed
+    the wall time when they ran concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._phases: dict[str, list[float]] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        totals = self._phases.get(phase)
+        if totals is None:
+            self._phases[phase] = [seconds, 1]
+        else:
+            totals[0] += seconds
+            totals[1] += 1
+
+    def phases(self) -> dict[str, tuple[float, int]]:
+        return {phase: (totals[0], int(totals[1])) for phase, totals in self._phases.items()}
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value, durations in milliseconds."""
+        entries = []
+        for phase, (seconds, count) in self.phases().items():
+            entry = f"{phase};dur={seconds * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="{count} calls"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+def start_request_timing() -> tuple[RequestTiming, Token["RequestTiming | None"]]:
+    timing = RequestTiming()
+    return timing, _current_timing.set(timing)
+
+
+def end_request_timing(token: Token["RequestTiming | None"]) -> None:
+    _current_timing.reset(token)
+
+
+def current_request_timing() -> RequestTiming | None:
+    return _current_timing.get()
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the block's duration to the current request, if one is timed.
+
+    The context variable is inherited by tasks and `asyncio.to_thread`, so
+    work done on behalf of the request still lands in its timing.
+    """
+    timing = _current_timing.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, time.perf_counter() - started)
@@ -0,0 +1,249 @@
+"""
+Path: src/infrastructure/requests/response_cache.py
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Protocol
+
+from src.infrastructure.requests.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+REFRESH_LEASE_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    stored_at: float
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    refresh_errors: int
+    refreshes_skipped: int
+    entries: int
+
+
+class CacheBackend(Protocol):
+    # True when calls do disk or network I/O: the cache then runs them in a
+    # worker thread instead of on the event loop.
+    blocking: bool
+
+    def get(self, key: str) -> CacheEntry | None:
+        ...
+
+    def set(self, key: str, entry: CacheEntry, ttl_seconds: float) -> None:
+        ...
+
+    def try_acquire_refresh(self, key: str, lease_seconds: float) -> bool:
+        ...
+
+    def release_refresh(self, key: str) -> None:
+        ...
+
+    def size(self) -> int:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """Process-local LRU backend. Refresh locks only need to be process-wide."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._refresh_locks: set[str] = set()
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry, ttl_seconds: float) -> None:
+        _ = ttl_seconds
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def try_acquire_refresh(self, key: str, lease_seconds: float) -> bool:
+        _ = lease_seconds
+        if key in self._refresh_locks:
+            return False
+        self._refresh_locks.add(key)
+        return True
+
+    def release_refresh(self, key: str) -> None:
+        self._refresh_locks.discard(key)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        self._entries.clear()
+        self._refresh_locks.clear()
+
+
+class ResponseCache:
+    """Stale-while-revalidate cache for sanitized proxy payloads.
+
+    Entries younger than the resource TTL are served as-is. During the
+    following stale window they are still served immediately while a single
+    background task refreshes them; with a shared backend the refresh lock
+    also spans worker processes. Resources without a positive TTL bypass the
+    cache.
+    """
+
+    def __init__(
+        self,
+        fresh_ttl_seconds: Mapping[str, float],
+        stale_ttl_seconds: float,
+        backend: CacheBackend | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._fresh_ttl_seconds = dict(fresh_ttl_seconds)
+        self._stale_ttl_seconds = max(0.0, stale_ttl_seconds)
+        self._backend = backend or MemoryCacheBackend()
+        self._clock = clock
+        self._loads = SingleFlight()
+        self._refreshing: dict[str, asyncio.Task[Any]] = {}
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+        self._refreshes_skipped = 0
+
+    async def get_or_load(
+        self,
+        resource: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        fresh_ttl = self._fresh_ttl_seconds.get(resource, 0.0)
+        if fresh_ttl <= 0:
+            return await loader()
+
+        cache_key = repr((resource, key))
+        ttl_seconds = fresh_ttl + self._stale_ttl_seconds
+        entry = await self._call_backend(self._backend.get, cache_key)
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age <= fresh_ttl:
+                self._hits += 1
+                return entry.value
+            if age <= ttl_seconds:
+                self._stale_hits += 1
+                self._schedule_refresh(cache_key, ttl_seconds, loader)
+                return entry.value
+
+        self._misses += 1
+        return await self._loads.run(
+            cache_key,
+            lambda: self._load_and_store(cache_key, ttl_seconds, loader),
+        )
+
+    def stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            refresh_errors=self._refresh_errors,
+            refreshes_skipped=self._refreshes_skipped,
+            entries=self._backend.size(),
+        )
+
+    async def aclose(self) -> None:
+        pending = list(self._refreshing.values())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._refreshing.clear()
+        self._backend.close()
+
+    async def _load_and_store(
+        self,
+        cache_key: str,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        value = await loader()
+        await self._call_backend(
+            self._backend.set,
+            cache_key,
+            CacheEntry(value=value, stored_at=self._clock()),
+            ttl_seconds,
+        )
+        return value
+
+    async def _refresh(
+        self,
+        cache_key: str,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> None:
+        acquired = await self._call_backend(
+            self._backend.try_acquire_refresh,
+            cache_key,
+            REFRESH_LEASE_SECONDS,
+        )
+        if not acquired:
+            # Another worker already refreshes this entry: keep serving stale.
+            self._refreshes_skipped += 1
+            return
+        try:
+            self._refreshes += 1
+            await self._loads.run(
+                cache_key,
+                lambda: self._load_and_store(cache_key, ttl_seconds, loader),
+            )
+        finally:
+            await self._call_backend(self._backend.release_refresh, cache_key)
+
+    async def _call_backend(self, method: Callable[..., Any], *args: Any) -> Any:
+        if self._backend.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> None:
+        if cache_key in self._refreshing:
+            return
+        task = asyncio.ensure_future(self._refresh(cache_key, ttl_seconds, loader))
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda done, key=cache_key: self._on_refreshed(key, done))
+
+    def _on_refreshed(self, cache_key: str, task: asyncio.Task[Any]) -> None:
+        if self._refreshing.get(cache_key) is task:
+            del self._refreshing[cache_key]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._refresh_errors += 1
+            logger.warning(
+                "response_cache_refresh_failed key=%s error=%s",
+                cache_key,
+                error,
+            )
@@ -0,0 +1,215 @@
+"""
+Path: src/infrastructure/requests/sanitization_plans.py
+"""
+
+from collections.abc import Mapping
+from typing import Any, Union
+
+from src.infrastructure.requests.sensitive_data_sanitizer import (
+    CONVERSATION_POLICY,
+    DEFAULT_POLICY,
+    MIN_LONG_NUMERIC_RUN,
+    SanitizationPolicy,
+    mask_secret,
+    truncate_long_numeric_sequences,
+)
+
+# A shape maps known keys to None (leaf) or to the shape of a nested object
+# (or of every object in a nested list). Keys missing from a shape, such as
+# `custom_attributes` or `additional_attributes`, use the generic walker.
+Shape = Mapping[str, Union["Shape", None]]
+
+_MASK = 1
+_TEXT = 2
+
+CONTACT_SHAPE: Shape = {
+    "id": None,
+    "name": None,
+    "available_name": None,
+    "avatar_url": None,
+    "thumbnail": None,
+    "type": None,
+    "availability_status": None,
+    "email": None,
+    "phone_number": None,
+    "identifier": None,
+    "blocked": None,
+    "last_activity_at": None,
+    "created_at": None,
+}
+
+ATTACHMENT_SHAPE: Shape = {
+    "id": None,
+    "message_id": None,
+    "account_id": None,
+    "file_type": None,
+    "extension": None,
+    "data_url": None,
+    "thumb_url": None,
+    "file_size": None,
+    "width": None,
+    "height": None,
+}
+
+MESSAGE_SHAPE: Shape = {
+    "id": None,
+    "content": None,
+    "account_id": None,
+    "inbox_id": None,
+    "conversation_id": None,
+    "message_type": None,
+    "content_type": None,
+    "status": None,
+    "created_at": None,
+    "updated_at": None,
+    "private": None,
+    "source_id": None,
+    "sender_type": None,
+    "sender_id": None,
+    "processed_message_content": None,
+    "attachments": ATTACHMENT_SHAPE,
+    "sender": CONTACT_SHAPE,
+    "conversation": {
+        "assignee_id": None,
+        "unread_count": None,
+        "last_activity_at": None,
+        "contact_inbox": {"source_id": None},
+    },
+}
+
+CONVERSATION_SHAPE: Shape = {
+    "id": None,
+    "uuid": None,
+    "account_id": None,
+    "inbox_id": None,
+    "status": None,
+    "priority": None,
+    "muted": None,
+    "can_reply": None,
+    "snoozed_until": None,
+    "unread_count": None,
+    "labels": None,
+    "created_at": None,
+    "updated_at": None,
+    "timestamp": None,
+    "last_activity_at": None,
+    "first_reply_created_at": None,
+    "waiting_since": None,
+    "agent_last_seen_at": None,
+    "assignee_last_seen_at": None,
+    "contact_last_seen_at": None,
+    "sla_policy_id": None,
+    "messages": MESSAGE_SHAPE,
+    "last_non_activity_message": MESSAGE_SHAPE,
+    "meta": {
+        "sender": CONTACT_SHAPE,
+        "assignee": CONTACT_SHAPE,
+        "channel": None,
+        "hmac_verified": None,
+    },
+}
+
+INBOX_SHAPE: Shape = {
+    "id": None,
+    "name": None,
+    "avatar_url": None,
+    "channel_id": None,
+    "channel_type": None,
+    "greeting_enabled": None,
+    "greeting_message": None,
+    "working_hours_enabled": None,
+    "enable_email_collect": None,
+    "csat_survey_enabled": None,
+    "enable_auto_assignment": None,
+    "out_of_office_message": None,
+    "timezone": None,
+    "callback_webhook_url": None,
+    "allow_messages_after_resolved": None,
+    "lock_to_single_conversation": None,
+    "sender_name_type": None,
+    "business_name": None,
+    "widget_color": None,
+    "website_url": None,
+    "hmac_mandatory": None,
+    "welcome_title": None,
+    "welcome_tagline": None,
+    "web_widget_script": None,
+    "website_token": None,
+    "reply_time": None,
+    "messaging_service_sid": None,
+    "phone_number": None,
+    "hmac_token": None,
+    "webhook_url": None,
+    "inbox_identifier": None,
+    "forward_to_email": None,
+    "provider": None,
+}
+
+
+class SanitizationPlan:
+    """Per-resource sanitization precompiled from a known Chatwoot shape.
+
+    Every known key gets its action (mask or plain text) decided once, from
+    the same policy the generic walker uses, so output is identical; unknown
+    keys and free-form attributes fall back to `policy.sanitize_in_place`.
+    Plans rewrite the payload in place: use them on freshly decoded data.
+    """
+
+    def __init__(self, policy: SanitizationPolicy, shape: Shape) -> None:
+        self._policy = policy
+        self._rules: dict[str, Any] = {}
+        for key, nested in shape.items():
+            if nested is not None:
+                self._rules[key] = SanitizationPlan(policy, nested)
+            elif policy.is_sensitive_key(key):
+                self._rules[key] = _MASK
+            else:
+                self._rules[key] = _TEXT
+
+    def apply_in_place(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return self._policy.sanitize_in_place(value)
+
+        rules = self._rules
+        fallback = self._policy.sanitize_in_place
+        for key, child in value.items():
+            rule = rules.get(key)
+            if isinstance(child, str):
+                if rule is _TEXT:
+                    if len(child) < MIN_LONG_NUMERIC_RUN:
+                        continue
+                    sanitized = truncate_long_numeric_sequences(child)
+                elif rule is _MASK:
+                    sanitized = mask_secret(child)
+                else:
+                    sanitized = fallback(child, key)
+                if sanitized is not child:
+                    value[key] = sanitized
+            elif not child:
+                # Falsy scalars and empty containers need no work.
+                continue
+            elif isinstance(child, dict):
+                if isinstance(rule, SanitizationPlan):
+                    rule.apply_in_place(child)
+                else:
+                    fallback(child, key)
+            elif isinstance(child, list):
+                if isinstance(rule, SanitizationPlan):
+                    rule._apply_to_items(child, key)
+                else:
+                    fallback(child, key)
+        return value
+
+    def _apply_to_items(self, items: list[Any], key: str) -> None:
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                self.apply_in_place(item)
+                continue
+            sanitized = self._policy.sanitize_in_place(item, key)
+            if sanitized is not item:
+                items[index] = sanitized
+
+
+MESSAGE_PLAN = SanitizationPlan(CONVERSATION_POLICY, MESSAGE_SHAPE)
+CONVERSATION_PLAN = SanitizationPlan(CONVERSATION_POLICY, CONVERSATION_SHAPE)
+INBOX_PLAN = SanitizationPlan(DEFAULT_POLICY, INBOX_SHAPE)
@@ -2,9 +2,15 @@
 Path: src/infrastructure/requests/sensitive_data_sanitizer.py
 """
 
+from collections.abc import Hashable, Iterable
+from functools import lru_cache
+from itertools import count, repeat
+import logging
 import re
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 SENSITIVE_KEYS = {
     "api_key",
     "webhook_verify_token",
@@ -27,35 +33,211 @@ CONVERSATION_SENSITIVE_KEYS = {
     "contact_inbox_source_id",
 }
 
+KEY_CACHE_SIZE = 4096
+MIN_LONG_NUMERIC_RUN = 8
+WEBSITE_TOKEN_MARKER = "websiteToken"
+MAX_DEPTH = 64
+MAX_NODES = 1_000_000
+SUBTREE_OMITTED = "[omitido: estructura demasiado profunda o extensa]"
+_COPY = "copy"
+_SHARED = "shared"
+_IN_PLACE = "in_place"
+_LONG_NUMERIC_RUN = re.compile(r"\d{%d,}" % MIN_LONG_NUMERIC_RUN)
+_WEBSITE_TOKEN = re.compile(r"(websiteToken:\s*['\"])([^'\"]+)(['\"])")
 
-def sanitize_payload(value: Any, key: str | None = None) -> Any:
-    if isinstance(value, dict):
-        return {k: sanitize_payload(v, key=k) for k, v in value.items()}
-    if isinstance(value, list):
-        return [sanitize_payload(item, key=key) for item in value]
-    if isinstance(value, str):
-        normalized_key = key.lower() if isinstance(key, str) else ""
-        if normalized_key in SENSITIVE_KEYS or any(part in normalized_key for part in SENSITIVE_KEY_PARTS):
-            return _mask_secret(value)
-        return _truncate_long_numeric_sequences(value)
-    return value
 
+class SanitizationPolicy:
+    """Sensitive-key policy compiled once and reused for every payload.
 
-def sanitize_conversation_payload(value: Any, key: str | None = None) -> Any:
-    if isinstance(value, dict):
-        return {k: sanitize_conversation_payload(v, key=k) for k, v in value.items()}
-    if isinstance(value, list):
-        return [sanitize_conversation_payload(item, key=key) for item in value]
-    if isinstance(value, str):
+    Key classification is memoized (payload keys repeat across objects and
+    pages), regexes are precompiled and strings that cannot contain a long
+    digit run or a website token skip regex work entirely.
+
+    Three modes share the same output: `sanitize` returns a full copy,
+    `sanitize_shared` is copy-on-write (untouched subtrees are returned as-is,
+    so the result may alias the input) and `sanitize_in_place` rewrites
+    containers the caller owns exclusively.
+
+    Payloads are walked with an explicit stack, so nesting depth is bounded
+    by `max_depth` instead of the interpreter recursion limit. Containers
+    deeper than `max_depth`, or found once `max_nodes` values were visited,
+    are replaced by `SUBTREE_OMITTED` and the event is logged.
+    """
+
+    def __init__(
+        self,
+        sensitive_keys: Iterable[str],
+        sensitive_key_parts: Iterable[str],
+        key_cache_size: int = KEY_CACHE_SIZE,
+        max_depth: int = MAX_DEPTH,
+        max_nodes: int = MAX_NODES,
+    ) -> None:
+        self._sensitive_keys = frozenset(key.lower() for key in sensitive_keys)
+        self._sensitive_key_parts = tuple(part.lower() for part in sensitive_key_parts)
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes
+        self.is_sensitive_key = lru_cache(maxsize=key_cache_size)(self._classify_key)
+        self.guard_trips = 0
+
+    def sanitize(self, value: Any, key: Hashable | None = None) -> Any:
+        return self._walk(value, key, _COPY)
+
+    def sanitize_shared(self, value: Any, key: Hashable | None = None) -> Any:
+        return self._walk(value, key, _SHARED)
+
+    def sanitize_in_place(self, value: Any, key: Hashable | None = None) -> Any:
+        return self._walk(value, key, _IN_PLACE)
+
+    def sanitize_text(self, value: str, key: Hashable | None) -> str:
+        if self.is_sensitive_key(key):
+            return mask_secret(value)
+        return truncate_long_numeric_sequences(value)
+
+    def _classify_key(self, key: Hashable | None) -> bool:
         normalized_key = key.lower() if isinstance(key, str) else ""
-        is_sensitive_key = normalized_key in CONVERSATION_SENSITIVE_KEYS
-        is_sensitive_secret = normalized_key in SENSITIVE_KEYS or any(
-            part in normalized_key for part in SENSITIVE_KEY_PARTS
+        if normalized_key in self._sensitive_keys:
+            return True
+        return any(part in normalized_key for part in self._sensitive_key_parts)
+
+    def _walk(self, value: Any, key: Hashable | None, mode: str) -> Any:
+        if isinstance(value, str):
+            return self.sanitize_text(value, key)
+        if not isinstance(value, (dict, list)):
+            return value
+        if not value:
+            return _copy_container(value) if mode == _COPY else value
+
+        is_sensitive_key = self.is_sensitive_key
+        max_depth = self._max_depth
+        max_nodes = self._max_nodes
+        copying = mode == _COPY
+        in_place = mode == _IN_PLACE
+        nodes = 1
+        guard_reason: str | None = None
+        deepest = 1
+        # Frames are plain lists (cheaper than objects on this hot path):
+        # [container, slot in parent, depth, (slot, key, child) iterator, output].
+        # Output is None until copy-on-write needs a private copy.
+        stack: list[list[Any]] = [_frame(value, key, None, 1, copying, in_place)]
+        result: Any = value
+
+        while stack:
+            frame = stack[-1]
+            container, _, depth, items, out = frame
+            descended = False
+            for slot, child_key, child in items:
+                nodes += 1
+                if isinstance(child, str):
+                    if is_sensitive_key(child_key):
+                        sanitized = mask_secret(child)
+                    elif len(child) < MIN_LONG_NUMERIC_RUN:
+                        sanitized = child
+                    else:
+                        sanitized = truncate_long_numeric_sequences(child)
+                elif isinstance(child, (dict, list)):
+                    if not child:
+                        sanitized = _copy_container(child) if copying else child
+                    elif depth >= max_depth:
+                        guard_reason = guard_reason or "max_depth"
+                        deepest = max(deepest, depth + 1)
+                        sanitized = SUBTREE_OMITTED
+                    elif nodes > max_nodes:
+                        guard_reason = guard_reason or "max_nodes"
+                        sanitized = SUBTREE_OMITTED
+                    else:
+                        stack.append(_frame(child, child_key, slot, depth + 1, copying, in_place))
+                        descended = True
+                        break
+                else:
+                    sanitized = child
+                if copying or sanitized is not child:
+                    if out is None:
+                        out = frame[4] = _copy_container(container)
+                    out[slot] = sanitized
+            if descended:
+                continue
+
+            stack.pop()
+            done = container if out is None else out
+            if not stack:
+                result = done
+                continue
+            if copying or done is not container:
+                parent = stack[-1]
+                if parent[4] is None:
+                    parent[4] = _copy_container(parent[0])
+                parent[4][frame[1]] = done
+
+        if guard_reason is not None:
+            self._report_guard(guard_reason, nodes, deepest)
+        return result
+
+    def _report_guard(self, reason: str, nodes: int, depth: int) -> None:
+        self.guard_trips += 1
+        logger.warning(
+            "sanitizer_guard_triggered reason=%s max_depth=%s max_nodes=%s "
+            "visited_nodes=%s depth=%s",
+            reason,
+            self._max_depth,
+            self._max_nodes,
+            nodes,
+            depth,
         )
-        if is_sensitive_key or is_sensitive_secret:
-            return _mask_secret(value)
-        return _truncate_long_numeric_sequences(value)
-    return value
+
+
+def _frame(
+    container: dict[Any, Any] | list[Any],
+    key: Hashable | None,
+    slot: Any,
+    depth: int,
+    copying: bool,
+    in_place: bool,
+) -> list[Any]:
+    # Dict children use their own key; list children inherit the list's key.
+    if isinstance(container, dict):
+        items = zip(container.keys(), container.keys(), container.values())
+        out = {} if copying else None
+    else:
+        items = zip(count(), repeat(key), container)
+        out = [None] * len(container) if copying else None
+    if in_place:
+        out = container
+    return [container, slot, depth, items, out]
+
+
+def _copy_container(container: dict[Any, Any] | list[Any]) -> dict[Any, Any] | list[Any]:
+    return dict(container) if isinstance(container, dict) else list(container)
+
+
+DEFAULT_POLICY = SanitizationPolicy(SENSITIVE_KEYS, SENSITIVE_KEY_PARTS)
+CONVERSATION_POLICY = SanitizationPolicy(
+    SENSITIVE_KEYS | CONVERSATION_SENSITIVE_KEYS,
+    SENSITIVE_KEY_PARTS,
+)
+
+
+def sanitize_payload(value: Any, key: str | None = None) -> Any:
+    return DEFAULT_POLICY.sanitize(value, key=key)
+
+
+def sanitize_conversation_payload(value: Any, key: str | None = None) -> Any:
+    return CONVERSATION_POLICY.sanitize(value, key=key)
+
+
+def sanitize_payload_shared(value: Any, key: str | None = None) -> Any:
+    return DEFAULT_POLICY.sanitize_shared(value, key=key)
+
+
+def sanitize_conversation_payload_shared(value: Any, key: str | None = None) -> Any:
+    return CONVERSATION_POLICY.sanitize_shared(value, key=key)
+
+
+def sanitize_payload_in_place(value: Any, key: str | None = None) -> Any:
+    return DEFAULT_POLICY.sanitize_in_place(value, key=key)
+
+
+def sanitize_conversation_payload_in_place(value: Any, key: str | None = None) -> Any:
+    return CONVERSATION_POLICY.sanitize_in_place(value, key=key)
 
 
 def _truncate_text(value: str) -> str:
@@ -64,7 +246,7 @@ def _truncate_text(value: str) -> str:
     return f"{value[:4]}...{value[-4:]}"
 
 
-def _mask_secret(value: str) -> str:
+def mask_secret(value: str) -> str:
     if not value:
         return value
     if len(value) <= 4:
@@ -72,14 +254,19 @@ def _mask_secret(value: str) -> str:
     return f"{value[:2]}...{value[-2:]}"
 
 
-def _truncate_long_numeric_sequences(value: str) -> str:
-    def _replace(match: re.Match[str]) -> str:
-        return _truncate_text(match.group(0))
+def truncate_long_numeric_sequences(value: str) -> str:
+    if len(value) < MIN_LONG_NUMERIC_RUN:
+        return value
+    if _LONG_NUMERIC_RUN.search(value) is not None:
+        value = _LONG_NUMERIC_RUN.sub(_truncate_numeric_match, value)
+    if WEBSITE_TOKEN_MARKER in value:
+        value = _WEBSITE_TOKEN.sub(_truncate_website_token_match, value)
+    return value
+
+
+def _truncate_numeric_match(match: re.Match[str]) -> str:
+    return _truncate_text(match.group(0))
+
 
-    masked = re.sub(r"\d{8,}", _replace, value)
-    return re.sub(
-        r"(websiteToken:\s*['\"])([^'\"]+)(['\"])",
-        lambda m: f"{m.group(1)}{_truncate_text(m.group(2))}{m.group(3)}",
-        masked,
-    )
-
+def _truncate_website_token_match(match: re.Match[str]) -> str:
+    return f"{match.group(1)}{_truncate_text(match.group(2))}{match.group(3)}"
@@ -0,0 +1,79 @@
+"""
+Path: src/infrastructure/requests/single_flight.py
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int
+    shared: int
+    in_flight: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        return self.shared / self.calls
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one shared task.
+
+    Waiters are shielded: cancelling one caller never cancels the shared
+    task while other callers still wait for its result. When the last
+    waiter leaves, the shared task is cancelled, so nobody keeps loading a
+    result no one will read (e.g. page fetches orphaned by a disconnect).
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, _Flight] = {}
+        self._calls = 0
+        self._shared = 0
+
+    async def run(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        self._calls += 1
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(loader()))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self._shared += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Unregister now so a new caller starts a fresh load instead
+                # of joining one that is being cancelled.
+                self._forget(key, flight.task)
+                flight.task.cancel()
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            calls=self._calls,
+            shared=self._shared,
+            in_flight=len(self._in_flight),
+        )
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        flight = self._in_flight.get(key)
+        if flight is not None and flight.task is task:
+            del self._in_flight[key]
+        if task.done() and not task.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled.
+            task.exception()
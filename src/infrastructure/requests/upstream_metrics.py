@@ -0,0 +1,81 @@
+"""
+Path: src/infrastructure/requests/upstream_metrics.py
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+import re
+
+DEFAULT_LATENCY_BUCKETS_SECONDS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram: one bisect and two additions per sample."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECONDS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def cumulative_counts(self) -> list[int]:
+        """Counts per `le` bucket, Prometheus style; the last one is +Inf."""
+        running = 0
+        cumulative = []
+        for count in self._counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+
+@dataclass(frozen=True)
+class UpstreamCallKey:
+    resource: str
+    outcome: str
+
+
+class UpstreamMetrics:
+    """Per-resource latency and outcome counts of calls made to Chatwoot.
+
+    Numeric path segments are folded (`conversations/{id}/messages`) so the
+    label set stays bounded. The outcome is the HTTP status code, or
+    `timeout`, `tls_error` / `network_error` when no response arrived.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.calls: dict[UpstreamCallKey, int] = {}
+        self.latency: dict[str, LatencyHistogram] = {}
+
+    def record(self, resource: str, outcome: str, seconds: float) -> None:
+        resource = normalize_resource(resource)
+        key = UpstreamCallKey(resource, outcome)
+        self.calls[key] = self.calls.get(key, 0) + 1
+        histogram = self.latency.get(resource)
+        if histogram is None:
+            histogram = self.latency[resource] = LatencyHistogram()
+        histogram.observe(seconds)
+
+
+def normalize_resource(resource: str) -> str:
+    return _NUMERIC_SEGMENT.sub("/{id}", resource)
@@ -1,19 +1,31 @@
 from rich.panel import Panel
 from rich.table import Table
 
+from src.infrastructure.fastapi_app.server_config import ServerConfig
 from src.infrastructure.rich.console_factory import create_console
 
 ACCENT_COLOR = "#009688"
 
 
-def show_server_info(host: str, port: int, reload_enabled: bool) -> None:
+def show_server_info(config: ServerConfig) -> None:
     console = create_console()
     table = Table.grid(padding=(0, 1))
     table.add_column(style="bold")
     table.add_column()
     table.add_row("Server", "Chatwoot Local Contract Mock")
-    table.add_row("URL", f"http://{host}:{port}")
-    table.add_row("Reload", "on" if reload_enabled else "off")
+    table.add_row("URL", f"http://{config.host}:{config.port}")
+    table.add_row("Mode", "production" if config.production else "development")
+    table.add_row("Reload", "on" if config.reload else "off")
+    table.add_row("Workers", str(config.workers))
+    table.add_row("Loop", config.loop)
+    table.add_row("HTTP", config.http)
+    table.add_row("Keep-alive", f"{config.timeout_keep_alive}s")
+    table.add_row("Backlog", str(config.backlog))
+    table.add_row(
+        "Concurrency",
+        "off" if config.limit_concurrency is None else str(config.limit_concurrency),
+    )
+    table.add_row("Access log", "on" if config.access_log else "off")
     console.print(
         Panel(
             table,
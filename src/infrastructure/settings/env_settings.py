@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 from typing import Union
 
@@ -9,6 +9,18 @@ except ImportError:  # pragma: no cover
 
 
 CA_BUNDLE_PATH = "certs/chatwoot-ca-bundle.pem"
+DEFAULT_API_CLIENT = "default"
+CACHE_BACKENDS = ("memory", "sqlite")
+DEFAULT_CACHE_SQLITE_PATH = ".cache/proxy_response_cache.sqlite3"
+# TTLs applied when PROXY_CACHE_ENABLED=true; with the cache off every TTL is 0.
+DEFAULT_CACHE_FRESH_TTL_SECONDS = {
+    "inboxes": 60.0,
+    "contacts": 30.0,
+    "conversations": 15.0,
+    "conversation": 15.0,
+    "contact_conversations": 15.0,
+    "messages": 10.0,
+}
 
 
 @dataclass(frozen=True)
@@ -19,6 +31,46 @@ class ChatwootSettings:
     proxy_api_key: str
     timeout_seconds: float = 8.0
     tls_verify: Union[bool, str] = True
+    # Extra keys by client name; PROXY_API_KEY is always the "default" client.
+    proxy_api_keys: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ProxyTuningSettings:
+    cache_enabled: bool = False
+    cache_fresh_ttl_seconds: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(DEFAULT_CACHE_FRESH_TTL_SECONDS, 0.0)
+    )
+    cache_stale_ttl_seconds: float = 60.0
+    cache_backend: str = "memory"
+    cache_sqlite_path: str = DEFAULT_CACHE_SQLITE_PATH
+    pagination_max_concurrency: int = 4
+    batch_max_concurrency: int = 8
+    warmup_enabled: bool = False
+    warmup_contacts_pages: int = 2
+    warmup_conversations_pages: int = 2
+    offload_threshold_bytes: int = 256 * 1024
+    loop_lag_interval_seconds: float = 0.1
+    compression_enabled: bool = True
+    compression_min_bytes: int = 1024
+    compression_gzip_level: int = 5
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+    server_timing_sample_rate: float = 1.0
+    ready_probe_interval_seconds: float = 15.0
+    ready_probe_window: int = 20
+    ready_max_error_rate: float = 0.5
+    ready_max_latency_p95_ms: float = 2000.0
+    rate_limit_enabled: bool = False
+    rate_limit_lookup_per_minute: int = 600
+    rate_limit_fanout_per_minute: int = 30
+    # Per client name: (lookups, fan-out requests) per minute.
+    rate_limit_quotas: dict[str, tuple[int, int]] = field(default_factory=dict)
+    admission_max_in_flight: int = 64
+    admission_max_fanout: int = 4
+    admission_max_lookup: int = 0
+    admission_queue_timeout_seconds: float = 2.0
+    admission_max_queue: int = 32
 
 
 def load_chatwoot_settings() -> ChatwootSettings:
@@ -29,6 +81,7 @@ def load_chatwoot_settings() -> ChatwootSettings:
     account_id_raw = _require_env("CHATWOOT_ACCOUNT_ID")
     api_access_token = _require_env("CHATWOOT_API_ACCESS_TOKEN")
     proxy_api_key = _require_env("PROXY_API_KEY")
+    proxy_api_keys = _load_proxy_api_keys()
     timeout_seconds = 8.0
     tls_verify = _load_tls_verify()
 
@@ -44,9 +97,103 @@ def load_chatwoot_settings() -> ChatwootSettings:
         proxy_api_key=proxy_api_key,
         timeout_seconds=timeout_seconds,
         tls_verify=tls_verify,
+        proxy_api_keys=proxy_api_keys,
+    )
+
+
+def load_proxy_tuning_settings() -> ProxyTuningSettings:
+    if load_dotenv is not None:
+        load_dotenv()
+
+    # Opt-in: cached responses can lag behind Chatwoot by up to TTL + stale window.
+    cache_enabled = _optional_bool_env("PROXY_CACHE_ENABLED", False)
+    cache_fresh_ttl_seconds = {
+        resource: _optional_float_env(
+            f"PROXY_CACHE_TTL_{resource.upper()}",
+            default if cache_enabled else 0.0,
+        )
+        for resource, default in DEFAULT_CACHE_FRESH_TTL_SECONDS.items()
+    }
+    cache_backend = os.getenv("PROXY_CACHE_BACKEND", "memory").strip().lower() or "memory"
+    if cache_backend not in CACHE_BACKENDS:
+        raise ValueError(
+            f"PROXY_CACHE_BACKEND debe ser uno de: {', '.join(CACHE_BACKENDS)}"
+        )
+
+    return ProxyTuningSettings(
+        cache_enabled=cache_enabled,
+        cache_fresh_ttl_seconds=cache_fresh_ttl_seconds,
+        cache_stale_ttl_seconds=_optional_float_env("PROXY_CACHE_STALE_SECONDS", 60.0),
+        cache_backend=cache_backend,
+        cache_sqlite_path=(
+            os.getenv("PROXY_CACHE_SQLITE_PATH", "").strip() or DEFAULT_CACHE_SQLITE_PATH
+        ),
+        pagination_max_concurrency=_optional_int_env("PROXY_PAGINATION_CONCURRENCY", 4),
+        batch_max_concurrency=_optional_int_env("PROXY_BATCH_CONCURRENCY", 8),
+        # Only runs with PROXY_CACHE_ENABLED: without a cache nothing stays primed.
+        warmup_enabled=_optional_bool_env("PROXY_WARMUP_ENABLED", False),
+        warmup_contacts_pages=_optional_int_env("PROXY_WARMUP_CONTACTS_PAGES", 2),
+        warmup_conversations_pages=_optional_int_env("PROXY_WARMUP_CONVERSATIONS_PAGES", 2),
+        offload_threshold_bytes=_optional_int_env("PROXY_OFFLOAD_THRESHOLD_BYTES", 256 * 1024),
+        loop_lag_interval_seconds=_optional_float_env("PROXY_LOOP_LAG_INTERVAL_SECONDS", 0.1),
+        compression_enabled=_optional_bool_env("PROXY_COMPRESSION_ENABLED", True),
+        compression_min_bytes=_optional_int_env("PROXY_COMPRESSION_MIN_BYTES", 1024),
+        compression_gzip_level=_optional_int_env("PROXY_COMPRESSION_GZIP_LEVEL", 5),
+        compression_brotli_quality=_optional_int_env("PROXY_COMPRESSION_BROTLI_QUALITY", 4),
+        compression_zstd_level=_optional_int_env("PROXY_COMPRESSION_ZSTD_LEVEL", 3),
+        server_timing_sample_rate=_optional_float_env("PROXY_SERVER_TIMING_SAMPLE_RATE", 1.0),
+        ready_probe_interval_seconds=_optional_float_env(
+            "PROXY_READY_PROBE_INTERVAL_SECONDS", 15.0
+        ),
+        ready_probe_window=_optional_int_env("PROXY_READY_PROBE_WINDOW", 20),
+        ready_max_error_rate=_optional_float_env("PROXY_READY_MAX_ERROR_RATE", 0.5),
+        ready_max_latency_p95_ms=_optional_float_env("PROXY_READY_MAX_LATENCY_P95_MS", 2000.0),
+        rate_limit_enabled=_optional_bool_env("PROXY_RATE_LIMIT_ENABLED", False),
+        rate_limit_lookup_per_minute=_optional_int_env("PROXY_RATE_LIMIT_LOOKUP_PER_MINUTE", 600),
+        rate_limit_fanout_per_minute=_optional_int_env("PROXY_RATE_LIMIT_FANOUT_PER_MINUTE", 30),
+        rate_limit_quotas=_load_rate_limit_quotas(),
+        admission_max_in_flight=_optional_int_env("PROXY_MAX_IN_FLIGHT", 64),
+        admission_max_fanout=_optional_int_env("PROXY_MAX_IN_FLIGHT_FANOUT", 4),
+        admission_max_lookup=_optional_int_env("PROXY_MAX_IN_FLIGHT_LOOKUP", 0),
+        admission_queue_timeout_seconds=_optional_float_env(
+            "PROXY_ADMISSION_QUEUE_TIMEOUT_SECONDS", 2.0
+        ),
+        admission_max_queue=_optional_int_env("PROXY_ADMISSION_MAX_QUEUE", 32),
     )
 
 
+def _load_proxy_api_keys() -> dict[str, str]:
+    """`PROXY_API_KEYS=equipo-a:clave1,equipo-b:clave2`."""
+    keys: dict[str, str] = {}
+    for entry in _comma_separated_env("PROXY_API_KEYS"):
+        name, separator, key = (part.strip() for part in entry.partition(":"))
+        if not separator or not name or not key:
+            raise ValueError("PROXY_API_KEYS debe tener el formato nombre:clave,nombre:clave")
+        if name == DEFAULT_API_CLIENT or name in keys:
+            raise ValueError(f"PROXY_API_KEYS repite el cliente: {name}")
+        keys[name] = key
+    return keys
+
+
+def _load_rate_limit_quotas() -> dict[str, tuple[int, int]]:
+    """`PROXY_RATE_LIMIT_QUOTAS=equipo-a=600/30,equipo-b=120/5` (lookups/fan-out por minuto)."""
+    quotas: dict[str, tuple[int, int]] = {}
+    for entry in _comma_separated_env("PROXY_RATE_LIMIT_QUOTAS"):
+        name, _, budgets = (part.strip() for part in entry.partition("="))
+        lookups, _, fanout = budgets.partition("/")
+        try:
+            quotas[name] = (int(lookups), int(fanout))
+        except ValueError as exc:
+            raise ValueError(
+                "PROXY_RATE_LIMIT_QUOTAS debe tener el formato nombre=consultas/fanout"
+            ) from exc
+    return quotas
+
+
+def _comma_separated_env(name: str) -> list[str]:
+    return [entry.strip() for entry in os.getenv(name, "").split(",") if entry.strip()]
+
+
 def _require_env(name: str) -> str:
     value = os.getenv(name, "").strip()
     if not value:
@@ -54,9 +201,40 @@ def _require_env(name: str) -> str:
     return value
 
 
+def _optional_float_env(name: str, default: float) -> float:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise ValueError(f"{name} debe ser un numero") from exc
+
+
+def _optional_int_env(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise ValueError(f"{name} debe ser un entero") from exc
+
+
+def _optional_bool_env(name: str, default: bool) -> bool:
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    if value in {"1", "true", "yes", "on"}:
+        return True
+    if value in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"{name} debe ser true/false")
+
+
 def _load_tls_verify() -> Union[bool, str]:
     if not os.path.exists(CA_BUNDLE_PATH):
         raise ValueError(
             f"Falta CA bundle TLS requerido en ruta hardcodeada: {CA_BUNDLE_PATH}"
         )
-    return CA_BUNDLE_PATH
+    return CA_BUNDLE_PATH
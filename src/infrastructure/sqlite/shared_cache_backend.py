@@ -0,0 +1,141 @@
+"""
+Path: src/infrastructure/sqlite/shared_cache_backend.py
+"""
+
+from collections import OrderedDict
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any
+
+from src.infrastructure.requests.response_cache import CacheEntry
+
+PURGE_EVERY_WRITES = 200
+DECODED_ENTRIES_LIMIT = 512
+
+
+class SqliteCacheBackend:
+    """Host-local cache shared by every uvicorn worker through one SQLite file.
+
+    WAL mode lets readers proceed while a worker writes. Refresh locks are
+    leased rows, so a crashed worker cannot block refreshes forever.
+
+    Only refreshes of stale entries are coordinated across workers. A cold
+    miss is coalesced within each worker, so right after startup (or after
+    an entry expired) every worker may load the same key once.
+
+    Calls block on SQLite and JSON work, so `ResponseCache` runs them in a
+    worker thread; the connection is shared under `_lock`.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, clock: Any = time.time) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._clock = clock
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._decoded: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS refresh_locks ("
+            "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT stored_at FROM cache_entries WHERE key = ? AND expires_at >= ?",
+                (key, self._clock()),
+            ).fetchone()
+            if row is None:
+                return None
+            stored_at = row[0]
+
+            # Skip JSON decoding when this worker already holds the same version.
+            decoded = self._decoded.get(key)
+            if decoded is not None and decoded[0] == stored_at:
+                self._decoded.move_to_end(key)
+                return CacheEntry(value=decoded[1], stored_at=stored_at)
+
+            row = self._connection.execute(
+                "SELECT value, stored_at FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        value = json.loads(row[0])
+        self._remember_decoded(key, row[1], value)
+        return CacheEntry(value=value, stored_at=row[1])
+
+    def set(self, key: str, entry: CacheEntry, ttl_seconds: float) -> None:
+        encoded = json.dumps(entry.value, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, encoded, entry.stored_at, entry.stored_at + ttl_seconds),
+            )
+            self._writes += 1
+            if self._writes % PURGE_EVERY_WRITES == 0:
+                self._connection.execute(
+                    "DELETE FROM cache_entries WHERE expires_at < ?",
+                    (self._clock(),),
+                )
+        self._remember_decoded(key, entry.stored_at, entry.value)
+
+    def try_acquire_refresh(self, key: str, lease_seconds: float) -> bool:
+        now = self._clock()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO refresh_locks (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, "
+                "expires_at = excluded.expires_at WHERE refresh_locks.expires_at < ?",
+                (key, self._owner, now + lease_seconds, now),
+            )
+            return cursor.rowcount == 1
+
+    def release_refresh(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM refresh_locks WHERE key = ? AND owner = ?",
+                (key, self._owner),
+            )
+
+    def size(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE expires_at >= ?",
+                (self._clock(),),
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._decoded.clear()
+            self._connection.close()
+
+    def _remember_decoded(self, key: str, stored_at: float, value: Any) -> None:
+        with self._lock:
+            self._decoded[key] = (stored_at, value)
+            self._decoded.move_to_end(key)
+            while len(self._decoded) > DECODED_ENTRIES_LIMIT:
+                self._decoded.popitem(last=False)
@@ -2,8 +2,14 @@
 Path: src/interface_adapter/controllers/fastapi_proxy_controllers.py
 """
 
-from typing import Any
-
+from typing import Any, AsyncGenerator, AsyncIterator
+
+from src.use_case.field_projection import (
+    FieldTree,
+    parse_fields,
+    project_payload_items,
+    project_value,
+)
 from src.use_case.gateways.chatwoot_proxy_gateway import ChatwootProxyGateway
 
 
@@ -29,9 +35,54 @@ class GetContactsController:
     def __init__(self, client: ChatwootProxyGateway) -> None:
         self._client = client
 
-    async def run(self, account_id: int, page: str | None) -> dict[str, Any]:
+    async def run(
+        self,
+        account_id: int,
+        page: str | None,
+        fields: str | None = None,
+    ) -> dict[str, Any]:
         self._client.enforce_account_id(account_id)
-        return await self._client.get_contacts(account_id=account_id, page=page)
+        projection = parse_fields(fields)
+        result = await self._client.get_contacts(account_id=account_id, page=page)
+        return project_payload_items(result, projection)
+
+
+class StreamContactsController:
+    """`contacts?page=all` as one list of contacts per upstream page.
+
+    The first page is fetched inside `run`, so validation and upstream errors
+    still surface before the response starts.
+    """
+
+    def __init__(self, client: ChatwootProxyGateway) -> None:
+        self._client = client
+
+    async def run(
+        self,
+        account_id: int,
+        fields: str | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        self._client.enforce_account_id(account_id)
+        projection = parse_fields(fields)
+        pages = self._client.stream_contacts_all(account_id)
+        try:
+            first_page = await anext(pages)
+        except StopAsyncIteration:
+            first_page = []
+        return _projected_pages(first_page, pages, projection)
+
+
+async def _projected_pages(
+    first_page: list[Any],
+    pages: AsyncGenerator[list[Any], None],
+    projection: FieldTree | None,
+) -> AsyncIterator[list[Any]]:
+    try:
+        yield first_page if projection is None else project_value(first_page, projection)
+        async for page in pages:
+            yield page if projection is None else project_value(page, projection)
+    finally:
+        await pages.aclose()
 
 
 class GetContactByIdController:
@@ -43,6 +94,18 @@ class GetContactByIdController:
         return await self._client.get_contact_by_id(account_id=account_id, contact_id=contact_id)
 
 
+class GetContactConversationsController:
+    def __init__(self, client: ChatwootProxyGateway) -> None:
+        self._client = client
+
+    async def run(self, account_id: int, contact_id: int) -> dict[str, Any]:
+        self._client.enforce_account_id(account_id)
+        return await self._client.get_contact_conversations(
+            account_id=account_id,
+            contact_id=contact_id,
+        )
+
+
 class GetConversationsController:
     def __init__(self, client: ChatwootProxyGateway) -> None:
         self._client = client
@@ -53,14 +116,37 @@ class GetConversationsController:
         page: str | None,
         status: str | None,
         inbox_id: int | None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         self._client.enforce_account_id(account_id)
-        return await self._client.get_conversations(
+        projection = parse_fields(fields)
+        result = await self._client.get_conversations(
             account_id=account_id,
             page=page,
             status=status,
             inbox_id=inbox_id,
         )
+        return project_payload_items(result, projection)
+
+
+class GetConversationsBatchController:
+    def __init__(self, client: ChatwootProxyGateway) -> None:
+        self._client = client
+
+    async def run(
+        self,
+        account_id: int,
+        conversation_ids: list[int],
+        resources: list[str] | None,
+        messages_page: str | None,
+    ) -> dict[str, Any]:
+        self._client.enforce_account_id(account_id)
+        return await self._client.get_conversations_batch(
+            account_id=account_id,
+            conversation_ids=conversation_ids,
+            resources=resources,
+            messages_page=messages_page,
+        )
 
 
 class GetConversationByIdController:
@@ -84,12 +170,16 @@ class GetConversationMessagesController:
         account_id: int,
         conversation_id: int,
         page: str | None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         self._client.enforce_account_id(account_id)
+        projection = parse_fields(fields)
+        # Projected by the client before sanitizing: dropped fields cost nothing.
         return await self._client.get_conversation_messages(
             account_id=account_id,
             conversation_id=conversation_id,
             page=page,
+            projection=projection,
         )
 
 
@@ -97,8 +187,11 @@ __all__ = [
     "GetInboxesController",
     "GetInboxByIdController",
     "GetContactsController",
+    "StreamContactsController",
     "GetContactByIdController",
+    "GetContactConversationsController",
     "GetConversationsController",
+    "GetConversationsBatchController",
     "GetConversationByIdController",
     "GetConversationMessagesController",
 ]
@@ -0,0 +1,12 @@
+"""
+Path: src/interface_adapter/presenters/pre_serialized_json.py
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PreSerializedJson:
+    """UTF-8 JSON body a controller already rendered; sent without re-encoding."""
+
+    body: bytes
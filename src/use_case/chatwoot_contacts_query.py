@@ -2,9 +2,13 @@
 Path: src/use_case/chatwoot_contacts_query.py
 """
 
-from typing import Any, Awaitable, Callable
+from typing import Any, AsyncGenerator, Awaitable, Callable
 
 from src.entities.chatwoot_contact import ChatwootContact
+from src.use_case.concurrent_pagination import (
+    fetch_all_pages_concurrently_async,
+    iter_pages_concurrently_async,
+)
 
 
 def find_contact_in_paginated_contacts(
@@ -87,6 +91,44 @@ async def fetch_all_contacts_paginated_async(
     return contacts
 
 
+async def fetch_all_contacts_concurrently_async(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    page_size: int,
+    max_concurrency: int,
+) -> list[Any]:
+    return await fetch_all_pages_concurrently_async(
+        fetch_page=fetch_page,
+        extract_items=_extract_contacts,
+        extract_total_count=lambda payload: _extract_total_count(
+            payload, default=len(_extract_contacts(payload))
+        ),
+        page_size=page_size,
+        max_concurrency=max_concurrency,
+        # The page count comes from the upstream total, so it cannot run away;
+        # large accounts must get every contact, as the sequential walk did.
+        max_pages=None,
+    )
+
+
+def iter_all_contacts_concurrently_async(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    page_size: int,
+    max_concurrency: int,
+) -> AsyncGenerator[list[Any], None]:
+    return iter_pages_concurrently_async(
+        fetch_page=fetch_page,
+        extract_items=_extract_contacts,
+        extract_total_count=lambda payload: _extract_total_count(
+            payload, default=len(_extract_contacts(payload))
+        ),
+        page_size=page_size,
+        max_concurrency=max_concurrency,
+        # The page count comes from the upstream total, so it cannot run away;
+        # large accounts must get every contact, as the sequential walk did.
+        max_pages=None,
+    )
+
+
 def _extract_contacts(payload: dict[str, Any]) -> list[Any]:
     raw_contacts = payload.get("payload", [])
     if isinstance(raw_contacts, list):
@@ -118,4 +160,4 @@ def _find_contact_raw_by_id(contacts: list[Any], contact_id: int) -> dict[str, A
 
 
 def _to_contact(raw: dict[str, Any]) -> ChatwootContact:
-    return ChatwootContact(id=int(raw.get("id", -1)), raw=raw)
+    return ChatwootContact(id=int(raw.get("id", -1)), raw=raw)
@@ -0,0 +1,131 @@
+"""
+Path: src/use_case/concurrent_pagination.py
+"""
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterable
+
+DEFAULT_MAX_PAGES = 500
+
+
+async def fetch_all_pages_concurrently_async(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    extract_items: Callable[[dict[str, Any]], list[Any]],
+    extract_total_count: Callable[[dict[str, Any]], int | None],
+    page_size: int | None,
+    max_concurrency: int,
+    max_pages: int | None = DEFAULT_MAX_PAGES,
+) -> list[Any]:
+    """Fetch every page, keeping page order, with bounded parallelism."""
+    items: list[Any] = []
+    async for page_items in iter_pages_concurrently_async(
+        fetch_page=fetch_page,
+        extract_items=extract_items,
+        extract_total_count=extract_total_count,
+        page_size=page_size,
+        max_concurrency=max_concurrency,
+        max_pages=max_pages,
+    ):
+        items.extend(page_items)
+    return items
+
+
+async def iter_pages_concurrently_async(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    extract_items: Callable[[dict[str, Any]], list[Any]],
+    extract_total_count: Callable[[dict[str, Any]], int | None],
+    page_size: int | None,
+    max_concurrency: int,
+    max_pages: int | None = DEFAULT_MAX_PAGES,
+) -> AsyncGenerator[list[Any], None]:
+    """Yield the items of each page, in page order, as soon as they arrive.
+
+    With a known total count the remaining pages are fetched through a
+    sliding window: at most `max_concurrency` requests in flight and at most
+    twice that many pages buffered, however long the collection is.
+    Otherwise pages are probed in windows of `max_concurrency` until a short
+    (or empty) page shows the end of the collection.
+
+    The first page (and the page-limit check) happens before anything is
+    yielded, so callers can surface those errors before they start output.
+    `max_pages=None` disables the limit.
+    """
+    first_payload = await fetch_page(1)
+    first_items = extract_items(first_payload)
+    max_concurrency = max(1, max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_fetch(page_number: int) -> list[Any]:
+        async with semaphore:
+            return extract_items(await fetch_page(page_number))
+
+    total_count = extract_total_count(first_payload)
+    if total_count is not None and page_size:
+        total_pages = max(1, (total_count + page_size - 1) // page_size)
+        if max_pages is not None and total_pages > max_pages:
+            raise ValueError(
+                f"Paginacion excede el maximo permitido ({total_pages} > {max_pages} paginas)"
+            )
+        yield first_items
+        async for page_items in _iter_in_order(
+            bounded_fetch,
+            range(2, total_pages + 1),
+            window=2 * max_concurrency,
+        ):
+            yield page_items
+        return
+
+    yield first_items
+    previous_items = first_items
+    next_page = 2
+    while not _is_last_page(previous_items, page_size):
+        if max_pages is not None and next_page > max_pages:
+            raise ValueError(
+                f"Paginacion excede el maximo permitido ({max_pages} paginas)"
+            )
+        last_page = next_page + max_concurrency
+        if max_pages is not None:
+            last_page = min(last_page, max_pages + 1)
+        window = range(next_page, last_page)
+        pages = await asyncio.gather(*(bounded_fetch(page_number) for page_number in window))
+        for page_items in pages:
+            if page_items == previous_items:
+                # Upstream ignored the page parameter: stop instead of looping forever.
+                return
+            yield page_items
+            previous_items = page_items
+            if _is_last_page(page_items, page_size):
+                break
+        next_page = window.stop
+
+
+async def _iter_in_order(
+    fetch: Callable[[int], Awaitable[list[Any]]],
+    page_numbers: Iterable[int],
+    window: int,
+) -> AsyncGenerator[list[Any], None]:
+    pending: deque[asyncio.Task[list[Any]]] = deque()
+    numbers = iter(page_numbers)
+    try:
+        for page_number in islice(numbers, window):
+            pending.append(asyncio.ensure_future(fetch(page_number)))
+        while pending:
+            page_items = await pending.popleft()
+            page_number = next(numbers, None)
+            if page_number is not None:
+                pending.append(asyncio.ensure_future(fetch(page_number)))
+            yield page_items
+    finally:
+        # A consumer that stops early (client disconnect) must not leave
+        # orphan requests running against Chatwoot.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _is_last_page(page_items: list[Any], page_size: int | None) -> bool:
+    if not page_items:
+        return True
+    return page_size is not None and len(page_items) < page_size
@@ -0,0 +1,38 @@
+"""
+Path: src/use_case/cursor_pagination.py
+"""
+
+from typing import Any, Awaitable, Callable
+
+
+async def fetch_all_pages_by_cursor_async(
+    fetch_page: Callable[[int | None], Awaitable[Any]],
+    extract_items: Callable[[Any], list[Any]],
+    extract_item_id: Callable[[Any], int | None],
+) -> list[Any]:
+    """Walk a `before=<id>` cursor from the newest page back to the oldest.
+
+    `fetch_page(None)` returns the newest page; each next call asks for the
+    items older than the smallest id seen so far. The walk stops on an empty
+    page, or when a page brings nothing older (upstream ignored the cursor).
+    The cursor strictly decreases, so the walk always ends. Each page is
+    ordered oldest first, so the result is too.
+    """
+    pages: list[list[Any]] = []
+    before: int | None = None
+    while True:
+        items = extract_items(await fetch_page(before))
+        if before is not None:
+            items = [item for item in items if _is_older(extract_item_id(item), before)]
+        if not items:
+            break
+        pages.append(items)
+        ids = [item_id for item_id in map(extract_item_id, items) if item_id is not None]
+        if not ids:
+            break
+        before = min(ids)
+    return [item for page in reversed(pages) for item in page]
+
+
+def _is_older(item_id: int | None, before: int) -> bool:
+    return item_id is not None and item_id < before
@@ -0,0 +1,92 @@
+"""
+Path: src/use_case/field_projection.py
+"""
+
+from typing import Any
+
+from src.use_case.errors import ProxyGatewayError
+
+MAX_PROJECTION_FIELDS = 50
+
+FieldTree = dict[str, "FieldTree | None"]
+
+
+def parse_fields(raw_fields: str | None) -> FieldTree | None:
+    """Parse `fields=id,sender.type,content` into a nested tree of paths.
+
+    A leaf (`None`) keeps the whole value; a parent path wins over its
+    children (`sender,sender.type` keeps all of `sender`).
+    """
+    if raw_fields is None:
+        return None
+    paths = [path.strip() for path in raw_fields.split(",") if path.strip()]
+    if not paths:
+        return None
+    if len(paths) > MAX_PROJECTION_FIELDS:
+        raise ProxyGatewayError(
+            status_code=422,
+            detail=f"Maximo {MAX_PROJECTION_FIELDS} campos en 'fields'.",
+        )
+
+    tree: FieldTree = {}
+    for path in paths:
+        segments = path.split(".")
+        if any(not segment for segment in segments):
+            raise ProxyGatewayError(
+                status_code=422,
+                detail=f"Campo invalido en 'fields': '{path}'.",
+            )
+        node = tree
+        for segment in segments[:-1]:
+            child = node.get(segment, {})
+            if child is None:
+                break
+            node = node.setdefault(segment, child)
+        else:
+            node[segments[-1]] = None
+    return tree
+
+
+def format_fields(tree: FieldTree) -> str:
+    """Canonical `fields` string for a tree: the same selection, the same key."""
+    paths: list[str] = []
+    for key in sorted(tree):
+        subtree = tree[key]
+        if subtree is None:
+            paths.append(key)
+        else:
+            paths.extend(f"{key}.{path}" for path in format_fields(subtree).split(","))
+    return ",".join(paths)
+
+
+def project_value(value: Any, tree: FieldTree) -> Any:
+    """Keep only the selected paths. Lists are projected item by item."""
+    if isinstance(value, list):
+        return [project_value(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected: dict[str, Any] = {}
+    for key, subtree in tree.items():
+        if key not in value:
+            continue
+        item = value[key]
+        projected[key] = item if subtree is None else project_value(item, subtree)
+    return projected
+
+
+def project_payload_items(payload: Any, tree: FieldTree | None) -> Any:
+    """Project each item of a Chatwoot listing, leaving `meta` untouched.
+
+    Items live in `payload` (contacts, messages, `page=all` responses) or in
+    `data.payload` (conversations). The input is never mutated: responses
+    may be shared with the proxy cache.
+    """
+    if tree is None or not isinstance(payload, dict):
+        return payload
+    data = payload.get("data")
+    if isinstance(data, dict) and isinstance(data.get("payload"), list):
+        return {**payload, "data": {**data, "payload": project_value(data["payload"], tree)}}
+    items = payload.get("payload")
+    if isinstance(items, list):
+        return {**payload, "payload": project_value(items, tree)}
+    return payload
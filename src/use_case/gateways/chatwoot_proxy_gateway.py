@@ -2,7 +2,9 @@
 Path: src/use_case/gateways/chatwoot_proxy_gateway.py
 """
 
-from typing import Any, Protocol
+from typing import Any, AsyncGenerator, Protocol
+
+from src.use_case.field_projection import FieldTree
 
 
 class ChatwootProxyGateway(Protocol):
@@ -18,9 +20,19 @@ class ChatwootProxyGateway(Protocol):
     async def get_contacts(self, account_id: int, page: str | None) -> dict[str, Any]:
         ...
 
+    def stream_contacts_all(self, account_id: int) -> AsyncGenerator[list[Any], None]:
+        ...
+
     async def get_contact_by_id(self, account_id: int, contact_id: int) -> dict[str, Any]:
         ...
 
+    async def get_contact_conversations(
+        self,
+        account_id: int,
+        contact_id: int,
+    ) -> dict[str, Any]:
+        ...
+
     async def get_conversations(
         self,
         account_id: int,
@@ -30,6 +42,15 @@ class ChatwootProxyGateway(Protocol):
     ) -> dict[str, Any]:
         ...
 
+    async def get_conversations_batch(
+        self,
+        account_id: int,
+        conversation_ids: list[int],
+        resources: list[str] | None,
+        messages_page: str | None,
+    ) -> dict[str, Any]:
+        ...
+
     async def get_conversation_by_id(
         self,
         account_id: int,
@@ -42,5 +63,6 @@ class ChatwootProxyGateway(Protocol):
         account_id: int,
         conversation_id: int,
         page: str | None,
+        projection: FieldTree | None = None,
     ) -> dict[str, Any]:
         ...
@@ -0,0 +1,58 @@
+"""Settings, upstream responses and transports shared by the proxy tests."""
+
+from typing import Any
+
+from src.infrastructure.settings.env_settings import ChatwootSettings
+
+INBOXES_PAYLOAD = {"payload": [{"id": 1, "name": "WhatsApp"}]}
+
+
+def proxy_settings(**overrides: Any) -> ChatwootSettings:
+    values: dict[str, Any] = {
+        "base_url": "https://chatwoot.example.com",
+        "account_id": 7,
+        "api_access_token": "token-123",
+        "proxy_api_key": "proxy-secret",
+        "timeout_seconds": 9.0,
+        "tls_verify": True,
+    }
+    values.update(overrides)
+    return ChatwootSettings(**values)
+
+
+class FakeResponse:
+    """Chatwoot response as a transport returns it; `json()` counts its calls."""
+
+    def __init__(
+        self,
+        status_code: int,
+        payload: object,
+        text: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+        self.headers = {"content-type": "application/json"} if headers is None else headers
+        self.json_calls = 0
+
+    def json(self) -> object:
+        self.json_calls += 1
+        if self.status_code == 304:
+            raise ValueError("empty body")
+        return self._payload
+
+
+class InboxesTransport:
+    """Async transport that answers every GET with one inboxes page, or raises `error`."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self._error = error
+        self.calls = 0
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, headers, params, timeout, verify)
+        self.calls += 1
+        if self._error is not None:
+            raise self._error
+        return FakeResponse(200, INBOXES_PAYLOAD)
@@ -0,0 +1,185 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from src.infrastructure.fastapi_app.admission import (
+    FANOUT,
+    LOOKUP,
+    AdmissionController,
+    AdmissionMiddleware,
+    classify_request,
+)
+
+
+def _scope(path: str, query: bytes = b"", method: str = "GET") -> dict:
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": [],
+    }
+
+
+class ClassifyRequestTest(unittest.TestCase):
+    def test_page_all_and_batch_are_fanout(self) -> None:
+        self.assertEqual(
+            classify_request(_scope("/api/v1/accounts/7/contacts", b"page=all")), FANOUT
+        )
+        self.assertEqual(
+            classify_request(
+                _scope("/api/v1/accounts/7/conversations/batch", method="POST")
+            ),
+            FANOUT,
+        )
+
+    def test_contact_detail_walks_pages_so_it_is_fanout(self) -> None:
+        self.assertEqual(classify_request(_scope("/api/v1/accounts/7/contacts/42")), FANOUT)
+        self.assertEqual(
+            classify_request(_scope("/api/v1/accounts/7/contacts/42/conversations")), LOOKUP
+        )
+
+    def test_single_pages_are_lookups_and_local_routes_are_exempt(self) -> None:
+        self.assertEqual(
+            classify_request(_scope("/api/v1/accounts/7/contacts", b"page=2")), LOOKUP
+        )
+        self.assertEqual(classify_request(_scope("/api/v1/accounts/7/inboxes/3")), LOOKUP)
+        self.assertIsNone(classify_request(_scope("/health")))
+        self.assertIsNone(classify_request(_scope("/metrics")))
+
+
+class AdmissionControllerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_waiter_is_admitted_when_a_slot_is_released(self) -> None:
+        admission = AdmissionController(max_fanout=1, queue_timeout_seconds=1.0)
+        self.assertTrue(await admission.acquire(FANOUT))
+
+        waiting = asyncio.create_task(admission.acquire(FANOUT))
+        await asyncio.sleep(0)
+        self.assertEqual(admission.waiting(FANOUT), 1)
+        admission.release(FANOUT)
+
+        self.assertTrue(await waiting)
+        stats = admission.stats()[FANOUT]
+        self.assertEqual((stats.admitted, stats.queued, stats.shed), (2, 1, 0))
+        self.assertEqual(admission.in_flight(FANOUT), 1)
+
+    async def test_sheds_when_the_wait_expires_or_the_queue_is_full(self) -> None:
+        admission = AdmissionController(
+            max_fanout=1, queue_timeout_seconds=0.01, max_queue=1
+        )
+        self.assertTrue(await admission.acquire(FANOUT))
+        waiting = asyncio.create_task(admission.acquire(FANOUT))
+        await asyncio.sleep(0)
+
+        self.assertFalse(await admission.acquire(FANOUT))
+        self.assertFalse(await waiting)
+        self.assertEqual(admission.stats()[FANOUT].shed, 2)
+        self.assertEqual(admission.waiting(FANOUT), 0)
+        self.assertEqual(admission.in_flight(), 1)
+
+    async def test_lookups_are_admitted_while_fanout_is_saturated(self) -> None:
+        admission = AdmissionController(
+            max_in_flight=3, max_fanout=1, queue_timeout_seconds=0
+        )
+        self.assertTrue(await admission.acquire(FANOUT))
+        self.assertFalse(await admission.acquire(FANOUT))
+
+        self.assertTrue(await admission.acquire(LOOKUP))
+        self.assertTrue(await admission.acquire(LOOKUP))
+        self.assertFalse(await admission.acquire(LOOKUP))
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self) -> None:
+        admission = AdmissionController(max_fanout=1, queue_timeout_seconds=1.0)
+        self.assertTrue(await admission.acquire(FANOUT))
+        waiting = asyncio.create_task(admission.acquire(FANOUT))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        admission.release(FANOUT)
+
+        self.assertEqual(admission.in_flight(), 0)
+        self.assertEqual(admission.in_flight(FANOUT), 0)
+        self.assertEqual(admission.waiting(FANOUT), 0)
+
+    async def test_slot_handed_over_as_the_wait_times_out_is_kept(self) -> None:
+        admission = AdmissionController(max_fanout=1, queue_timeout_seconds=1.0)
+        self.assertTrue(await admission.acquire(FANOUT))
+
+        async def release_then_time_out(waiter, _timeout):
+            admission.release(FANOUT)
+            self.assertTrue(waiter.done())
+            raise asyncio.TimeoutError
+
+        with mock.patch.object(asyncio, "wait_for", release_then_time_out):
+            admitted = await admission.acquire(FANOUT)
+
+        self.assertTrue(admitted)
+        self.assertEqual(admission.in_flight(FANOUT), 1)
+        admission.release(FANOUT)
+        self.assertEqual(admission.in_flight(), 0)
+        self.assertEqual(admission.in_flight(FANOUT), 0)
+
+class AdmissionMiddlewareTest(unittest.IsolatedAsyncioTestCase):
+    async def test_excess_request_gets_503_with_retry_after(self) -> None:
+        admission = AdmissionController(max_fanout=1, queue_timeout_seconds=0)
+        release = asyncio.Event()
+
+        async def app(scope, receive, send) -> None:
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"[]"})
+
+        middleware = AdmissionMiddleware(app, admission_provider=lambda: admission)
+
+        async def call(scope) -> list[dict]:
+            messages: list[dict] = []
+
+            async def send(message) -> None:
+                messages.append(message)
+
+            await middleware(scope, None, send)
+            return messages
+
+        scope = _scope("/api/v1/accounts/7/contacts", b"page=all")
+        first = asyncio.create_task(call(scope))
+        await asyncio.sleep(0)
+        shed = await call(scope)
+        release.set()
+        admitted = await first
+
+        self.assertEqual(shed[0]["status"], 503)
+        self.assertIn((b"retry-after", b"1"), shed[0]["headers"])
+        self.assertEqual(admitted[0]["status"], 200)
+        self.assertEqual(admission.in_flight(), 0)
+
+    async def test_unauthorized_requests_skip_admission(self) -> None:
+        admission = AdmissionController(max_fanout=1, queue_timeout_seconds=0)
+        seen_in_flight: list[int] = []
+
+        async def app(scope, receive, send) -> None:
+            seen_in_flight.append(admission.in_flight())
+            await send({"type": "http.response.start", "status": 401, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        middleware = AdmissionMiddleware(
+            app,
+            admission_provider=lambda: admission,
+            is_authorized=lambda scope: False,
+        )
+        self.assertTrue(await admission.acquire("fanout"))
+        messages: list[dict] = []
+
+        async def send(message) -> None:
+            messages.append(message)
+
+        await middleware(_scope("/api/v1/accounts/7/contacts", b"page=all"), None, send)
+
+        self.assertEqual(messages[0]["status"], 401)
+        self.assertEqual(seen_in_flight, [1])
+        self.assertEqual(admission.stats()["fanout"].shed, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
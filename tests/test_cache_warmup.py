@@ -0,0 +1,118 @@
+import unittest
+
+from src.infrastructure.fastapi_app.cache_warmup import (
+    WarmupProgress,
+    run_cache_warmup,
+    start_cache_warmup,
+)
+from src.infrastructure.settings.env_settings import ProxyTuningSettings
+from src.use_case.errors import ProxyGatewayError
+
+
+class _RecordingProxyClient:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def get_inboxes(self, account_id: int):
+        self.calls.append(f"inboxes:{account_id}")
+        return []
+
+    async def get_contacts(self, account_id: int, page: str | None):
+        self.calls.append(f"contacts:{account_id}:{page}")
+        if page == "2":
+            raise ProxyGatewayError(status_code=504, detail="timeout")
+        return {"payload": []}
+
+    async def get_conversations(
+        self,
+        account_id: int,
+        page: str | None,
+        status: str | None,
+        inbox_id: int | None,
+    ):
+        _ = inbox_id
+        self.calls.append(f"conversations:{account_id}:{page}:{status}")
+        return {"payload": []}
+
+
+class CacheWarmupTest(unittest.IsolatedAsyncioTestCase):
+    async def test_warmup_primes_inboxes_first_then_pages(self) -> None:
+        client = _RecordingProxyClient()
+        progress = WarmupProgress()
+
+        await run_cache_warmup(
+            client,
+            account_id=7,
+            contacts_pages=2,
+            conversations_pages=1,
+            progress=progress,
+        )
+
+        self.assertEqual(client.calls[0], "inboxes:7")
+        self.assertCountEqual(
+            client.calls[1:],
+            ["contacts:7:1", "contacts:7:2", "conversations:7:1:open"],
+        )
+        self.assertEqual(progress.total_steps, 4)
+        self.assertEqual(progress.completed_steps, 3)
+        self.assertEqual(progress.failed_steps, 1)
+        self.assertEqual(progress.state, "partial")
+        self.assertIsNotNone(progress.as_dict()["duration_seconds"])
+
+    async def test_warmup_reports_done_when_every_step_succeeds(self) -> None:
+        progress = WarmupProgress()
+
+        await run_cache_warmup(
+            _RecordingProxyClient(),
+            account_id=7,
+            contacts_pages=1,
+            conversations_pages=0,
+            progress=progress,
+        )
+
+        self.assertEqual(progress.state, "done")
+        self.assertEqual(progress.completed_steps, 2)
+
+    async def test_warmup_is_skipped_when_the_cache_is_disabled(self) -> None:
+        client = _RecordingProxyClient()
+        progress = WarmupProgress()
+
+        with self.assertLogs(
+            "src.infrastructure.fastapi_app.cache_warmup", level="WARNING"
+        ) as logs:
+            task = start_cache_warmup(
+                client,
+                account_id=7,
+                tuning=ProxyTuningSettings(warmup_enabled=True, cache_enabled=False),
+                progress=progress,
+            )
+
+        self.assertIsNone(task)
+        self.assertEqual(progress.state, "skipped")
+        self.assertEqual(client.calls, [])
+        self.assertIn("cache_warmup_skipped", logs.output[0])
+
+    async def test_warmup_starts_in_background_when_the_cache_is_enabled(self) -> None:
+        client = _RecordingProxyClient()
+        progress = WarmupProgress()
+
+        task = start_cache_warmup(
+            client,
+            account_id=7,
+            tuning=ProxyTuningSettings(
+                warmup_enabled=True,
+                cache_enabled=True,
+                warmup_contacts_pages=1,
+                warmup_conversations_pages=0,
+            ),
+            progress=progress,
+        )
+
+        self.assertEqual(progress.state, "pending")
+        await task
+        self.assertEqual(client.calls, ["inboxes:7", "contacts:7:1"])
+        self.assertEqual(progress.state, "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,327 @@
+import asyncio
+import unittest
+from typing import Any
+
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    PAGE_SIZE,
+    ChatwootFastApiProxyClient,
+    ChatwootProxyError,
+)
+from src.use_case.concurrent_pagination import (
+    fetch_all_pages_concurrently_async,
+    iter_pages_concurrently_async,
+)
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+class _PagedAsyncTransport:
+    def __init__(self, pages: dict[int, object]) -> None:
+        self._pages = pages
+        self.params: list[dict[str, Any]] = []
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, headers, timeout, verify)
+        self.params.append(dict(params or {}))
+        await asyncio.sleep(0)
+        return FakeResponse(200, self._pages.get(params["page"], {"payload": []}))
+
+
+class _MessagesCursorTransport:
+    """Chatwoot-like messages endpoint: newest page first, `before` cursor."""
+
+    def __init__(self, message_ids, page_size: int, ignore_cursor: bool = False) -> None:
+        self._ids = list(message_ids)
+        self._page_size = page_size
+        self._ignore_cursor = ignore_cursor
+        self.params: list[dict[str, Any]] = []
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, headers, timeout, verify)
+        self.params.append(dict(params or {}))
+        before = None if self._ignore_cursor else (params or {}).get("before")
+        older = [item_id for item_id in self._ids if before is None or item_id < before]
+        page = older[-self._page_size:]
+        return FakeResponse(
+            200,
+            {
+                "meta": {},
+                "payload": [
+                    {"id": item_id, "sender": {"email": "user@example.com"}}
+                    for item_id in page
+                ],
+            },
+        )
+
+
+def _items(payload: dict[str, Any]) -> list[Any]:
+    return payload["payload"]
+
+
+class ConcurrentPaginationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_known_total_fans_out_with_bounded_concurrency_in_order(self) -> None:
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001 * (10 - page))
+            in_flight -= 1
+            return {"payload": [page], "meta": {"count": 10}}
+
+        items = await fetch_all_pages_concurrently_async(
+            fetch_page=fetch_page,
+            extract_items=_items,
+            extract_total_count=lambda payload: payload["meta"]["count"],
+            page_size=1,
+            max_concurrency=3,
+        )
+
+        self.assertEqual(items, list(range(1, 11)))
+        self.assertLessEqual(max_in_flight, 3)
+
+    async def test_unknown_total_probes_until_empty_page(self) -> None:
+        fetched: list[int] = []
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            fetched.append(page)
+            return {"payload": [page] if page <= 5 else []}
+
+        items = await fetch_all_pages_concurrently_async(
+            fetch_page=fetch_page,
+            extract_items=_items,
+            extract_total_count=lambda _payload: None,
+            page_size=None,
+            max_concurrency=2,
+        )
+
+        self.assertEqual(items, [1, 2, 3, 4, 5])
+        # At most one probing window past the last page.
+        self.assertLessEqual(max(fetched), 7)
+
+    async def test_unknown_total_stops_when_upstream_ignores_page(self) -> None:
+        async def fetch_page(_page: int) -> dict[str, Any]:
+            return {"payload": [1, 2]}
+
+        items = await fetch_all_pages_concurrently_async(
+            fetch_page=fetch_page,
+            extract_items=_items,
+            extract_total_count=lambda _payload: None,
+            page_size=None,
+            max_concurrency=4,
+        )
+
+        self.assertEqual(items, [1, 2])
+
+    async def test_too_many_pages_raises_value_error(self) -> None:
+        async def fetch_page(_page: int) -> dict[str, Any]:
+            return {"payload": [1], "meta": {"count": 1000}}
+
+        with self.assertRaises(ValueError):
+            await fetch_all_pages_concurrently_async(
+                fetch_page=fetch_page,
+                extract_items=_items,
+                extract_total_count=lambda payload: payload["meta"]["count"],
+                page_size=1,
+                max_concurrency=4,
+                max_pages=10,
+            )
+
+    async def test_iter_pages_yields_each_page_in_order_with_bounded_buffer(self) -> None:
+        started: list[int] = []
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            started.append(page)
+            await asyncio.sleep(0.001 * (page % 3))
+            return {"payload": [page], "meta": {"count": 40}}
+
+        pages = iter_pages_concurrently_async(
+            fetch_page=fetch_page,
+            extract_items=_items,
+            extract_total_count=lambda payload: payload["meta"]["count"],
+            page_size=1,
+            max_concurrency=2,
+        )
+
+        received = []
+        async for page_items in pages:
+            received.append(page_items)
+            # Never more than two windows ahead of what the consumer has taken.
+            self.assertLessEqual(max(started), page_items[0] + 4)
+
+        self.assertEqual(received, [[page] for page in range(1, 41)])
+
+    async def test_iter_pages_cancels_pending_fetches_when_closed(self) -> None:
+        started: list[int] = []
+        cancelled: list[int] = []
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            if page > 1:
+                started.append(page)
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return {"payload": [page], "meta": {"count": 10}}
+
+        pages = iter_pages_concurrently_async(
+            fetch_page=fetch_page,
+            extract_items=_items,
+            extract_total_count=lambda payload: payload["meta"]["count"],
+            page_size=1,
+            max_concurrency=2,
+        )
+
+        self.assertEqual(await anext(pages), [1])
+        waiting = asyncio.ensure_future(anext(pages))
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        await pages.aclose()
+
+        self.assertTrue(cancelled)
+        self.assertEqual(sorted(cancelled), sorted(started))
+
+    async def test_proxy_conversations_page_all_preserves_filters(self) -> None:
+        pages = {
+            page: {
+                "data": {
+                    "meta": {"all_count": 30},
+                    "payload": [{"id": page * 100 + i} for i in range(25 if page == 1 else 5)],
+                }
+            }
+            for page in (1, 2)
+        }
+        transport = _PagedAsyncTransport(pages)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        result = await client.get_conversations(
+            account_id=7,
+            page="all",
+            status="open",
+            inbox_id=2,
+        )
+
+        self.assertEqual(result["meta"]["count"], 30)
+        self.assertEqual(result["meta"]["current_page"], "all")
+        self.assertEqual(result["meta"]["status"], "open")
+        self.assertEqual(
+            sorted(params["page"] for params in transport.params),
+            [1, 2],
+        )
+        for params in transport.params:
+            self.assertEqual(params["status"], "open")
+            self.assertEqual(params["inbox_id"], 2)
+
+    async def test_proxy_messages_page_all_walks_the_before_cursor(self) -> None:
+        transport = _MessagesCursorTransport(message_ids=range(1, 46), page_size=20)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        result = await client.get_conversation_messages(
+            account_id=7,
+            conversation_id=101,
+            page="all",
+        )
+
+        self.assertEqual([item["id"] for item in result["payload"]], list(range(1, 46)))
+        self.assertEqual(result["meta"]["count"], 45)
+        self.assertEqual(result["payload"][0]["sender"]["email"], "us...om")
+        self.assertEqual(transport.params, [{}, {"before": 26}, {"before": 6}, {"before": 1}])
+
+    async def test_proxy_messages_page_all_projection_without_id_still_walks(self) -> None:
+        transport = _MessagesCursorTransport(message_ids=range(1, 46), page_size=20)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        result = await client.get_conversation_messages(
+            account_id=7,
+            conversation_id=101,
+            page="all",
+            projection={"sender": {"email": None}},
+        )
+
+        self.assertEqual(len(result["payload"]), 45)
+        self.assertEqual(result["payload"][0], {"sender": {"email": "us...om"}})
+        self.assertEqual(len(transport.params), 4)
+
+    async def test_proxy_messages_page_all_stops_when_cursor_is_ignored(self) -> None:
+        transport = _MessagesCursorTransport(
+            message_ids=range(1, 46), page_size=20, ignore_cursor=True
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        result = await client.get_conversation_messages(
+            account_id=7,
+            conversation_id=101,
+            page="all",
+        )
+
+        self.assertEqual([item["id"] for item in result["payload"]], list(range(26, 46)))
+        self.assertEqual(len(transport.params), 2)
+
+    async def test_proxy_streams_contacts_page_by_page(self) -> None:
+        pages = {
+            page: {
+                "payload": [
+                    {"id": page * 100 + i}
+                    for i in range(PAGE_SIZE if page == 1 else 1)
+                ],
+                "meta": {"count": PAGE_SIZE + 1},
+            }
+            for page in (1, 2)
+        }
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=_PagedAsyncTransport(pages),
+        )
+
+        received = [page async for page in client.stream_contacts_all(account_id=7)]
+
+        self.assertEqual([len(page) for page in received], [PAGE_SIZE, 1])
+        self.assertEqual(received[1], [{"id": 200}])
+
+    async def test_proxy_contacts_page_all_is_not_capped_for_large_accounts(self) -> None:
+        total = 8000
+        pages = {
+            page: {
+                "payload": [
+                    {"id": contact_id}
+                    for contact_id in range((page - 1) * PAGE_SIZE, min(page * PAGE_SIZE, total))
+                ],
+                "meta": {"count": total},
+            }
+            for page in range(1, (total + PAGE_SIZE - 1) // PAGE_SIZE + 1)
+        }
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=_PagedAsyncTransport(pages),
+        )
+
+        result = await client.get_contacts(account_id=7, page="all")
+        streamed = [page async for page in client.stream_contacts_all(account_id=7)]
+
+        self.assertEqual(result["meta"]["count"], total)
+        self.assertEqual([item["id"] for item in result["payload"]], list(range(total)))
+        self.assertEqual(sum(len(page) for page in streamed), total)
+
+    async def test_proxy_rejects_invalid_page_value(self) -> None:
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=_PagedAsyncTransport({}),
+        )
+
+        with self.assertRaises(ChatwootProxyError) as ctx:
+            await client.get_conversation_messages(
+                account_id=7,
+                conversation_id=101,
+                page="zero",
+            )
+
+        self.assertEqual(ctx.exception.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.requests import chatwoot_fastapi_proxy_client
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.requests.chatwoot_requests_gateway import ChatwootRequestsGateway
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+class _ScriptedTransport:
+    def __init__(self, responses: list[FakeResponse]) -> None:
+        self._responses = responses
+        self.request_headers: list[dict[str, str]] = []
+
+    def _next(self, headers: dict[str, str]) -> FakeResponse:
+        self.request_headers.append(dict(headers))
+        return self._responses.pop(0)
+
+
+class _ScriptedAsyncTransport(_ScriptedTransport):
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, params, timeout, verify)
+        return self._next(headers)
+
+
+class _ScriptedSyncTransport(_ScriptedTransport):
+    def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, params, timeout, verify)
+        return self._next(headers)
+
+
+class ConditionalRequestsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_proxy_client_reuses_sanitized_payload_on_not_modified(self) -> None:
+        transport = _ScriptedAsyncTransport(
+            [
+                FakeResponse(
+                    200,
+                    {"id": 5, "meta": {"sender": {"email": "pii@example.com"}}},
+                    headers={"ETag": 'W/"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                ),
+                FakeResponse(304, None),
+            ]
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        first = await client.get_conversation_by_id(account_id=7, conversation_id=5)
+        with patch.object(
+            chatwoot_fastapi_proxy_client.CONVERSATION_PLAN,
+            "apply_in_place",
+        ) as sanitizer:
+            second = await client.get_conversation_by_id(account_id=7, conversation_id=5)
+
+        sanitizer.assert_not_called()
+        self.assertNotIn("If-None-Match", transport.request_headers[0])
+        self.assertEqual(transport.request_headers[1]["If-None-Match"], 'W/"v1"')
+        self.assertEqual(
+            transport.request_headers[1]["If-Modified-Since"],
+            "Mon, 01 Jan 2024 00:00:00 GMT",
+        )
+        self.assertIs(first["payload"], second["payload"])
+        self.assertEqual(second["payload"]["meta"]["sender"]["email"], "pi...om")
+        self.assertEqual(client.conditional_request_stats().revalidated, 1)
+
+    async def test_proxy_client_skips_validators_when_upstream_sends_none(self) -> None:
+        transport = _ScriptedAsyncTransport(
+            [
+                FakeResponse(200, {"payload": [], "meta": {"count": 0}}),
+                FakeResponse(200, {"payload": [], "meta": {"count": 0}}),
+            ]
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        await client.get_contacts(account_id=7, page="1")
+        await client.get_contacts(account_id=7, page="1")
+
+        self.assertNotIn("If-None-Match", transport.request_headers[1])
+        self.assertEqual(client.conditional_request_stats().entries, 0)
+
+    def test_requests_gateway_reuses_decoded_payload_on_not_modified(self) -> None:
+        first_response = FakeResponse(
+            200,
+            {"payload": [{"id": 1}], "meta": {"count": 1}},
+            headers={"etag": '"abc"'},
+        )
+        transport = _ScriptedSyncTransport([first_response, FakeResponse(304, None)])
+        gateway = ChatwootRequestsGateway(settings=proxy_settings(), transport=transport)
+
+        with patch(
+            "src.infrastructure.requests.chatwoot_requests_gateway.check_dns",
+            return_value=(True, "dns ok"),
+        ), patch(
+            "src.infrastructure.requests.chatwoot_requests_gateway.check_tcp",
+            return_value=(True, "tcp ok"),
+        ):
+            _, first, _ = gateway.fetch_contacts_raw_response(page=1)
+            _, response, error_detail = gateway.fetch_contacts_raw_response(page=1)
+
+        self.assertIsNone(error_detail)
+        self.assertIs(response, first)
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.json(), first.json())
+        self.assertEqual(response.json(), {"payload": [{"id": 1}], "meta": {"count": 1}})
+        self.assertEqual(first_response.json_calls, 1)
+        self.assertEqual(transport.request_headers[1]["If-None-Match"], '"abc"')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+    ChatwootProxyError,
+)
+from src.infrastructure.requests.contact_conversation_index import (
+    ContactConversationIndex,
+)
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+class _HtmlResponse:
+    """What Rails renders for an unknown route: the static 404 page."""
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.text = "<!DOCTYPE html><html><body>The page you were looking for doesn't exist."
+        self.headers = {"content-type": "text/html; charset=utf-8"}
+
+    def json(self) -> object:
+        raise ValueError("Expecting value: line 1 column 1 (char 0)")
+
+
+class _RoutingAsyncTransport:
+    def __init__(self, routes: dict[str, FakeResponse]) -> None:
+        self._routes = routes
+        self.urls: list[str] = []
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (headers, params, timeout, verify)
+        self.urls.append(url)
+        path = url.split("/api/v1/accounts/7", 1)[1]
+        return self._routes.get(
+            path, FakeResponse(404, {"error": "Resource could not be found"})
+        )
+
+
+def _conversation(conversation_id: int, contact_id: int) -> dict[str, object]:
+    return {
+        "id": conversation_id,
+        "status": "open",
+        "meta": {"sender": {"id": contact_id, "email": "lead@example.com"}},
+        "messages": [{"content": "hola"}],
+    }
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ContactConversationIndexTest(unittest.TestCase):
+    def test_index_groups_conversations_by_contact_newest_first(self) -> None:
+        index = ContactConversationIndex()
+
+        index.record([_conversation(1, 10), _conversation(3, 10), _conversation(2, 20)])
+
+        self.assertEqual([item["id"] for item in index.conversations_for(10)], [3, 1])
+        self.assertEqual([item["id"] for item in index.conversations_for(20)], [2])
+        self.assertEqual(index.conversations_for(99), [])
+
+    def test_index_accepts_contact_id_fallback_fields(self) -> None:
+        index = ContactConversationIndex()
+
+        index.record(
+            [
+                {"id": 1, "contact_id": 10},
+                {"id": 2, "contact_inbox": {"contact_id": "10"}},
+                {"id": 3},
+                "not-a-conversation",
+            ]
+        )
+
+        self.assertEqual([item["id"] for item in index.conversations_for(10)], [2, 1])
+        self.assertEqual(len(index), 2)
+
+    def test_index_moves_reassigned_conversation_and_evicts_oldest(self) -> None:
+        index = ContactConversationIndex(max_conversations=2)
+
+        index.record([_conversation(1, 10), _conversation(2, 10)])
+        index.record([_conversation(1, 20)])
+        index.record([_conversation(3, 30)])
+
+        self.assertEqual(index.conversations_for(10), [])
+        self.assertEqual([item["id"] for item in index.conversations_for(20)], [1])
+        self.assertEqual([item["id"] for item in index.conversations_for(30)], [3])
+
+    def test_index_keeps_only_a_summary_of_each_conversation(self) -> None:
+        index = ContactConversationIndex()
+
+        index.record([_conversation(1, 10)])
+
+        self.assertEqual(
+            index.conversations_for(10),
+            [{"id": 1, "status": "open", "contact_id": 10}],
+        )
+        self.assertEqual(index.conversation_ids_for(10), [1])
+
+    def test_index_entries_expire_after_ttl(self) -> None:
+        clock = _Clock()
+        index = ContactConversationIndex(ttl_seconds=60, clock=clock)
+        index.record([_conversation(1, 10)])
+        clock.now += 30
+        index.record([_conversation(2, 10)])
+
+        clock.now += 45
+
+        self.assertEqual(index.conversation_ids_for(10), [2])
+        self.assertEqual(len(index), 1)
+
+
+class ContactConversationsClientTest(unittest.IsolatedAsyncioTestCase):
+    async def test_forwards_to_chatwoot_when_endpoint_is_available(self) -> None:
+        transport = _RoutingAsyncTransport(
+            {"/contacts/10/conversations": FakeResponse(200, {"payload": [_conversation(5, 10)]})}
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        result = await client.get_contact_conversations(account_id=7, contact_id=10)
+
+        self.assertEqual(result["meta"]["source"], "chatwoot")
+        self.assertEqual(result["meta"]["count"], 1)
+        self.assertEqual(result["payload"][0]["meta"]["sender"]["email"], "le...om")
+
+    async def test_serves_from_index_built_by_conversation_pages(self) -> None:
+        transport = _RoutingAsyncTransport(
+            {
+                "/conversations": FakeResponse(
+                    200,
+                    {
+                        "data": {
+                            "meta": {"all_count": 3},
+                            "payload": [
+                                _conversation(1, 10),
+                                _conversation(2, 20),
+                                _conversation(3, 10),
+                            ],
+                        }
+                    },
+                )
+            }
+        )
+        transport._routes["/contacts/10/conversations"] = _HtmlResponse(404)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        await client.get_conversations(account_id=7, page="1", status=None, inbox_id=None)
+        result = await client.get_contact_conversations(account_id=7, contact_id=10)
+
+        self.assertEqual(result["meta"]["source"], "index")
+        self.assertEqual([item["id"] for item in result["payload"]], [3, 1])
+        self.assertNotIn("meta", result["payload"][0])
+        self.assertEqual(result["payload"][0]["contact_id"], 10)
+
+    async def test_unsupported_method_status_also_serves_from_index(self) -> None:
+        transport = _RoutingAsyncTransport(
+            {"/contacts/10/conversations": FakeResponse(405, {})}
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        result = await client.get_contact_conversations(account_id=7, contact_id=10)
+
+        self.assertEqual(result["meta"]["source"], "index")
+        self.assertEqual(result["payload"], [])
+
+    async def test_unknown_contact_404_is_not_masked_by_index(self) -> None:
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=_RoutingAsyncTransport({}),
+        )
+
+        with self.assertRaises(ChatwootProxyError) as ctx:
+            await client.get_contact_conversations(account_id=7, contact_id=99999)
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    async def test_other_upstream_errors_are_not_masked_by_index(self) -> None:
+        transport = _RoutingAsyncTransport(
+            {"/contacts/10/conversations": FakeResponse(500, {})}
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        with self.assertRaises(ChatwootProxyError) as ctx:
+            await client.get_contact_conversations(account_id=7, contact_id=10)
+
+        self.assertEqual(ctx.exception.status_code, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
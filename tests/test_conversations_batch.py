@@ -0,0 +1,149 @@
+import asyncio
+import unittest
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app import app as app_module
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+    ChatwootProxyError,
+)
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+class _ConversationsAsyncTransport:
+    def __init__(self, missing_ids: set[int]) -> None:
+        self._missing_ids = missing_ids
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (headers, params, timeout, verify)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        path = url.split("/conversations/", 1)[1]
+        conversation_id = int(path.split("/", 1)[0])
+        if conversation_id in self._missing_ids:
+            return FakeResponse(404, {})
+        if path.endswith("/messages"):
+            return FakeResponse(
+                200,
+                {"payload": [{"id": 1, "sender": {"phone_number": "+5491166667777"}}]},
+            )
+        return FakeResponse(
+            200,
+            {"id": conversation_id, "meta": {"sender": {"email": "pii@example.com"}}},
+        )
+
+
+class _DummyBatchProxyClient:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+
+    def enforce_account_id(self, _account_id: int) -> None:
+        return None
+
+    async def get_conversations_batch(
+        self,
+        account_id: int,
+        conversation_ids: list[int],
+        resources: list[str] | None,
+        messages_page: str | None,
+    ):
+        self.calls.append(
+            {
+                "account_id": account_id,
+                "conversation_ids": conversation_ids,
+                "resources": resources,
+                "messages_page": messages_page,
+            }
+        )
+        return {"results": {}, "status": {}, "errors": {}, "meta": {"count": 0}}
+
+
+class ConversationsBatchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_batch_returns_sanitized_results_and_status_map(self) -> None:
+        transport = _ConversationsAsyncTransport(missing_ids={3})
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=transport,
+            max_batch_concurrency=2,
+        )
+
+        result = await client.get_conversations_batch(
+            account_id=7,
+            conversation_ids=[1, 2, 3, 1],
+            resources=["conversation", "messages"],
+            messages_page="1",
+        )
+
+        self.assertEqual(result["meta"]["conversation_ids"], [1, 2, 3])
+        self.assertEqual(result["meta"]["count"], 6)
+        self.assertEqual(result["meta"]["failed"], 2)
+        self.assertEqual(result["status"]["1"], {"conversation": 200, "messages": 200})
+        self.assertEqual(result["status"]["3"], {"conversation": 404, "messages": 404})
+        self.assertNotIn("3", result["results"])
+        self.assertIn("messages", result["errors"]["3"])
+        self.assertEqual(
+            result["results"]["2"]["conversation"]["payload"]["meta"]["sender"]["email"],
+            "pi...om",
+        )
+        self.assertEqual(
+            result["results"]["1"]["messages"]["payload"][0]["sender"]["phone_number"],
+            "+5...77",
+        )
+        self.assertLessEqual(transport.max_in_flight, 2)
+
+    async def test_batch_rejects_unknown_resources_and_empty_ids(self) -> None:
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=_ConversationsAsyncTransport(missing_ids=set()),
+        )
+
+        with self.assertRaises(ChatwootProxyError) as empty_ctx:
+            await client.get_conversations_batch(7, [], None, None)
+        with self.assertRaises(ChatwootProxyError) as resource_ctx:
+            await client.get_conversations_batch(7, [1], ["labels"], None)
+
+        self.assertEqual(empty_ctx.exception.status_code, 422)
+        self.assertEqual(resource_ctx.exception.status_code, 422)
+
+
+class ConversationsBatchEndpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_settings = app_module._settings
+        self._original_proxy_client = app_module._proxy_client
+
+    def tearDown(self) -> None:
+        app_module._settings = self._original_settings
+        app_module._proxy_client = self._original_proxy_client
+
+    def test_batch_endpoint_forwards_body_to_controller(self) -> None:
+        proxy_client = _DummyBatchProxyClient()
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = proxy_client
+            response = client.post(
+                "/api/v1/accounts/7/conversations/batch",
+                json={"conversation_ids": [10, 11], "resources": ["messages"]},
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            proxy_client.calls,
+            [
+                {
+                    "account_id": 7,
+                    "conversation_ids": [10, 11],
+                    "resources": ["messages"],
+                    "messages_page": None,
+                }
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+
+from src.infrastructure.fastapi_app.event_loop_monitor import EventLoopLagMonitor, percentile
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import ChatwootFastApiProxyClient
+from src.infrastructure.requests.cpu_offload import CpuOffloader, response_size_bytes
+from tests.proxy_fakes import proxy_settings
+
+
+class _BytesResponse:
+    def __init__(self, payload: object) -> None:
+        self.status_code = 200
+        self.content = json.dumps(payload).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+        self.headers = {"content-type": "application/json"}
+
+    def json(self) -> object:
+        return json.loads(self.content)
+
+
+class _ThreadRecordingTransport:
+    def __init__(self, response: _BytesResponse) -> None:
+        self._response = response
+
+    async def get(self, url: str, *, headers, params, timeout, verify):
+        _ = (url, headers, params, timeout, verify)
+        return self._response
+
+
+class CpuOffloaderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_small_work_runs_inline_and_is_timed(self) -> None:
+        offloader = CpuOffloader(threshold_bytes=1024)
+
+        thread_id = await offloader.run(10, threading.get_ident)
+
+        self.assertEqual(thread_id, threading.get_ident())
+        stats = offloader.stats()
+        self.assertEqual((stats.inline_calls, stats.offloaded_calls), (1, 0))
+        self.assertGreaterEqual(stats.inline_seconds_max, 0.0)
+
+    async def test_large_work_runs_in_worker_thread(self) -> None:
+        offloader = CpuOffloader(threshold_bytes=1024)
+
+        thread_id = await offloader.run(4096, threading.get_ident)
+
+        self.assertNotEqual(thread_id, threading.get_ident())
+        stats = offloader.stats()
+        self.assertEqual((stats.inline_calls, stats.offloaded_calls), (0, 1))
+        self.assertEqual(stats.offloaded_bytes, 4096)
+
+    async def test_non_positive_threshold_disables_offloading(self) -> None:
+        offloader = CpuOffloader(threshold_bytes=0)
+
+        await offloader.run(10_000_000, lambda: None)
+
+        self.assertEqual(offloader.stats().offloaded_calls, 0)
+
+    def test_response_size_prefers_body_then_content_length(self) -> None:
+        self.assertEqual(response_size_bytes(_BytesResponse({"a": 1})), len(b'{"a": 1}'))
+
+        class _HeadersOnly:
+            headers = {"Content-Length": "2048"}
+
+        self.assertEqual(response_size_bytes(_HeadersOnly()), 2048)
+        self.assertEqual(response_size_bytes(object()), 0)
+
+    async def test_proxy_client_decodes_large_messages_page_off_the_loop(self) -> None:
+        page = {
+            "meta": {},
+            "payload": [
+                {"id": index, "sender": {"email": "ana@example.com"}} for index in range(50)
+            ],
+        }
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=_ThreadRecordingTransport(_BytesResponse(page)),
+            offload_threshold_bytes=256,
+        )
+
+        result = await client.get_conversation_messages(account_id=7, conversation_id=5, page="1")
+
+        self.assertEqual(result["payload"][0]["sender"]["email"], "an...om")
+        self.assertEqual(client.cpu_offload_stats().offloaded_calls, 1)
+        self.assertEqual(client.cpu_offload_stats().inline_calls, 0)
+
+
+class EventLoopLagMonitorTest(unittest.IsolatedAsyncioTestCase):
+    def test_percentiles_use_nearest_rank(self) -> None:
+        samples = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(percentile(samples, 0.5), 50.0)
+        self.assertEqual(percentile(samples, 0.99), 99.0)
+        self.assertIsNone(percentile([], 0.99))
+
+    async def test_monitor_observes_a_blocked_loop(self) -> None:
+        monitor = EventLoopLagMonitor(interval_seconds=0.005)
+        monitor.start()
+        await asyncio.sleep(0.02)
+
+        time.sleep(0.06)
+        await asyncio.sleep(0.02)
+        await monitor.aclose()
+
+        health = monitor.as_dict()
+        self.assertFalse(health["running"])
+        self.assertGreater(health["samples"], 0)
+        self.assertGreaterEqual(health["lag_max_ms"], 40.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
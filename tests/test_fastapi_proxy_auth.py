@@ -1,9 +1,12 @@
+import json
 import unittest
 
 from fastapi.testclient import TestClient
 
 from src.infrastructure.fastapi_app import app as app_module
-from src.infrastructure.settings.env_settings import ChatwootSettings
+from src.infrastructure.fastapi_app.admission import AdmissionController
+from src.use_case.errors import ProxyGatewayError
+from tests.proxy_fakes import proxy_settings
 
 
 class _DummyProxyClient:
@@ -16,12 +19,21 @@ class _DummyProxyClient:
     async def get_inbox_by_id(self, _account_id: int, _inbox_id: int):
         return {"payload": {"id": 1}}
 
-    async def get_contacts(self, _account_id: int, _page: str | None):
+    async def get_contacts(self, account_id: int, page: str | None):
+        _ = (account_id, page)
         return {"payload": [{"id": 10}], "meta": {"count": 1}}
 
+    async def stream_contacts_all(self, _account_id: int):
+        yield [{"id": 10, "name": "Ana"}, {"id": 11, "name": "Beto"}]
+        yield [{"id": 12, "name": "Caro"}]
+
     async def get_contact_by_id(self, _account_id: int, _contact_id: int):
         return {"payload": {"id": 10}}
 
+    async def get_contact_conversations(self, account_id: int, contact_id: int):
+        _ = (account_id, contact_id)
+        return {"payload": [{"id": 100}], "meta": {"count": 1, "source": "index"}}
+
     async def get_conversations(
         self,
         account_id: int,
@@ -34,41 +46,34 @@ class _DummyProxyClient:
 
     async def get_conversation_by_id(self, account_id: int, conversation_id: int):
         _ = (account_id, conversation_id)
-        return {"payload": {"id": 100, "contact": {"email": "a@example.com"}}}
+        # The real client returns the payload already sanitized at load time.
+        return {"payload": {"id": 100, "contact": {"email": "a@...om"}}}
 
     async def get_conversation_messages(
         self,
         account_id: int,
         conversation_id: int,
         page: str | None,
+        projection=None,
     ):
-        _ = (account_id, conversation_id, page)
+        _ = (account_id, conversation_id, page, projection)
         return {"payload": [{"id": 2001}], "meta": {"count": 1}}
 
 
-def _settings() -> ChatwootSettings:
-    return ChatwootSettings(
-        base_url="https://chatwoot.example.com",
-        account_id=7,
-        api_access_token="token-123",
-        proxy_api_key="proxy-secret",
-        timeout_seconds=9.0,
-        tls_verify=True,
-    )
-
-
 class FastApiProxyAuthTest(unittest.TestCase):
     def setUp(self) -> None:
         self._original_settings = app_module._settings
         self._original_proxy_client = app_module._proxy_client
+        self._original_admission = app_module._admission
 
     def tearDown(self) -> None:
         app_module._settings = self._original_settings
         app_module._proxy_client = self._original_proxy_client
+        app_module._admission = self._original_admission
 
     def test_proxy_endpoint_requires_api_key(self) -> None:
         with TestClient(app_module.app) as client:
-            app_module._settings = _settings()
+            app_module._settings = proxy_settings()
             app_module._proxy_client = _DummyProxyClient()
             response = client.get("/api/v1/accounts/7/inboxes")
 
@@ -77,7 +82,7 @@ class FastApiProxyAuthTest(unittest.TestCase):
 
     def test_proxy_endpoint_rejects_invalid_api_key(self) -> None:
         with TestClient(app_module.app) as client:
-            app_module._settings = _settings()
+            app_module._settings = proxy_settings()
             app_module._proxy_client = _DummyProxyClient()
             response = client.get(
                 "/api/v1/accounts/7/inboxes",
@@ -86,9 +91,28 @@ class FastApiProxyAuthTest(unittest.TestCase):
 
         self.assertEqual(response.status_code, 401)
 
+    def test_invalid_api_key_does_not_take_an_admission_slot(self) -> None:
+        admission = AdmissionController()
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            app_module._admission = admission
+            rejected = client.get(
+                "/api/v1/accounts/7/inboxes",
+                headers={"X-Proxy-Api-Key": "wrong"},
+            )
+            accepted = client.get(
+                "/api/v1/accounts/7/inboxes",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        self.assertEqual(rejected.status_code, 401)
+        self.assertEqual(accepted.status_code, 200)
+        self.assertEqual(admission.stats()["lookup"].admitted, 1)
+
     def test_proxy_endpoint_accepts_valid_api_key(self) -> None:
         with TestClient(app_module.app) as client:
-            app_module._settings = _settings()
+            app_module._settings = proxy_settings()
             app_module._proxy_client = _DummyProxyClient()
             response = client.get(
                 "/api/v1/accounts/7/inboxes",
@@ -100,7 +124,7 @@ class FastApiProxyAuthTest(unittest.TestCase):
 
     def test_conversations_endpoint_accepts_valid_api_key(self) -> None:
         with TestClient(app_module.app) as client:
-            app_module._settings = _settings()
+            app_module._settings = proxy_settings()
             app_module._proxy_client = _DummyProxyClient()
             response = client.get(
                 "/api/v1/accounts/7/conversations?page=1&status=open",
@@ -112,7 +136,7 @@ class FastApiProxyAuthTest(unittest.TestCase):
 
     def test_conversation_by_id_endpoint_accepts_valid_api_key(self) -> None:
         with TestClient(app_module.app) as client:
-            app_module._settings = _settings()
+            app_module._settings = proxy_settings()
             app_module._proxy_client = _DummyProxyClient()
             response = client.get(
                 "/api/v1/accounts/7/conversations/100",
@@ -122,9 +146,24 @@ class FastApiProxyAuthTest(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["payload"]["id"], 100)
 
+    def test_conversation_by_id_endpoint_writes_sanitized_json(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/conversations/100",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(
+            response.content,
+            b'{"payload":{"id":100,"contact":{"email":"a@...om"}}}',
+        )
+
     def test_conversation_messages_endpoint_accepts_valid_api_key(self) -> None:
         with TestClient(app_module.app) as client:
-            app_module._settings = _settings()
+            app_module._settings = proxy_settings()
             app_module._proxy_client = _DummyProxyClient()
             response = client.get(
                 "/api/v1/accounts/7/conversations/100/messages?page=1",
@@ -134,6 +173,99 @@ class FastApiProxyAuthTest(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["meta"]["count"], 1)
 
+    def test_messages_endpoint_rejects_invalid_fields(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/conversations/100/messages?fields=id,sender..type",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_contact_conversations_endpoint_accepts_valid_api_key(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/contacts/10/conversations",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["meta"]["source"], "index")
+
+    def test_contacts_page_all_streams_ndjson_when_accepted(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/contacts?page=all&fields=id",
+                headers={"X-Proxy-Api-Key": "proxy-secret", "Accept": "application/x-ndjson"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(response.content, b'{"id":10}\n{"id":11}\n{"id":12}\n')
+
+    def test_contacts_stream_parameter_selects_ndjson(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/contacts?page=all&stream=true",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([line["id"] for line in lines], [10, 11, 12])
+
+    def test_contacts_stream_reports_upstream_failure_as_last_line(self) -> None:
+        class _FailingProxyClient(_DummyProxyClient):
+            async def stream_contacts_all(self, _account_id: int):
+                yield [{"id": 10}]
+                raise ProxyGatewayError(status_code=502, detail="Chatwoot caido")
+
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _FailingProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/contacts?page=all&stream=true",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(lines[0], {"id": 10})
+        self.assertEqual(lines[-1], {"error": {"status_code": 502, "detail": "Chatwoot caido"}})
+
+    def test_contacts_stream_first_page_failure_is_http_error(self) -> None:
+        class _FailingProxyClient(_DummyProxyClient):
+            async def stream_contacts_all(self, _account_id: int):
+                raise ProxyGatewayError(status_code=502, detail="Chatwoot caido")
+                yield []
+
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _FailingProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/contacts?page=all&stream=true",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+        self.assertEqual(response.status_code, 502)
+
+    def test_contacts_numbered_page_ignores_ndjson_accept(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = _DummyProxyClient()
+            response = client.get(
+                "/api/v1/accounts/7/contacts?page=1",
+                headers={"X-Proxy-Api-Key": "proxy-secret", "Accept": "application/x-ndjson"},
+            )
+
+        self.assertEqual(response.json()["meta"]["count"], 1)
+
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main()
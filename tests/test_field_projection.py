@@ -0,0 +1,199 @@
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.requests import chatwoot_fastapi_proxy_client
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.interface_adapter.controllers.fastapi_proxy_controllers import (
+    GetConversationMessagesController,
+    GetConversationsController,
+)
+from src.use_case.errors import ProxyGatewayError
+from src.use_case.field_projection import format_fields, parse_fields, project_payload_items
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+def _message(message_id: int) -> dict:
+    return {
+        "id": message_id,
+        "created_at": 1710000000 + message_id,
+        "message_type": 0,
+        "content": "Hola",
+        "sender_type": "Contact",
+        "sender": {"id": 5, "type": "contact", "email": "an...om"},
+        "attachments": [{"id": 1, "file_type": "image", "data_url": "https://x"}],
+    }
+
+
+class _FakeProxyClient:
+    def __init__(self) -> None:
+        self.messages = {"meta": {"count": 2}, "payload": [_message(1), _message(2)]}
+        self.messages_projection = None
+        self.conversations = {
+            "data": {"meta": {"all_count": 1}, "payload": [{"id": 100, "status": "open"}]}
+        }
+
+    def enforce_account_id(self, _account_id: int) -> None:
+        return None
+
+    async def get_conversation_messages(
+        self,
+        account_id: int,
+        conversation_id: int,
+        page,
+        projection=None,
+    ):
+        _ = (account_id, conversation_id, page)
+        self.messages_projection = projection
+        return self.messages
+
+    async def get_conversations(self, account_id: int, page, status, inbox_id):
+        _ = (account_id, page, status, inbox_id)
+        return self.conversations
+
+
+class _MessagesTransport:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, headers, params, timeout, verify)
+        self.calls += 1
+        message = _message(1)
+        message["sender"]["email"] = "ana@example.com"
+        message["content"] = "Mi numero es 5491166667777"
+        return FakeResponse(200, {"meta": {"count": 1}, "payload": [message]})
+
+
+class ParseFieldsTest(unittest.TestCase):
+    def test_nested_paths_build_a_tree_and_parents_win(self) -> None:
+        self.assertEqual(
+            parse_fields(" id, sender.type ,sender.id,attachments.file_type "),
+            {"id": None, "sender": {"type": None, "id": None}, "attachments": {"file_type": None}},
+        )
+        self.assertEqual(parse_fields("sender.type,sender"), {"sender": None})
+        self.assertEqual(parse_fields("sender,sender.type"), {"sender": None})
+
+    def test_missing_or_blank_fields_disable_projection(self) -> None:
+        self.assertIsNone(parse_fields(None))
+        self.assertIsNone(parse_fields(" , "))
+
+    def test_invalid_paths_are_rejected(self) -> None:
+        with self.assertRaises(ProxyGatewayError) as context:
+            parse_fields("id,sender..type")
+
+        self.assertEqual(context.exception.status_code, 422)
+
+    def test_format_fields_is_canonical(self) -> None:
+        self.assertEqual(
+            format_fields(parse_fields("sender.type,id,attachments.file_type,sender.id")),
+            "attachments.file_type,id,sender.id,sender.type",
+        )
+        self.assertEqual(
+            format_fields(parse_fields("id,sender.type")),
+            format_fields(parse_fields("sender.type, id")),
+        )
+
+
+class ProjectPayloadItemsTest(unittest.TestCase):
+    def test_projects_items_and_keeps_meta(self) -> None:
+        payload = {"meta": {"count": 1}, "payload": [_message(1)]}
+
+        projected = project_payload_items(
+            payload,
+            parse_fields("id,sender.type,attachments.file_type,missing"),
+        )
+
+        self.assertEqual(
+            projected,
+            {
+                "meta": {"count": 1},
+                "payload": [
+                    {"id": 1, "sender": {"type": "contact"}, "attachments": [{"file_type": "image"}]}
+                ],
+            },
+        )
+        self.assertIn("content", payload["payload"][0])
+
+
+class FieldsControllersTest(unittest.IsolatedAsyncioTestCase):
+    async def test_messages_controller_pushes_projection_to_the_client(self) -> None:
+        client = _FakeProxyClient()
+
+        result = await GetConversationMessagesController(client=client).run(
+            account_id=7,
+            conversation_id=100,
+            page="1",
+            fields="id,content,sender.type",
+        )
+
+        self.assertIs(result, client.messages)
+        self.assertEqual(
+            client.messages_projection,
+            {"id": None, "content": None, "sender": {"type": None}},
+        )
+
+    async def test_conversations_controller_projects_data_payload(self) -> None:
+        result = await GetConversationsController(client=_FakeProxyClient()).run(
+            account_id=7,
+            page="1",
+            status=None,
+            inbox_id=None,
+            fields="id",
+        )
+
+        self.assertEqual(result["data"]["payload"], [{"id": 100}])
+        self.assertEqual(result["data"]["meta"], {"all_count": 1})
+
+
+class ProjectionPushdownTest(unittest.IsolatedAsyncioTestCase):
+    async def test_only_requested_fields_reach_the_sanitizer(self) -> None:
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(), transport=_MessagesTransport()
+        )
+        plan = chatwoot_fastapi_proxy_client.MESSAGE_PLAN
+        sanitized_keys: list[set[str]] = []
+
+        def recording_apply(item):
+            sanitized_keys.append(set(item))
+            return plan.apply_in_place(item)
+
+        with patch.object(chatwoot_fastapi_proxy_client, "MESSAGE_PLAN") as fake_plan:
+            fake_plan.apply_in_place.side_effect = recording_apply
+            result = await client.get_conversation_messages(
+                account_id=7,
+                conversation_id=100,
+                page="1",
+                projection=parse_fields("content,sender.type"),
+            )
+
+        self.assertEqual(sanitized_keys, [{"content", "sender"}])
+        self.assertEqual(
+            result["payload"],
+            [{"content": "Mi numero es 5491...7777", "sender": {"type": "contact"}}],
+        )
+
+    async def test_each_selection_is_cached_and_coalesced_separately(self) -> None:
+        transport = _MessagesTransport()
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        projected = await client.get_conversation_messages(
+            account_id=7,
+            conversation_id=100,
+            page="1",
+            projection=parse_fields("id"),
+        )
+        full = await client.get_conversation_messages(
+            account_id=7,
+            conversation_id=100,
+            page="1",
+        )
+
+        self.assertEqual(transport.calls, 2)
+        self.assertEqual(projected["payload"], [{"id": 1}])
+        self.assertEqual(full["payload"][0]["sender"]["email"], "an...om")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import unittest
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from scripts.bench_support import build_message_page
+from src.infrastructure.fastapi_app.responses import FastJSONResponse, dumps_json
+from src.interface_adapter.presenters.pre_serialized_json import PreSerializedJson
+
+
+class FastJSONResponseTest(unittest.TestCase):
+    def test_body_matches_stdlib_json(self) -> None:
+        page = build_message_page(messages=5)
+
+        body = FastJSONResponse(page).body
+
+        self.assertEqual(json.loads(body), json.loads(JSONResponse(jsonable_encoder(page)).body))
+
+    def test_keeps_non_ascii_text_unescaped(self) -> None:
+        body = FastJSONResponse({"name": "Ñandú"}).body
+
+        self.assertEqual(body, '{"name":"Ñandú"}'.encode("utf-8"))
+
+    def test_falls_back_for_integers_beyond_64_bits(self) -> None:
+        self.assertEqual(dumps_json({"id": 2**70}), b'{"id":%d}' % 2**70)
+
+    def test_non_string_keys_are_stringified(self) -> None:
+        self.assertEqual(json.loads(dumps_json({1: "a"})), {"1": "a"})
+
+    def test_pre_serialized_body_is_sent_unchanged(self) -> None:
+        body = b'{"ya":"serializado"}'
+
+        self.assertEqual(FastJSONResponse(PreSerializedJson(body)).body, body)
+
+    def test_media_type_is_json(self) -> None:
+        response = FastJSONResponse({"ok": True})
+
+        self.assertEqual(response.headers["content-type"], "application/json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app import app as app_module
+from src.infrastructure.fastapi_app.compression import ResponseCompressor
+from src.infrastructure.fastapi_app.event_loop_monitor import EventLoopLagMonitor
+from src.infrastructure.fastapi_app.metrics import (
+    PrometheusWriter,
+    RequestMetrics,
+    render_metrics,
+)
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+    ChatwootProxyError,
+)
+from src.infrastructure.requests.http_transport import HttpTimeoutError
+from src.infrastructure.requests.upstream_metrics import (
+    LatencyHistogram,
+    UpstreamCallKey,
+    normalize_resource,
+)
+from tests.proxy_fakes import InboxesTransport, proxy_settings
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_cumulative_counts_end_with_total(self) -> None:
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(seconds)
+
+        self.assertEqual(histogram.cumulative_counts(), [2, 3, 4])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.total, 3.65)
+
+    def test_writer_renders_buckets_with_inf_and_escaped_labels(self) -> None:
+        histogram = LatencyHistogram(buckets=(0.5,))
+        histogram.observe(0.2)
+        writer = PrometheusWriter()
+        writer.histogram("latency_seconds", histogram, {"route": 'a"b'})
+
+        lines = writer.render().decode().splitlines()
+        self.assertEqual(
+            lines,
+            [
+                'chatwoot_proxy_latency_seconds_bucket{route="a\\"b",le="0.5"} 1',
+                'chatwoot_proxy_latency_seconds_bucket{route="a\\"b",le="+Inf"} 1',
+                'chatwoot_proxy_latency_seconds_sum{route="a\\"b"} 0.2',
+                'chatwoot_proxy_latency_seconds_count{route="a\\"b"} 1',
+            ],
+        )
+
+
+class UpstreamMetricsTest(unittest.IsolatedAsyncioTestCase):
+    def test_numeric_segments_are_folded(self) -> None:
+        self.assertEqual(
+            normalize_resource("conversations/321/messages"),
+            "conversations/{id}/messages",
+        )
+        self.assertEqual(normalize_resource("inboxes"), "inboxes")
+
+    async def test_records_status_code_and_latency_per_resource(self) -> None:
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=InboxesTransport())
+
+        await client.get_inboxes(account_id=7)
+
+        metrics = client.upstream_metrics()
+        self.assertEqual(metrics.calls, {UpstreamCallKey("inboxes", "200"): 1})
+        self.assertEqual(metrics.latency["inboxes"].count, 1)
+        self.assertEqual(metrics.in_flight, 0)
+
+    async def test_records_transport_failures_as_outcomes(self) -> None:
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=InboxesTransport(HttpTimeoutError("lento")),
+        )
+
+        with self.assertRaises(ChatwootProxyError):
+            await client.get_inboxes(account_id=7)
+
+        self.assertEqual(
+            client.upstream_metrics().calls,
+            {UpstreamCallKey("inboxes", "timeout"): 1},
+        )
+
+
+class MetricsEndpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_settings = app_module._settings
+        self._original_proxy_client = app_module._proxy_client
+        self._original_request_metrics = app_module._request_metrics
+        app_module._request_metrics = RequestMetrics()
+
+    def tearDown(self) -> None:
+        app_module._settings = self._original_settings
+        app_module._proxy_client = self._original_proxy_client
+        app_module._request_metrics = self._original_request_metrics
+
+    def test_metrics_requires_api_key(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            response = client.get("/metrics")
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_metrics_exposes_route_and_upstream_series(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = ChatwootFastApiProxyClient(
+                settings=proxy_settings(),
+                transport=InboxesTransport(),
+            )
+            headers = {"X-Proxy-Api-Key": "proxy-secret"}
+            client.get("/api/v1/accounts/7/inboxes", headers=headers)
+            response = client.get("/metrics", headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        body = response.text
+        self.assertIn(
+            'chatwoot_proxy_http_requests_total{method="GET",'
+            'route="/api/v1/accounts/{account_id}/inboxes",status="200"} 1',
+            body,
+        )
+        self.assertIn(
+            'chatwoot_proxy_http_request_duration_seconds_count{method="GET",'
+            'route="/api/v1/accounts/{account_id}/inboxes"} 1',
+            body,
+        )
+        self.assertIn(
+            'chatwoot_proxy_upstream_requests_total{resource="inboxes",status="200"} 1',
+            body,
+        )
+        self.assertIn("chatwoot_proxy_http_requests_in_flight 1", body)
+
+    def test_event_loop_lag_is_exposed_as_plain_gauges(self) -> None:
+        monitor = EventLoopLagMonitor()
+        for seconds in (0.001, 0.002, 0.010):
+            monitor.record(seconds)
+        body = render_metrics(RequestMetrics(), None, monitor, ResponseCompressor()).decode()
+
+        self.assertNotIn("quantile", body)
+        self.assertIn("# TYPE chatwoot_proxy_event_loop_lag_p99_seconds gauge", body)
+        self.assertIn("chatwoot_proxy_event_loop_lag_max_seconds 0.01\n", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
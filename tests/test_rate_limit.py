@@ -0,0 +1,139 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app import app as app_module
+from src.infrastructure.fastapi_app.admission import FANOUT, LOOKUP
+from src.infrastructure.fastapi_app.rate_limit import (
+    ApiKeyRateLimiter,
+    ClientQuota,
+    identify_api_client,
+)
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.settings.env_settings import load_proxy_tuning_settings
+from tests.proxy_fakes import InboxesTransport, proxy_settings
+
+_CLIENT_KEYS = {"equipo-a": "clave-a", "equipo-b": "clave-b"}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ApiKeyRateLimiterTest(unittest.TestCase):
+    def test_identifies_the_client_owning_the_key(self) -> None:
+        settings = proxy_settings(proxy_api_keys=_CLIENT_KEYS)
+
+        self.assertEqual(identify_api_client("proxy-secret", settings), "default")
+        self.assertEqual(identify_api_client("clave-b", settings), "equipo-b")
+        self.assertIsNone(identify_api_client("otra", settings))
+        self.assertIsNone(identify_api_client(None, settings))
+
+    def test_bucket_refills_over_time_and_reports_reset(self) -> None:
+        clock = _Clock()
+        limiter = ApiKeyRateLimiter(
+            default_quota=ClientQuota(lookup_per_minute=60, fanout_per_minute=2),
+            clock=clock,
+        )
+
+        self.assertTrue(limiter.check("default", FANOUT).allowed)
+        self.assertTrue(limiter.check("default", FANOUT).allowed)
+        rejected = limiter.check("default", FANOUT)
+        self.assertFalse(rejected.allowed)
+        self.assertEqual(rejected.remaining, 0)
+        self.assertAlmostEqual(rejected.reset_seconds, 30.0)
+        self.assertEqual(rejected.headers()["Retry-After"], "30")
+
+        clock.now += 30
+        self.assertTrue(limiter.check("default", FANOUT).allowed)
+        self.assertEqual(limiter.rejected(), {("default", FANOUT): 1})
+
+    def test_budgets_are_separate_per_client_and_route_class(self) -> None:
+        limiter = ApiKeyRateLimiter(
+            default_quota=ClientQuota(lookup_per_minute=1, fanout_per_minute=1),
+            quotas={"equipo-a": ClientQuota(lookup_per_minute=2, fanout_per_minute=0)},
+            clock=_Clock(),
+        )
+
+        self.assertTrue(limiter.check("default", FANOUT).allowed)
+        self.assertTrue(limiter.check("default", LOOKUP).allowed)
+        self.assertFalse(limiter.check("default", LOOKUP).allowed)
+        self.assertTrue(limiter.check("equipo-a", LOOKUP).allowed)
+        self.assertTrue(limiter.check("equipo-a", LOOKUP).allowed)
+        self.assertIsNone(limiter.check("equipo-a", FANOUT))
+
+    def test_disabled_limiter_never_decides(self) -> None:
+        limiter = ApiKeyRateLimiter(enabled=False)
+
+        self.assertIsNone(limiter.check("default", FANOUT))
+
+    def test_rate_limiting_is_off_unless_enabled(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(load_proxy_tuning_settings().rate_limit_enabled)
+        with patch.dict(os.environ, {"PROXY_RATE_LIMIT_ENABLED": "true"}, clear=True):
+            self.assertTrue(load_proxy_tuning_settings().rate_limit_enabled)
+
+    def test_quotas_are_loaded_from_env(self) -> None:
+        with patch.dict(
+            os.environ,
+            {"PROXY_RATE_LIMIT_QUOTAS": "equipo-a=120/5, equipo-b=0/1"},
+        ):
+            tuning = load_proxy_tuning_settings()
+
+        self.assertEqual(
+            tuning.rate_limit_quotas,
+            {"equipo-a": (120, 5), "equipo-b": (0, 1)},
+        )
+
+
+class RateLimitEndpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_settings = app_module._settings
+        self._original_proxy_client = app_module._proxy_client
+        self._original_rate_limiter = app_module._rate_limiter
+
+    def tearDown(self) -> None:
+        app_module._settings = self._original_settings
+        app_module._proxy_client = self._original_proxy_client
+        app_module._rate_limiter = self._original_rate_limiter
+
+    def test_exhausted_key_gets_429_while_other_keys_are_served(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings(proxy_api_keys=_CLIENT_KEYS)
+            app_module._proxy_client = ChatwootFastApiProxyClient(
+                settings=proxy_settings(proxy_api_keys=_CLIENT_KEYS),
+                transport=InboxesTransport(),
+            )
+            app_module._rate_limiter = ApiKeyRateLimiter(
+                default_quota=ClientQuota(lookup_per_minute=1, fanout_per_minute=1),
+            )
+            url = "/api/v1/accounts/7/inboxes"
+            first = client.get(url, headers={"X-Proxy-Api-Key": "clave-a"})
+            limited = client.get(url, headers={"X-Proxy-Api-Key": "clave-a"})
+            other = client.get(url, headers={"X-Proxy-Api-Key": "clave-b"})
+            metrics = client.get("/metrics", headers={"X-Proxy-Api-Key": "clave-a"})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(limited.headers["x-ratelimit-limit"], "1")
+        self.assertEqual(limited.headers["x-ratelimit-remaining"], "0")
+        self.assertIn("retry-after", limited.headers)
+        self.assertIn("x-ratelimit-reset", limited.headers)
+        self.assertEqual(other.status_code, 200)
+        self.assertEqual(metrics.status_code, 200)
+        self.assertIn(
+            'chatwoot_proxy_rate_limited_total{client="equipo-a",class="lookup"} 1',
+            metrics.text,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
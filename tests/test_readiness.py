@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app import app as app_module
+from src.infrastructure.fastapi_app.readiness import DEGRADED, OPERATIONAL, UpstreamProbe
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.requests.http_transport import HttpTimeoutError
+from src.use_case.errors import ProxyGatewayError
+from tests.proxy_fakes import InboxesTransport, proxy_settings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class UpstreamProbeTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pending_until_the_first_probe_finishes(self) -> None:
+        probe = UpstreamProbe(lambda: asyncio.sleep(0), interval_seconds=10)
+
+        report = probe.evaluate()
+
+        self.assertEqual(report["state"], DEGRADED)
+        self.assertEqual(report["reasons"], ["probe_pending"])
+        self.assertIsNone(report["upstream"]["latency_p95_ms"])
+
+    async def test_operational_after_successful_probes(self) -> None:
+        probe = UpstreamProbe(lambda: asyncio.sleep(0), interval_seconds=10)
+        for _ in range(3):
+            await probe.run_once()
+
+        report = probe.evaluate()
+
+        self.assertEqual(report["state"], OPERATIONAL)
+        self.assertEqual(report["upstream"]["samples"], 3)
+        self.assertEqual(report["upstream"]["error_rate"], 0.0)
+        self.assertIsNotNone(report["upstream"]["latency_p99_ms"])
+
+    async def test_errors_slowness_and_staleness_degrade(self) -> None:
+        clock = _Clock()
+
+        async def failing() -> None:
+            raise ProxyGatewayError(status_code=504, detail="Timeout")
+
+        probe = UpstreamProbe(
+            failing, interval_seconds=10, max_latency_p95_ms=-1.0, clock=clock
+        )
+        await probe.run_once()
+        clock.now += 31
+
+        report = probe.evaluate()
+
+        self.assertEqual(
+            report["reasons"], ["probe_stale", "upstream_errors", "upstream_slow"]
+        )
+        self.assertEqual(report["upstream"]["last_error"], "504")
+
+    async def test_failed_bootstrap_is_reported_first(self) -> None:
+        probe = UpstreamProbe(lambda: asyncio.sleep(0), interval_seconds=10)
+
+        self.assertEqual(probe.evaluate(bootstrap_ok=False)["reasons"], ["bootstrap_failed"])
+
+    async def test_background_loop_probes_the_real_client(self) -> None:
+        transport = InboxesTransport(HttpTimeoutError("lento"))
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+        probe = UpstreamProbe(client.probe_upstream, interval_seconds=0.01)
+
+        probe.start()
+        while probe.evaluate()["upstream"]["samples"] < 2:
+            await asyncio.sleep(0.005)
+        await probe.aclose()
+
+        report = probe.evaluate()
+        self.assertEqual(report["upstream"]["last_error"], "504")
+        self.assertEqual(transport.calls, report["upstream"]["samples"])
+
+
+class ReadyEndpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_proxy_client = app_module._proxy_client
+        self._original_probe = app_module._upstream_probe
+
+    def tearDown(self) -> None:
+        app_module._proxy_client = self._original_proxy_client
+        app_module._upstream_probe = self._original_probe
+
+    def test_ready_is_503_while_degraded_and_200_once_operational(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._proxy_client = ChatwootFastApiProxyClient(
+                settings=proxy_settings(),
+                transport=InboxesTransport(),
+            )
+            app_module._upstream_probe = UpstreamProbe(
+                app_module._proxy_client.probe_upstream, interval_seconds=10
+            )
+            degraded = client.get("/ready")
+            client.portal.call(app_module._upstream_probe.run_once)
+            operational = client.get("/ready")
+
+        self.assertEqual(degraded.status_code, 503)
+        self.assertEqual(degraded.json()["state"], "degraded")
+        self.assertEqual(operational.status_code, 200)
+        self.assertEqual(operational.json()["state"], "operational")
+        self.assertEqual(operational.json()["upstream"]["samples"], 1)
+
+    def test_ready_reports_failed_bootstrap(self) -> None:
+        with TestClient(app_module.app) as client:
+            app_module._proxy_client = None
+            response = client.get("/ready")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["reasons"], ["bootstrap_failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
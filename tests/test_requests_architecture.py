@@ -9,22 +9,11 @@ from src.infrastructure.requests.sensitive_data_sanitizer import (
     sanitize_conversation_payload,
     sanitize_payload,
 )
-from src.infrastructure.settings.env_settings import ChatwootSettings
-
-
-class _FakeResponse:
-    def __init__(self, status_code: int, payload: object, text: str = "") -> None:
-        self.status_code = status_code
-        self._payload = payload
-        self.text = text
-        self.headers = {"content-type": "application/json"}
-
-    def json(self) -> object:
-        return self._payload
+from tests.proxy_fakes import FakeResponse, proxy_settings
 
 
 class _RecordingSyncTransport:
-    def __init__(self, response: _FakeResponse) -> None:
+    def __init__(self, response: FakeResponse) -> None:
         self._response = response
         self.calls: list[dict[str, object]] = []
 
@@ -36,7 +25,7 @@ class _RecordingSyncTransport:
         params: dict[str, object] | None,
         timeout: float,
         verify: bool | str,
-    ) -> _FakeResponse:
+    ) -> FakeResponse:
         self.calls.append(
             {
                 "url": url,
@@ -50,7 +39,7 @@ class _RecordingSyncTransport:
 
 
 class _RecordingAsyncTransport:
-    def __init__(self, response: _FakeResponse) -> None:
+    def __init__(self, response: FakeResponse) -> None:
         self._response = response
         self.calls: list[dict[str, object]] = []
 
@@ -62,7 +51,7 @@ class _RecordingAsyncTransport:
         params: dict[str, object] | None,
         timeout: float,
         verify: bool | str,
-    ) -> _FakeResponse:
+    ) -> FakeResponse:
         self.calls.append(
             {
                 "url": url,
@@ -75,17 +64,6 @@ class _RecordingAsyncTransport:
         return self._response
 
 
-def _settings() -> ChatwootSettings:
-    return ChatwootSettings(
-        base_url="https://chatwoot.example.com",
-        account_id=7,
-        api_access_token="token-123",
-        proxy_api_key="proxy-secret",
-        timeout_seconds=9.0,
-        tls_verify=True,
-    )
-
-
 class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
     def test_sanitize_payload_masks_sensitive_keys_case_insensitive(self) -> None:
         payload = {
@@ -120,12 +98,12 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sanitized["additional_attributes"]["access_token"], "to...23")
 
     async def test_proxy_client_uses_injected_transport(self) -> None:
-        response = _FakeResponse(
+        response = FakeResponse(
             status_code=200,
             payload={"payload": [{"id": 1}], "meta": {"count": 1, "current_page": 1}},
         )
         transport = _RecordingAsyncTransport(response)
-        client = ChatwootFastApiProxyClient(settings=_settings(), transport=transport)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
 
         result = await client.get_contacts(account_id=7, page="1")
 
@@ -137,9 +115,9 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_requests_gateway_uses_injected_transport(self) -> None:
-        response = _FakeResponse(status_code=200, payload=[])
+        response = FakeResponse(status_code=200, payload=[])
         transport = _RecordingSyncTransport(response)
-        gateway = ChatwootRequestsGateway(settings=_settings(), transport=transport)
+        gateway = ChatwootRequestsGateway(settings=proxy_settings(), transport=transport)
 
         with patch(
             "src.infrastructure.requests.chatwoot_requests_gateway.check_dns",
@@ -159,12 +137,12 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_proxy_client_conversations_uses_injected_transport(self) -> None:
-        response = _FakeResponse(
+        response = FakeResponse(
             status_code=200,
             payload={"payload": [{"id": 101}], "meta": {"count": 1, "current_page": 1}},
         )
         transport = _RecordingAsyncTransport(response)
-        client = ChatwootFastApiProxyClient(settings=_settings(), transport=transport)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
 
         result = await client.get_conversations(
             account_id=7,
@@ -185,7 +163,7 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_proxy_client_conversation_by_id_masks_sensitive_fields(self) -> None:
-        response = _FakeResponse(
+        response = FakeResponse(
             status_code=200,
             payload={
                 "id": 101,
@@ -194,7 +172,7 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
             },
         )
         transport = _RecordingAsyncTransport(response)
-        client = ChatwootFastApiProxyClient(settings=_settings(), transport=transport)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
 
         result = await client.get_conversation_by_id(
             account_id=7,
@@ -211,7 +189,7 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["payload"]["meta"]["sender"]["email"], "se...om")
 
     async def test_proxy_client_conversation_messages_masks_sensitive_fields(self) -> None:
-        response = _FakeResponse(
+        response = FakeResponse(
             status_code=200,
             payload={
                 "payload": [
@@ -225,7 +203,7 @@ class RequestsArchitectureTest(unittest.IsolatedAsyncioTestCase):
             },
         )
         transport = _RecordingAsyncTransport(response)
-        client = ChatwootFastApiProxyClient(settings=_settings(), transport=transport)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
 
         result = await client.get_conversation_messages(
             account_id=7,
@@ -0,0 +1,212 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.requests.response_cache import ResponseCache
+from src.infrastructure.settings.env_settings import (
+    DEFAULT_CACHE_FRESH_TTL_SECONDS,
+    load_proxy_tuning_settings,
+)
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingAsyncTransport:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, object] | None,
+        timeout: float,
+        verify: bool | str,
+    ) -> FakeResponse:
+        _ = (url, headers, params, timeout, verify)
+        self.calls += 1
+        return FakeResponse(
+            200,
+            {"id": 101, "version": self.calls, "meta": {"sender": {"email": "a@example.com"}}},
+        )
+
+
+class _ContactsPagesTransport:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.pages: list[int] = []
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, object] | None,
+        timeout: float,
+        verify: bool | str,
+    ) -> FakeResponse:
+        _ = (url, headers, timeout, verify)
+        page = int((params or {})["page"])
+        self.pages.append(page)
+        first_id = (page - 1) * 15 + 1
+        contacts = [{"id": i} for i in range(first_id, min(first_id + 15, self.total + 1))]
+        return FakeResponse(200, {"meta": {"count": self.total}, "payload": contacts})
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_fresh_entries_are_served_from_memory(self) -> None:
+        clock = _FakeClock()
+        cache = ResponseCache({"contacts": 10.0}, stale_ttl_seconds=5.0, clock=clock)
+        loads = 0
+
+        async def load() -> int:
+            nonlocal loads
+            loads += 1
+            return loads
+
+        self.assertEqual(await cache.get_or_load("contacts", ("p", 1), load), 1)
+        clock.now = 9.0
+        self.assertEqual(await cache.get_or_load("contacts", ("p", 1), load), 1)
+
+        self.assertEqual(loads, 1)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 1)
+
+    async def test_stale_entries_are_served_while_one_refresh_runs(self) -> None:
+        clock = _FakeClock()
+        cache = ResponseCache({"contacts": 10.0}, stale_ttl_seconds=5.0, clock=clock)
+        loads = 0
+
+        async def load() -> int:
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0)
+            return loads
+
+        await cache.get_or_load("contacts", "k", load)
+        clock.now = 12.0
+
+        stale = await asyncio.gather(*(cache.get_or_load("contacts", "k", load) for _ in range(3)))
+        self.assertEqual(stale, [1, 1, 1])
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(loads, 2)
+        self.assertEqual(await cache.get_or_load("contacts", "k", load), 2)
+        self.assertEqual(cache.stats().stale_hits, 3)
+        self.assertEqual(cache.stats().refreshes, 1)
+
+    async def test_expired_entries_are_reloaded_synchronously(self) -> None:
+        clock = _FakeClock()
+        cache = ResponseCache({"contacts": 10.0}, stale_ttl_seconds=5.0, clock=clock)
+        loads = 0
+
+        async def load() -> int:
+            nonlocal loads
+            loads += 1
+            return loads
+
+        await cache.get_or_load("contacts", "k", load)
+        clock.now = 20.0
+
+        self.assertEqual(await cache.get_or_load("contacts", "k", load), 2)
+
+    async def test_failed_refresh_keeps_stale_entry(self) -> None:
+        clock = _FakeClock()
+        cache = ResponseCache({"contacts": 10.0}, stale_ttl_seconds=5.0, clock=clock)
+
+        async def load_ok() -> str:
+            return "ok"
+
+        async def load_fail() -> str:
+            raise RuntimeError("upstream down")
+
+        await cache.get_or_load("contacts", "k", load_ok)
+        clock.now = 11.0
+        self.assertEqual(await cache.get_or_load("contacts", "k", load_fail), "ok")
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(cache.stats().refresh_errors, 1)
+        self.assertEqual(await cache.get_or_load("contacts", "k", load_fail), "ok")
+        await cache.aclose()
+
+    async def test_resources_without_ttl_bypass_cache(self) -> None:
+        cache = ResponseCache({"contacts": 0.0}, stale_ttl_seconds=5.0)
+        loads = 0
+
+        async def load() -> int:
+            nonlocal loads
+            loads += 1
+            return loads
+
+        await cache.get_or_load("contacts", "k", load)
+        await cache.get_or_load("contacts", "k", load)
+
+        self.assertEqual(loads, 2)
+        self.assertEqual(cache.stats().entries, 0)
+
+    async def test_proxy_client_serves_sanitized_payload_from_cache(self) -> None:
+        transport = _CountingAsyncTransport()
+        cache = ResponseCache({"conversation": 30.0}, stale_ttl_seconds=30.0)
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=transport,
+            cache=cache,
+        )
+
+        first = await client.get_conversation_by_id(account_id=7, conversation_id=101)
+        second = await client.get_conversation_by_id(account_id=7, conversation_id=101)
+
+        self.assertEqual(transport.calls, 1)
+        self.assertIs(first, second)
+        self.assertEqual(second["payload"]["meta"]["sender"]["email"], "a@...om")
+
+    async def test_contacts_page_all_reuses_cached_pages(self) -> None:
+        transport = _ContactsPagesTransport(total=20)
+        cache = ResponseCache({"contacts": 30.0}, stale_ttl_seconds=30.0)
+        client = ChatwootFastApiProxyClient(
+            settings=proxy_settings(),
+            transport=transport,
+            cache=cache,
+        )
+
+        # What the startup warm-up does for PROXY_WARMUP_CONTACTS_PAGES=1.
+        await client.get_contacts(account_id=7, page="1")
+        result = await client.get_contacts(account_id=7, page="all")
+
+        self.assertEqual(transport.pages, [1, 2])
+        self.assertEqual(len(result["payload"]), 20)
+
+
+class CacheSettingsTest(unittest.TestCase):
+    def test_cache_is_off_unless_enabled(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            tuning = load_proxy_tuning_settings()
+
+        self.assertFalse(tuning.cache_enabled)
+        self.assertEqual(set(tuning.cache_fresh_ttl_seconds.values()), {0.0})
+
+    def test_enabling_applies_default_ttls_and_explicit_ttls_win(self) -> None:
+        env = {"PROXY_CACHE_ENABLED": "true", "PROXY_CACHE_TTL_MESSAGES": "3"}
+        with patch.dict(os.environ, env, clear=True):
+            tuning = load_proxy_tuning_settings()
+
+        self.assertEqual(
+            tuning.cache_fresh_ttl_seconds,
+            {**DEFAULT_CACHE_FRESH_TTL_SECONDS, "messages": 3.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
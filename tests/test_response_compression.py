@@ -0,0 +1,159 @@
+import asyncio
+import gzip
+import json
+import unittest
+import zlib
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app.compression import CompressionMiddleware, ResponseCompressor
+from src.infrastructure.fastapi_app.responses import FastJSONResponse
+
+_BIG = {"payload": [{"id": index, "name": f"Cliente {index}"} for index in range(200)]}
+
+
+def _build_app(compressor: ResponseCompressor) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, compressor_provider=lambda: compressor)
+
+    @app.get("/big")
+    def big() -> Response:
+        return FastJSONResponse(_BIG, headers={"ETag": '"abc"'})
+
+    @app.get("/varied")
+    def varied() -> Response:
+        return FastJSONResponse(_BIG, headers={"Vary": "Origin"})
+
+    @app.get("/small")
+    def small() -> Response:
+        return FastJSONResponse({"ok": True})
+
+    @app.get("/stream")
+    def stream() -> Response:
+        async def lines():
+            for index in range(3):
+                yield json.dumps({"id": index}).encode() + b"\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.get("/binary")
+    def binary() -> Response:
+        return Response(b"\x00" * 4096, media_type="application/octet-stream")
+
+    return app
+
+
+class NegotiationTest(unittest.TestCase):
+    def test_picks_gzip_when_only_gzip_is_available_or_accepted(self) -> None:
+        compressor = ResponseCompressor()
+
+        self.assertEqual(compressor.negotiate("gzip, deflate"), "gzip")
+        self.assertEqual(compressor.negotiate("*"), compressor.encodings[0])
+
+    def test_respects_zero_quality_and_missing_header(self) -> None:
+        compressor = ResponseCompressor()
+
+        self.assertIsNone(compressor.negotiate("gzip;q=0, identity"))
+        self.assertIsNone(compressor.negotiate(None))
+        self.assertIsNone(ResponseCompressor(enabled=False).negotiate("gzip"))
+
+    def test_reads_q_by_name_among_other_parameters(self) -> None:
+        compressor = ResponseCompressor()
+
+        self.assertIsNone(compressor.negotiate("gzip;level=9;q=0"))
+        self.assertEqual(compressor.negotiate("gzip ; foo=bar ; Q=0.4"), "gzip")
+
+    def test_ignores_members_with_a_malformed_q_value(self) -> None:
+        compressor = ResponseCompressor()
+
+        self.assertIsNone(compressor.negotiate("gzip;q=high"))
+        self.assertIsNone(compressor.negotiate("gzip;q=2"))
+        self.assertEqual(compressor.negotiate("gzip;q=nope, *;q=0.5"), "gzip")
+
+
+class CompressionMiddlewareTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.compressor = ResponseCompressor(min_size_bytes=512)
+        self.client = TestClient(_build_app(self.compressor))
+
+    def test_large_json_is_gzipped_and_recorded_per_route(self) -> None:
+        response = self.client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.headers["etag"], 'W/"abc"')
+        self.assertEqual(response.json(), _BIG)
+        stats = self.compressor.stats()[("/big", "gzip")]
+        self.assertEqual(stats.responses, 1)
+        self.assertEqual(stats.bytes_out, int(response.headers["content-length"]))
+        self.assertLess(stats.bytes_out, stats.bytes_in)
+
+    def test_small_body_is_sent_uncompressed(self) -> None:
+        response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertNotIn("vary", response.headers)
+        self.assertEqual(response.json(), {"ok": True})
+
+    def test_merges_accept_encoding_into_the_app_vary_header(self) -> None:
+        response = self.client.get("/varied", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers.get_list("vary"), ["Origin, Accept-Encoding"])
+
+    def test_without_accept_encoding_nothing_changes(self) -> None:
+        response = self.client.get("/big", headers={"Accept-Encoding": "identity"})
+
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.headers["etag"], '"abc"')
+
+    def test_streaming_ndjson_is_compressed_incrementally(self) -> None:
+        with self.client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", response.headers)
+        lines = gzip.decompress(raw).splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines], [0, 1, 2])
+
+    def test_each_streamed_chunk_is_decodable_on_its_own(self) -> None:
+        async def app(_scope, _receive, send) -> None:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")],
+                }
+            )
+            for index in range(2):
+                await send(
+                    {"type": "http.response.body", "body": b"line %d\n" % index, "more_body": True}
+                )
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        sent: list[dict] = []
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        middleware = CompressionMiddleware(app, compressor_provider=lambda: self.compressor)
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        asyncio.run(middleware(scope, None, send))
+
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        bodies = [message["body"] for message in sent[1:]]
+        self.assertEqual(decoder.decompress(bodies[0]), b"line 0\n")
+        self.assertEqual(decoder.decompress(bodies[1]), b"line 1\n")
+        self.assertEqual(self.compressor.stats()[("unmatched", "gzip")].bytes_in, 14)
+
+    def test_non_text_media_types_are_left_alone(self) -> None:
+        response = self.client.get("/binary", headers={"Accept-Encoding": "gzip"})
+
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(len(response.content), 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()
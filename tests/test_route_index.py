@@ -0,0 +1,91 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app import app as app_module
+from src.infrastructure.fastapi_app.route_index import build_route_index, etag_matches
+
+
+class _Route:
+    def __init__(self, path: str, methods: set[str]) -> None:
+        self.path = path
+        self.methods = methods
+
+
+class RouteIndexTest(unittest.TestCase):
+    def test_index_is_sorted_and_hides_head_and_options(self) -> None:
+        index = build_route_index(
+            [_Route("/b", {"GET", "HEAD"}), _Route("/a", {"POST", "OPTIONS"})]
+        )
+
+        self.assertEqual(
+            index.json_body,
+            b'{"count":2,"endpoints":[{"path":"/a","methods":["POST"]},'
+            b'{"path":"/b","methods":["GET"]}]}',
+        )
+        self.assertIn(b"<a href='/a'>", index.html_body)
+
+    def test_etag_changes_with_content(self) -> None:
+        first = build_route_index([_Route("/a", {"GET"})])
+        second = build_route_index([_Route("/b", {"GET"})])
+
+        self.assertNotEqual(first.json_etag, second.json_etag)
+        self.assertNotEqual(first.json_etag, first.html_etag)
+
+    def test_etag_matching_accepts_lists_weak_tags_and_wildcard(self) -> None:
+        self.assertTrue(etag_matches('"x", "abc"', '"abc"'))
+        self.assertTrue(etag_matches('W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches("*", '"abc"'))
+        self.assertFalse(etag_matches('"other"', '"abc"'))
+        self.assertFalse(etag_matches(None, '"abc"'))
+
+
+class RootEndpointTest(unittest.TestCase):
+    def test_root_serves_cached_json_with_etag_and_honours_if_none_match(self) -> None:
+        with TestClient(app_module.app) as client:
+            response = client.get("/?format=json")
+            revalidated = client.get(
+                "/?format=json",
+                headers={"If-None-Match": response.headers["etag"]},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("/health", [item["path"] for item in response.json()["endpoints"]])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+
+    def test_root_html_has_its_own_etag(self) -> None:
+        with TestClient(app_module.app) as client:
+            html = client.get("/")
+            as_json = client.get("/?format=json")
+
+        self.assertTrue(html.headers["content-type"].startswith("text/html"))
+        self.assertNotEqual(html.headers["etag"], as_json.headers["etag"])
+
+
+class ControllerWiringTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_proxy_client = app_module._proxy_client
+        self._original_controllers = app_module._controllers
+
+    def tearDown(self) -> None:
+        app_module._proxy_client = self._original_proxy_client
+        app_module._controllers = self._original_controllers
+
+    def test_controllers_are_reused_until_the_gateway_changes(self) -> None:
+        first_client, second_client = object(), object()
+
+        app_module._proxy_client = first_client
+        first = app_module._get_controllers()
+        again = app_module._get_controllers()
+        app_module._proxy_client = second_client
+        rebuilt = app_module._get_controllers()
+
+        self.assertIs(first, again)
+        self.assertIs(first.client, first_client)
+        self.assertIsNot(rebuilt, first)
+        self.assertIs(rebuilt.contacts._client, second_client)
+
+
+if __name__ == "__main__":
+    unittest.main()
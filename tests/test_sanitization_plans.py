@@ -0,0 +1,91 @@
+import copy
+import random
+import unittest
+
+from scripts.bench_support import build_message_page
+from src.infrastructure.requests.sanitization_plans import (
+    CONVERSATION_PLAN,
+    CONVERSATION_SHAPE,
+    INBOX_PLAN,
+    INBOX_SHAPE,
+    MESSAGE_PLAN,
+    MESSAGE_SHAPE,
+)
+from src.infrastructure.requests.sensitive_data_sanitizer import (
+    sanitize_conversation_payload,
+    sanitize_payload,
+)
+
+_EXTRA_KEYS = ["custom_attributes", "additional_attributes", "api_key", "webhook_secret", "nuevo"]
+_STRINGS = ["", "abc", "ana@example.com", "+5491166667777", "pedido 123456789012", "hola mundo"]
+
+
+def _random_scalar(rng: random.Random) -> object:
+    return rng.choice(_STRINGS + [None, 0, 17, 1710000000, True, 2.5])
+
+
+def _random_value(rng: random.Random, depth: int) -> object:
+    roll = rng.random()
+    if depth < 4 and roll < 0.15:
+        return {rng.choice(_EXTRA_KEYS + ["email", "id"]): _random_value(rng, depth + 1)}
+    if depth < 4 and roll < 0.25:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return _random_scalar(rng)
+
+
+def _random_shaped(rng: random.Random, shape, depth: int = 0) -> dict:
+    """Object following `shape`, with type surprises and unknown keys."""
+    result: dict = {}
+    for key, nested in shape.items():
+        if rng.random() < 0.2:
+            continue
+        if nested is None:
+            result[key] = _random_value(rng, depth + 1)
+        elif depth < 3 and rng.random() < 0.5:
+            result[key] = [_random_shaped(rng, nested, depth + 1) for _ in range(rng.randint(0, 2))]
+        elif depth < 3:
+            result[key] = _random_shaped(rng, nested, depth + 1)
+        else:
+            result[key] = _random_value(rng, depth + 1)
+    for key in rng.sample(_EXTRA_KEYS, k=2):
+        result[key] = _random_value(rng, depth + 1)
+    return result
+
+
+class SanitizationPlanDifferentialTest(unittest.TestCase):
+    def _assert_matches(self, plan, shape, generic, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(200):
+            payload = _random_shaped(rng, shape)
+
+            self.assertEqual(plan.apply_in_place(copy.deepcopy(payload)), generic(payload))
+
+    def test_message_plan_matches_generic_sanitizer(self) -> None:
+        self._assert_matches(MESSAGE_PLAN, MESSAGE_SHAPE, sanitize_conversation_payload, 1)
+
+    def test_conversation_plan_matches_generic_sanitizer(self) -> None:
+        self._assert_matches(
+            CONVERSATION_PLAN,
+            CONVERSATION_SHAPE,
+            sanitize_conversation_payload,
+            2,
+        )
+
+    def test_inbox_plan_matches_generic_sanitizer(self) -> None:
+        self._assert_matches(INBOX_PLAN, INBOX_SHAPE, sanitize_payload, 3)
+
+    def test_message_plan_matches_on_realistic_page(self) -> None:
+        messages = build_message_page(messages=10)["payload"]
+
+        self.assertEqual(
+            [MESSAGE_PLAN.apply_in_place(item) for item in copy.deepcopy(messages)],
+            sanitize_conversation_payload(messages),
+        )
+
+    def test_non_dict_payload_falls_back_to_generic_walker(self) -> None:
+        self.assertEqual(MESSAGE_PLAN.apply_in_place(["ana@example.com"]), ["ana@example.com"])
+        self.assertEqual(MESSAGE_PLAN.apply_in_place("abcd1234"), "abcd1234")
+
+
+if __name__ == "__main__":
+    unittest.main()
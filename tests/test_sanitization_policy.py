@@ -0,0 +1,178 @@
+import copy
+import random
+import sys
+import unittest
+
+from scripts.bench_support import (
+    build_deep_payload,
+    build_message_page,
+    legacy_sanitize_conversation_payload,
+    recursive_sanitize,
+    recursive_sanitize_shared,
+)
+from src.infrastructure.requests.sensitive_data_sanitizer import (
+    CONVERSATION_POLICY,
+    CONVERSATION_SENSITIVE_KEYS,
+    SENSITIVE_KEY_PARTS,
+    SENSITIVE_KEYS,
+    SUBTREE_OMITTED,
+    SanitizationPolicy,
+    sanitize_conversation_payload,
+    sanitize_conversation_payload_in_place,
+    sanitize_conversation_payload_shared,
+    sanitize_payload,
+)
+
+
+class SanitizationPolicyTest(unittest.TestCase):
+    def test_compiled_policy_matches_legacy_on_message_page(self) -> None:
+        page = build_message_page(messages=12)
+        page["payload"][0]["content"] = "widget websiteToken: 'abcdefghijklmnop' cargado"
+
+        self.assertEqual(
+            sanitize_conversation_payload(page),
+            legacy_sanitize_conversation_payload(page),
+        )
+
+    def test_key_classification_is_memoized_per_policy(self) -> None:
+        policy = SanitizationPolicy(
+            SENSITIVE_KEYS | CONVERSATION_SENSITIVE_KEYS,
+            SENSITIVE_KEY_PARTS,
+        )
+
+        policy.sanitize(build_message_page(messages=5))
+        first = policy.is_sensitive_key.cache_info()
+        policy.sanitize(build_message_page(messages=5))
+        second = policy.is_sensitive_key.cache_info()
+
+        self.assertEqual(second.misses, first.misses)
+        self.assertGreater(second.hits, first.hits)
+
+    def test_long_digit_runs_and_website_tokens_are_truncated(self) -> None:
+        sanitized = sanitize_payload(
+            {
+                "content": "pedido 1234567890123 listo",
+                "script": "init({websiteToken: \"abcdefghijklmnop\"})",
+                "short": "1234567",
+                "count": 123456789012,
+            }
+        )
+
+        self.assertEqual(sanitized["content"], "pedido 1234...0123 listo")
+        self.assertEqual(sanitized["script"], "init({websiteToken: \"abcd...mnop\"})")
+        self.assertEqual(sanitized["short"], "1234567")
+        self.assertEqual(sanitized["count"], 123456789012)
+
+    def test_sanitize_returns_a_copy(self) -> None:
+        payload = {"api_key": "abcd1234", "items": [{"email": "a@example.com"}]}
+
+        sanitized = sanitize_conversation_payload(payload)
+
+        self.assertEqual(payload["api_key"], "abcd1234")
+        self.assertEqual(payload["items"][0]["email"], "a@example.com")
+        self.assertEqual(sanitized["items"][0]["email"], "a@...om")
+
+    def test_copy_on_write_reuses_untouched_subtrees(self) -> None:
+        page = build_message_page(messages=3)
+        original = copy.deepcopy(page)
+
+        shared = sanitize_conversation_payload_shared(page)
+
+        self.assertEqual(shared, sanitize_conversation_payload(page))
+        self.assertEqual(page, original)
+        self.assertIs(shared["meta"], page["meta"])
+        self.assertIs(shared["payload"][0]["attachments"], page["payload"][0]["attachments"])
+        self.assertIsNot(shared["payload"][0]["sender"], page["payload"][0]["sender"])
+
+    def test_copy_on_write_returns_input_when_nothing_changes(self) -> None:
+        payload = {"id": 1, "labels": ["ventas"], "meta": {"count": 2}}
+
+        self.assertIs(sanitize_conversation_payload_shared(payload), payload)
+
+    def test_in_place_rewrites_owned_payload(self) -> None:
+        page = build_message_page(messages=3)
+        expected = sanitize_conversation_payload(page)
+        sender = page["payload"][0]["sender"]
+
+        result = sanitize_conversation_payload_in_place(page)
+
+        self.assertIs(result, page)
+        self.assertIs(result["payload"][0]["sender"], sender)
+        self.assertEqual(result, expected)
+
+
+def _random_payload(rng: random.Random, depth: int = 0) -> object:
+    keys = ["id", "email", "content", "api_key", "custom_attributes", "labels", "source_id"]
+    roll = rng.random()
+    if depth < 6 and roll < 0.25:
+        return {
+            f"{rng.choice(keys)}{index}": _random_payload(rng, depth + 1)
+            for index in range(rng.randint(0, 4))
+        }
+    if depth < 6 and roll < 0.4:
+        return [_random_payload(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    if roll < 0.8:
+        return rng.choice(
+            ["", "abc", "hola", "pedido 123456789012", "websiteToken: 'abcdefghijklm'"]
+        )
+    return rng.choice([None, True, 42, 3.5])
+
+
+class IterativeSanitizerTest(unittest.TestCase):
+    def test_iterative_walk_matches_recursive_reference(self) -> None:
+        rng = random.Random(1234)
+        for _ in range(300):
+            payload = {"root": _random_payload(rng), "email": "someone@example.com"}
+            snapshot = copy.deepcopy(payload)
+
+            self.assertEqual(
+                CONVERSATION_POLICY.sanitize(payload),
+                recursive_sanitize(CONVERSATION_POLICY, payload),
+            )
+            self.assertEqual(
+                CONVERSATION_POLICY.sanitize_shared(payload),
+                recursive_sanitize_shared(CONVERSATION_POLICY, payload),
+            )
+            self.assertEqual(payload, snapshot)
+            self.assertEqual(
+                CONVERSATION_POLICY.sanitize_in_place(copy.deepcopy(payload)),
+                recursive_sanitize(CONVERSATION_POLICY, payload),
+            )
+
+    def test_list_items_inherit_the_list_key(self) -> None:
+        sanitized = sanitize_conversation_payload({"email": ["ana@example.com", "x"]})
+
+        self.assertEqual(sanitized, {"email": ["an...om", "*"]})
+
+    def test_nesting_beyond_recursion_limit_is_reported_not_raised(self) -> None:
+        policy = SanitizationPolicy(SENSITIVE_KEYS, SENSITIVE_KEY_PARTS, max_depth=32)
+        deep = build_deep_payload(depth=sys.getrecursionlimit() + 50)
+
+        with self.assertLogs(
+            "src.infrastructure.requests.sensitive_data_sanitizer", level="WARNING"
+        ) as logs:
+            sanitized = policy.sanitize(deep)
+
+        node = sanitized
+        for _ in range(31):
+            node = node["additional_attributes"]
+        self.assertEqual(node["additional_attributes"], SUBTREE_OMITTED)
+        self.assertEqual(policy.guard_trips, 1)
+        self.assertIn("reason=max_depth", logs.output[0])
+
+    def test_node_budget_omits_remaining_containers(self) -> None:
+        policy = SanitizationPolicy(SENSITIVE_KEYS, SENSITIVE_KEY_PARTS, max_nodes=10)
+        payload = {"items": [{"id": index, "api_key": "abcd1234"} for index in range(10)]}
+
+        with self.assertLogs(
+            "src.infrastructure.requests.sensitive_data_sanitizer", level="WARNING"
+        ):
+            sanitized = policy.sanitize(payload)
+
+        self.assertEqual(sanitized["items"][0], {"id": 0, "api_key": "ab...34"})
+        self.assertEqual(sanitized["items"][-1], SUBTREE_OMITTED)
+        self.assertEqual(payload["items"][-1]["api_key"], "abcd1234")
+
+
+if __name__ == "__main__":
+    unittest.main()
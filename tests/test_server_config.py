@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.fastapi_app import server_config
+from src.infrastructure.fastapi_app.server_config import build_server_config
+
+
+class ServerConfigTest(unittest.TestCase):
+    def test_development_keeps_uvicorn_defaults(self) -> None:
+        config = build_server_config(host="127.0.0.1", port=8001, reload_enabled=True)
+
+        kwargs = config.uvicorn_kwargs()
+        self.assertFalse(config.production)
+        self.assertEqual((kwargs["loop"], kwargs["http"]), ("auto", "auto"))
+        self.assertTrue(kwargs["reload"])
+        self.assertIsNone(kwargs["workers"])
+        self.assertIsNone(kwargs["limit_concurrency"])
+        self.assertTrue(kwargs["access_log"])
+
+    def test_production_uses_every_core_and_the_fastest_components(self) -> None:
+        installed = {"uvloop", "httptools"}
+        with patch.object(
+            server_config, "find_spec", side_effect=lambda name: name if name in installed else None
+        ), patch.object(server_config, "default_worker_count", return_value=8):
+            config = build_server_config(host="0.0.0.0", port=8001, production=True)
+
+        self.assertEqual(config.workers, 8)
+        self.assertEqual((config.loop, config.http), ("uvloop", "httptools"))
+        self.assertEqual(config.timeout_keep_alive, server_config.PRODUCTION_KEEP_ALIVE_SECONDS)
+        self.assertEqual(config.limit_concurrency, server_config.PRODUCTION_LIMIT_CONCURRENCY)
+        self.assertFalse(config.access_log)
+
+    def test_production_falls_back_to_stdlib_components(self) -> None:
+        with patch.object(server_config, "find_spec", return_value=None):
+            config = build_server_config(
+                host="0.0.0.0", port=8001, production=True, workers=2, timeout_keep_alive=30
+            )
+
+        self.assertEqual((config.loop, config.http), ("asyncio", "h11"))
+        self.assertEqual(config.uvicorn_kwargs()["workers"], 2)
+        self.assertEqual(config.timeout_keep_alive, 30)
+
+    def test_reload_is_rejected_in_production(self) -> None:
+        with self.assertRaises(ValueError):
+            build_server_config(host="0.0.0.0", port=8001, reload_enabled=True, production=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.fastapi_app import app as app_module
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    ChatwootFastApiProxyClient,
+)
+from src.infrastructure.requests.request_timing import (
+    RequestTiming,
+    current_request_timing,
+    end_request_timing,
+    start_request_timing,
+    timed,
+)
+from tests.proxy_fakes import InboxesTransport, proxy_settings
+
+
+def _phases(header: str) -> list[str]:
+    return [entry.strip().split(";", 1)[0] for entry in header.split(",")]
+
+
+class RequestTimingTest(unittest.TestCase):
+    def test_timed_is_a_no_op_without_an_active_request(self) -> None:
+        with timed("upstream"):
+            pass
+
+        self.assertIsNone(current_request_timing())
+
+    def test_phases_accumulate_and_report_call_counts(self) -> None:
+        timing, token = start_request_timing()
+        try:
+            with timed("upstream"):
+                pass
+            with timed("upstream"):
+                pass
+            with timed("decode"):
+                pass
+        finally:
+            end_request_timing(token)
+
+        self.assertIsNone(current_request_timing())
+        self.assertEqual(timing.phases()["upstream"][1], 2)
+        header = timing.server_timing()
+        self.assertEqual(_phases(header), ["upstream", "decode"])
+        self.assertIn('desc="2 calls"', header)
+
+    def test_header_value_uses_milliseconds(self) -> None:
+        timing = RequestTiming()
+        timing.add("serialize", 0.0123)
+
+        self.assertEqual(timing.server_timing(), "serialize;dur=12.3")
+
+
+class ServerTimingHeaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_settings = app_module._settings
+        self._original_proxy_client = app_module._proxy_client
+        self._original_sample_rate = app_module._server_timing_sample_rate
+
+    def tearDown(self) -> None:
+        app_module._settings = self._original_settings
+        app_module._proxy_client = self._original_proxy_client
+        app_module._server_timing_sample_rate = self._original_sample_rate
+
+    def _get_inboxes(self, sample_rate: float):
+        with TestClient(app_module.app) as client:
+            app_module._settings = proxy_settings()
+            app_module._proxy_client = ChatwootFastApiProxyClient(
+                settings=proxy_settings(),
+                transport=InboxesTransport(),
+            )
+            app_module._server_timing_sample_rate = sample_rate
+            return client.get(
+                "/api/v1/accounts/7/inboxes",
+                headers={"X-Proxy-Api-Key": "proxy-secret"},
+            )
+
+    def test_proxy_response_reports_each_phase(self) -> None:
+        response = self._get_inboxes(sample_rate=1.0)
+
+        self.assertEqual(response.status_code, 200)
+        phases = _phases(response.headers["server-timing"])
+        for phase in ("upstream", "decode", "sanitize", "serialize", "app"):
+            self.assertIn(phase, phases)
+        self.assertEqual(phases[-1], "app")
+
+    def test_header_is_omitted_when_sampling_is_disabled(self) -> None:
+        response = self._get_inboxes(sample_rate=0.0)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("server-timing", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from src.infrastructure.requests.response_cache import CacheEntry, ResponseCache
+from src.infrastructure.sqlite.shared_cache_backend import SqliteCacheBackend
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _wait_until(condition, timeout_seconds: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.001)
+
+
+class SqliteCacheBackendTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "cache", "shared.sqlite3")
+        self.clock = _FakeClock()
+        # Two backends on the same file behave like two uvicorn workers.
+        self.worker_a = SqliteCacheBackend(self.path, clock=self.clock)
+        self.worker_b = SqliteCacheBackend(self.path, clock=self.clock)
+
+    def tearDown(self) -> None:
+        self.worker_a.close()
+        self.worker_b.close()
+        self._tmp.cleanup()
+
+    def test_entries_written_by_one_worker_are_visible_to_another(self) -> None:
+        self.worker_a.set(
+            "contacts:1",
+            CacheEntry(value={"payload": [{"id": 1, "name": "Ñandú"}]}, stored_at=1000.0),
+            ttl_seconds=60.0,
+        )
+
+        entry = self.worker_b.get("contacts:1")
+
+        assert entry is not None
+        self.assertEqual(entry.value, {"payload": [{"id": 1, "name": "Ñandú"}]})
+        self.assertEqual(entry.stored_at, 1000.0)
+        self.assertEqual(self.worker_b.size(), 1)
+
+    def test_expired_entries_are_not_returned(self) -> None:
+        self.worker_a.set("k", CacheEntry(value=1, stored_at=1000.0), ttl_seconds=10.0)
+        self.clock.now = 1011.0
+
+        self.assertIsNone(self.worker_b.get("k"))
+        self.assertEqual(self.worker_a.size(), 0)
+
+    def test_refresh_lock_is_exclusive_across_workers_until_lease_expires(self) -> None:
+        self.assertTrue(self.worker_a.try_acquire_refresh("k", lease_seconds=30.0))
+        self.assertFalse(self.worker_b.try_acquire_refresh("k", lease_seconds=30.0))
+
+        self.clock.now += 31.0
+        self.assertTrue(self.worker_b.try_acquire_refresh("k", lease_seconds=30.0))
+
+        # Releasing from a non-owner must not drop the current lease.
+        self.worker_a.release_refresh("k")
+        self.assertFalse(self.worker_a.try_acquire_refresh("k", lease_seconds=30.0))
+        self.worker_b.release_refresh("k")
+        self.assertTrue(self.worker_a.try_acquire_refresh("k", lease_seconds=30.0))
+
+    async def test_stale_refresh_runs_in_only_one_worker(self) -> None:
+        cache_a = ResponseCache({"contacts": 10.0}, 60.0, backend=self.worker_a, clock=self.clock)
+        cache_b = ResponseCache({"contacts": 10.0}, 60.0, backend=self.worker_b, clock=self.clock)
+        loads: list[str] = []
+        release = asyncio.Event()
+
+        async def initial() -> str:
+            return "v1"
+
+        async def slow_refresh() -> str:
+            loads.append("refresh")
+            await release.wait()
+            return "v2"
+
+        self.assertEqual(await cache_a.get_or_load("contacts", 1, initial), "v1")
+        self.assertEqual(await cache_b.get_or_load("contacts", 1, initial), "v1")
+
+        self.clock.now += 20.0
+        self.assertEqual(await cache_a.get_or_load("contacts", 1, slow_refresh), "v1")
+        # Backend calls run in a thread: wait for worker A to hold the lease.
+        await _wait_until(lambda: loads == ["refresh"])
+        self.assertEqual(await cache_b.get_or_load("contacts", 1, slow_refresh), "v1")
+        await _wait_until(lambda: cache_b.stats().refreshes_skipped == 1)
+        release.set()
+        await _wait_until(lambda: cache_a.stats().refreshes == 1 and not cache_a._refreshing)
+
+        self.assertEqual(loads, ["refresh"])
+        self.assertEqual(cache_b.stats().refreshes_skipped, 1)
+        self.assertEqual(await cache_b.get_or_load("contacts", 1, initial), "v2")
+
+    async def test_sqlite_calls_run_off_the_event_loop_thread(self) -> None:
+        threads: list[int] = []
+        backend_get = self.worker_a.get
+        backend_set = self.worker_a.set
+
+        def recording_get(key: str) -> CacheEntry | None:
+            threads.append(threading.get_ident())
+            return backend_get(key)
+
+        def recording_set(key: str, entry: CacheEntry, ttl_seconds: float) -> None:
+            threads.append(threading.get_ident())
+            backend_set(key, entry, ttl_seconds)
+
+        self.worker_a.get = recording_get  # type: ignore[method-assign]
+        self.worker_a.set = recording_set  # type: ignore[method-assign]
+        cache = ResponseCache({"contacts": 10.0}, 60.0, backend=self.worker_a, clock=self.clock)
+
+        async def load() -> dict[str, int]:
+            return {"id": 1}
+
+        self.assertEqual(await cache.get_or_load("contacts", 1, load), {"id": 1})
+        self.assertEqual(await cache.get_or_load("contacts", 1, load), {"id": 1})
+
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.get_ident(), threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import asyncio
+import unittest
+
+from src.infrastructure.requests.chatwoot_fastapi_proxy_client import (
+    PAGE_SIZE,
+    ChatwootFastApiProxyClient,
+    ChatwootProxyError,
+)
+from src.infrastructure.requests.single_flight import SingleFlight
+from tests.proxy_fakes import FakeResponse, proxy_settings
+
+
+class _SlowAsyncTransport:
+    def __init__(self, response: FakeResponse, delay_seconds: float = 0.01) -> None:
+        self._response = response
+        self._delay_seconds = delay_seconds
+        self.calls: list[dict[str, object]] = []
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, object] | None,
+        timeout: float,
+        verify: bool | str,
+    ) -> FakeResponse:
+        _ = (headers, timeout, verify)
+        self.calls.append({"url": url, "params": params})
+        await asyncio.sleep(self._delay_seconds)
+        return self._response
+
+
+class _HangingPagesTransport:
+    """Page 1 answers at once; later pages hang until they are cancelled."""
+
+    def __init__(self, total_count: int) -> None:
+        self._total_count = total_count
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def get(self, url, *, headers, params, timeout, verify) -> FakeResponse:
+        _ = (url, headers, timeout, verify)
+        page = params["page"]
+        if page > 1:
+            self.started.append(page)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(page)
+                raise
+        payload = [{"id": page * 100 + index} for index in range(PAGE_SIZE)]
+        return FakeResponse(200, {"payload": payload, "meta": {"count": self._total_count}})
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_identical_calls_share_one_load(self) -> None:
+        flight = SingleFlight()
+        loads = 0
+
+        async def load() -> int:
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.run("key", load) for _ in range(5)))
+
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(loads, 1)
+        stats = flight.stats()
+        self.assertEqual(stats.calls, 5)
+        self.assertEqual(stats.shared, 4)
+        self.assertEqual(stats.in_flight, 0)
+        self.assertAlmostEqual(stats.dedup_ratio, 0.8)
+
+    async def test_cancelled_waiter_does_not_cancel_shared_load(self) -> None:
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.run("key", load))
+        second = asyncio.ensure_future(flight.run("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_last_waiter_leaving_cancels_the_shared_load(self) -> None:
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def load() -> str:
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "never"
+
+        waiters = [asyncio.ensure_future(flight.run("key", load)) for _ in range(2)]
+        await started.wait()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        self.assertEqual(flight.stats().in_flight, 0)
+
+    async def test_errors_are_propagated_to_every_waiter(self) -> None:
+        flight = SingleFlight()
+
+        async def load() -> None:
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.run("key", load),
+            flight.run("key", load),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(item, ValueError) for item in results))
+        self.assertEqual(flight.stats().in_flight, 0)
+
+    async def test_proxy_client_coalesces_identical_upstream_requests(self) -> None:
+        transport = _SlowAsyncTransport(
+            FakeResponse(
+                200,
+                {
+                    "payload": [{"id": 1, "sender": {"email": "pii@example.com"}}],
+                    "meta": {"count": 1},
+                },
+            )
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        results = await asyncio.gather(
+            *(
+                client.get_conversation_messages(
+                    account_id=7,
+                    conversation_id=101,
+                    page="1",
+                )
+                for _ in range(3)
+            )
+        )
+
+        self.assertEqual(len(transport.calls), 1)
+        for result in results:
+            self.assertEqual(result["payload"][0]["sender"]["email"], "pi...om")
+        self.assertAlmostEqual(client.single_flight_stats().dedup_ratio, 2 / 3)
+
+    async def test_proxy_client_does_not_coalesce_different_params(self) -> None:
+        transport = _SlowAsyncTransport(
+            FakeResponse(200, {"payload": [], "meta": {"count": 0}})
+        )
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        await asyncio.gather(
+            client.get_contacts(account_id=7, page="1"),
+            client.get_contacts(account_id=7, page="2"),
+        )
+
+        self.assertEqual(len(transport.calls), 2)
+
+    async def test_proxy_client_shares_upstream_errors(self) -> None:
+        transport = _SlowAsyncTransport(FakeResponse(500, {}))
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        results = await asyncio.gather(
+            client.get_conversation_by_id(account_id=7, conversation_id=1),
+            client.get_conversation_by_id(account_id=7, conversation_id=1),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(len(transport.calls), 1)
+        for item in results:
+            self.assertIsInstance(item, ChatwootProxyError)
+            self.assertEqual(item.status_code, 500)
+
+    async def test_stream_disconnect_cancels_upstream_page_fetches(self) -> None:
+        transport = _HangingPagesTransport(total_count=PAGE_SIZE * 6)
+        client = ChatwootFastApiProxyClient(settings=proxy_settings(), transport=transport)
+
+        stream = client.stream_contacts_all(account_id=7)
+        self.assertEqual(len(await anext(stream)), PAGE_SIZE)
+        waiting = asyncio.ensure_future(anext(stream))
+        while not transport.started:
+            await asyncio.sleep(0)
+        # The client disconnects while later pages are being fetched.
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        self.assertTrue(transport.started)
+        self.assertEqual(sorted(transport.cancelled), sorted(transport.started))
+        self.assertEqual(client.single_flight_stats().in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()